@@ -8,12 +8,47 @@ advanced multi-state hazard modeling and real-time risk assessment.
 Author: Korean Airlines Credit Rating Analysis Team
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Korean Airlines Credit Rating Analysis Team"
 
-# Core modules
-from .core import *
-from .data import *
-from .models import *
-from .dashboard import *
-from .utils import *
\ No newline at end of file
+# Public names -> defining subpackage, imported on first access (PEP 562)
+# so that e.g. the preprocessor alone does not pull in lifelines/dart-fss/streamlit
+_LAZY_IMPORTS = {
+    # Core modules
+    'CreditRatingPreprocessor': 'core',
+    'PreprocessingConfig': 'core',
+    
+    # Data modules
+    'DataPipeline': 'data',
+    'FinancialRatioCalculator': 'data',
+    'FinancialDataETL': 'data',
+    'DARTDataCache': 'data',
+    
+    # Models
+    'EnhancedMultiStateModel': 'models',
+    'RatingRiskScorer': 'models',
+    'FirmProfile': 'models',
+    'CreditRatingBacktester': 'models',
+}
+
+_SUBPACKAGES = ('core', 'data', 'models', 'dashboard', 'utils')
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value  # 다음 접근부터는 일반 속성으로 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
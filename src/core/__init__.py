@@ -5,6 +5,25 @@ Core preprocessing modules
 Contains the main credit rating preprocessing functionality.
 """
 
-from .credit_rating_preprocessor import CreditRatingPreprocessor, PreprocessingConfig
+import importlib
 
-__all__ = ['CreditRatingPreprocessor', 'PreprocessingConfig']
\ No newline at end of file
+# Imported on first access (PEP 562): the preprocessor module pulls in numba
+_LAZY_IMPORTS = {
+    'CreditRatingPreprocessor': 'credit_rating_preprocessor',
+    'PreprocessingConfig': 'credit_rating_preprocessor',
+}
+
+__all__ = ['CreditRatingPreprocessor', 'PreprocessingConfig']
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
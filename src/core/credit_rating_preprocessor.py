@@ -21,6 +21,19 @@ import os
 import sys
 from dataclasses import dataclass
 
+# Optional JIT compilation for the consecutive-NR run-length scan
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Pure-Python fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Add config path
 config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config')
 sys.path.insert(0, config_path)
@@ -29,6 +42,26 @@ sys.path.insert(0, config_path)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _consec_nr(company_ids: np.ndarray, is_nr: np.ndarray) -> np.ndarray:
+    """Run-length of consecutive NR observations, reset at each company boundary
+    
+    Rows must be grouped by company (and ordered by date within a company).
+    """
+    out = np.empty(len(is_nr), np.int64)
+    count = 0
+    prev = -1
+    for i in range(len(is_nr)):
+        if company_ids[i] != prev:
+            count = 0
+        if is_nr[i]:
+            count += 1
+        else:
+            count = 0
+        out[i] = count
+        prev = company_ids[i]
+    return out
+
 @dataclass
 class PreprocessingConfig:
     """Configuration for credit rating preprocessing"""
@@ -132,39 +165,22 @@ class CreditRatingPreprocessor:
         # Create date sequence for each company
         df_processed['date'] = pd.to_datetime(df_processed['date'])
         
-        # Calculate consecutive NR days
-        df_processed['consecutive_nr_days'] = 0
+        # Calculate consecutive NR days with a single compiled scan.
+        # A stable sort on company codes keeps each company's rows in their original order.
+        company_codes, _ = pd.factorize(df_processed['company'])
+        order = np.argsort(company_codes, kind='stable')
+        is_nr = df_processed['rating'].isna().to_numpy(dtype=np.uint8)
         
-        for company in df_processed['company'].unique():
-            company_mask = df_processed['company'] == company
-            company_data = df_processed[company_mask].copy()
-            
-            # Calculate consecutive NR days
-            nr_mask = company_data['rating'].isna()
-            consecutive_days = 0
-            
-            for idx in company_data.index:
-                if nr_mask.loc[idx]:
-                    consecutive_days += 1
-                else:
-                    consecutive_days = 0
-                
-                df_processed.loc[idx, 'consecutive_nr_days'] = consecutive_days
-            
-            # Only mark as Withdrawn if consecutive NR days >= threshold
-            withdrawn_mask = (
-                company_mask & 
-                (df_processed['consecutive_nr_days'] >= self.config.consecutive_nr_days) &
-                (df_processed['event'] == 'Withdrawn')
-            )
-            
-            # Reset event for those below threshold
-            below_threshold_mask = (
-                company_mask & 
-                (df_processed['consecutive_nr_days'] < self.config.consecutive_nr_days) &
-                (df_processed['event'] == 'Withdrawn')
-            )
-            df_processed.loc[below_threshold_mask, 'event'] = ''
+        consecutive_days = np.empty(len(df_processed), dtype=np.int64)
+        consecutive_days[order] = _consec_nr(company_codes[order], is_nr[order])
+        df_processed['consecutive_nr_days'] = consecutive_days
+        
+        # Reset Withdrawn events below the consecutive-day threshold
+        below_threshold_mask = (
+            (df_processed['consecutive_nr_days'] < self.config.consecutive_nr_days) &
+            (df_processed['event'] == 'Withdrawn')
+        )
+        df_processed.loc[below_threshold_mask, 'event'] = ''
         
         logger.info(f"Applied {self.config.consecutive_nr_days}-day consecutive NR rule")
         return df_processed
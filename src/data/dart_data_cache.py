@@ -14,11 +14,65 @@ import pickle
 import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
+import shutil
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401  (parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 재무제표 dict 캐시에서 parquet으로 분리 저장할 구성요소
+STATEMENT_KEYS = ('bs_data', 'is_data', 'cf_data')
+
+def _json_roundtrips(value: Any) -> bool:
+    """JSON으로 저장했다 읽어도 같은 값(타입 포함)이 나오는지"""
+    try:
+        decoded = json.loads(json.dumps(value, ensure_ascii=False))
+    except (TypeError, ValueError):
+        return False
+    if isinstance(value, float) and value != value:  # NaN
+        return isinstance(decoded, float) and decoded != decoded
+    return type(decoded) is type(value) and decoded == value
+
+def _statement_frame(statement: Dict) -> Optional[pd.DataFrame]:
+    """
+    재무제표 dict -> parquet용 label/value 프레임 (읽으면 원래 dict와 같은 값)
+    
+    키가 모두 str이고 값이 모두 정수이거나 모두 실수이면 숫자 컬럼으로,
+    그 외(혼합 타입, 비문자열 키)는 키/값을 JSON 문자열 컬럼으로 저장.
+    JSON으로도 복원되지 않는 값이 있으면 None (호출자가 pickle로 저장)
+    """
+    labels, values = list(statement.keys()), list(statement.values())
+    if all(type(label) is str for label in labels) and values:
+        if all(isinstance(v, (float, np.floating)) for v in values):
+            return pd.DataFrame({'label': labels, 'value': np.array(values, dtype=np.float64)})
+        if all(isinstance(v, (int, np.integer)) and not isinstance(v, (bool, np.bool_)) for v in values):
+            try:
+                return pd.DataFrame({'label': labels, 'value': np.array(values, dtype=np.int64)})
+            except OverflowError:
+                pass
+    
+    if not all(_json_roundtrips(item) for item in labels + values):
+        return None
+    return pd.DataFrame({
+        'label_json': [json.dumps(label, ensure_ascii=False) for label in labels],
+        'value_json': [json.dumps(value, ensure_ascii=False) for value in values]
+    })
+
+def _read_statement_frame(frame: pd.DataFrame) -> Dict:
+    """_statement_frame으로 저장한 프레임 -> 재무제표 dict"""
+    if 'value_json' in frame.columns:
+        return {json.loads(label): json.loads(value)
+                for label, value in zip(frame['label_json'], frame['value_json'])}
+    # 숫자 컬럼은 Python 스칼라로 복원 (이전 형식의 문자열 컬럼도 그대로 읽힘)
+    return dict(zip(frame['label'].tolist(), frame['value'].tolist()))
+
 class DARTDataCache:
     """
     DART API 데이터 캐시 관리 시스템
@@ -94,9 +148,84 @@ class DARTDataCache:
         key_string = f"{corp_code}_{year}_{quarter}_{data_type}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
-    def _get_cache_file_path(self, cache_key: str) -> str:
+    def _get_cache_file_path(self, cache_key: str, file_format: str = "pkl") -> str:
         """캐시 파일 경로 생성"""
-        return os.path.join(self.cache_dir, f"{cache_key}.pkl")
+        return os.path.join(self.cache_dir, f"{cache_key}.{file_format}")
+    
+    def _get_entry_file_path(self, cache_key: str) -> str:
+        """메타데이터에 기록된 형식에 맞는 캐시 파일 경로"""
+        entry = self.metadata["entries"].get(cache_key, {})
+        file_format = entry.get("file_format", "pkl")
+        if file_format == "parquet_dir":
+            return os.path.join(self.cache_dir, cache_key)
+        return self._get_cache_file_path(cache_key, file_format)
+    
+    def _write_payload(self, cache_key: str, data: Any) -> str:
+        """
+        캐시 데이터 저장 (parquet 우선, 불가능한 경우 pickle)
+        
+        - DataFrame: {cache_key}.parquet (zstd)
+        - 재무제표 dict (bs/is/cf): {cache_key}/ 디렉토리에 구성요소별 parquet + meta.json
+          (키/값 타입이 그대로 복원되지 않는 dict는 pickle)
+        
+        Returns:
+            사용된 파일 형식 ("parquet", "parquet_dir", "pkl")
+        """
+        if PARQUET_AVAILABLE and isinstance(data, pd.DataFrame):
+            data.to_parquet(self._get_cache_file_path(cache_key, "parquet"),
+                            engine='pyarrow', compression='zstd')
+            return "parquet"
+        
+        if PARQUET_AVAILABLE and isinstance(data, dict) and any(key in data for key in STATEMENT_KEYS):
+            frames, meta = {}, {}
+            for key, value in data.items():
+                if key in STATEMENT_KEYS and isinstance(value, dict):
+                    frames[key] = _statement_frame(value)
+                else:
+                    meta[key] = value
+            
+            # 값/타입이 그대로 복원되는 경우에만 parquet 디렉토리, 아니면 아래 pickle
+            if all(frame is not None for frame in frames.values()) and \
+                    all(type(key) is str and _json_roundtrips(value) for key, value in meta.items()):
+                cache_dir = os.path.join(self.cache_dir, cache_key)
+                os.makedirs(cache_dir, exist_ok=True)
+                try:
+                    for key, frame in frames.items():
+                        frame.to_parquet(os.path.join(cache_dir, f"{key}.parquet"),
+                                         engine='pyarrow', compression='zstd', index=False)
+                    with open(os.path.join(cache_dir, "meta.json"), 'w', encoding='utf-8') as f:
+                        json.dump(meta, f, ensure_ascii=False)
+                except Exception:
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+                    raise
+                return "parquet_dir"
+        
+        with open(self._get_cache_file_path(cache_key, "pkl"), 'wb') as f:
+            pickle.dump(data, f)
+        return "pkl"
+    
+    def _read_payload(self, cache_file: str, file_format: str) -> Any:
+        """_write_payload로 저장된 캐시 데이터 로드"""
+        if file_format == "parquet":
+            return pd.read_parquet(cache_file)
+        
+        if file_format == "parquet_dir":
+            with open(os.path.join(cache_file, "meta.json"), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key in STATEMENT_KEYS:
+                path = os.path.join(cache_file, f"{key}.parquet")
+                if os.path.exists(path):
+                    data[key] = _read_statement_frame(pd.read_parquet(path))
+            return data
+        
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    
+    def _get_payload_size(self, path: str) -> int:
+        """캐시 파일(또는 디렉토리) 크기"""
+        if os.path.isdir(path):
+            return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        return os.path.getsize(path)
     
     def is_cache_valid(self, cache_key: str) -> bool:
         """캐시 유효성 검사"""
@@ -139,7 +268,8 @@ class DARTDataCache:
             
             logger.info(f"✅ [CACHE] Cache is valid for key: {cache_key}")
             
-            cache_file = self._get_cache_file_path(cache_key)
+            file_format = self.metadata["entries"][cache_key].get("file_format", "pkl")
+            cache_file = self._get_entry_file_path(cache_key)
             logger.info(f"📁 [CACHE] Cache file path: {cache_file}")
             
             if not os.path.exists(cache_file):
@@ -152,7 +282,7 @@ class DARTDataCache:
             logger.info(f"✅ [CACHE] Cache file exists: {cache_file}")
             
             # 파일 크기 확인
-            file_size = os.path.getsize(cache_file)
+            file_size = self._get_payload_size(cache_file)
             logger.info(f"📊 [CACHE] Cache file size: {file_size} bytes")
             
             if file_size == 0:
@@ -163,22 +293,21 @@ class DARTDataCache:
             try:
                 logger.info(f"📖 [CACHE] Loading cache file: {cache_file}")
                 
-                # 🔥 Thread-based timeout for pickle loading
+                # 🔥 Thread-based timeout for cache loading
                 import threading
                 import time
                 
                 data_result = [None]
                 exception_result = [None]
                 
-                def load_pickle():
+                def load_payload():
                     try:
-                        with open(cache_file, 'rb') as f:
-                            data_result[0] = pickle.load(f)
+                        data_result[0] = self._read_payload(cache_file, file_format)
                     except Exception as e:
                         exception_result[0] = e
                 
-                # 별도 스레드에서 pickle 로딩
-                load_thread = threading.Thread(target=load_pickle)
+                # 별도 스레드에서 캐시 로딩
+                load_thread = threading.Thread(target=load_payload)
                 load_thread.daemon = True
                 load_thread.start()
                 
@@ -247,12 +376,16 @@ class DARTDataCache:
             return False
         
         cache_key = self._generate_cache_key(corp_code, year, quarter, data_type)
+        # 같은 키의 이전 캐시(다른 형식일 수 있음) 정리
+        if cache_key in self.metadata["entries"]:
+            self._remove_cache_entry(cache_key)
         cache_file = self._get_cache_file_path(cache_key)
         
         try:
             # 데이터 저장
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            file_format = self._write_payload(cache_key, data)
+            cache_file = self._get_cache_file_path(cache_key, file_format) if file_format != "parquet_dir" \
+                else os.path.join(self.cache_dir, cache_key)
             
             # 메타데이터 업데이트
             now = datetime.now().isoformat()
@@ -262,9 +395,10 @@ class DARTDataCache:
                 "year": year,
                 "quarter": quarter,
                 "data_type": data_type,
+                "file_format": file_format,
                 "cached_at": now,
                 "last_accessed": now,
-                "file_size": os.path.getsize(cache_file),
+                "file_size": self._get_payload_size(cache_file),
                 "record_count": len(data) if hasattr(data, '__len__') else 1
             }
             
@@ -278,16 +412,80 @@ class DARTDataCache:
         except Exception as e:
             logger.error(f"Failed to cache data: {e}")
             # 실패한 경우 파일 정리
+            if os.path.isdir(cache_file):
+                shutil.rmtree(cache_file, ignore_errors=True)
+            elif os.path.exists(cache_file):
+                os.remove(cache_file)
+            return False
+    
+    def get_cached_ratios(self, corp_code: str, year: int) -> Optional[Dict[str, float]]:
+        """캐시된 재무비율 조회 (DART 호출 및 비율 재계산 생략용)"""
+        cache_key = self._generate_cache_key(corp_code, year, 0, "ratios")
+        
+        if not self.is_cache_valid(cache_key):
+            return None
+        
+        cache_file = self._get_cache_file_path(cache_key, "json")
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                ratios = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ [CACHE] Failed to load cached ratios: {e}")
+            self._remove_cache_entry(cache_key)
+            return None
+        
+        logger.info(f"📦 [CACHE] Ratios cache hit: {corp_code} {year}")
+        return ratios
+    
+    def cache_ratios(self, corp_code: str, year: int, ratios: Dict[str, float],
+                     company_name: str = "") -> bool:
+        """계산된 재무비율 캐시 저장 (JSON)"""
+        if not ratios:
+            logger.warning(f"Empty ratios provided for caching: {corp_code} {year}")
+            return False
+        
+        cache_key = self._generate_cache_key(corp_code, year, 0, "ratios")
+        cache_file = self._get_cache_file_path(cache_key, "json")
+        
+        try:
+            payload = {k: (float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else v)
+                       for k, v in ratios.items()}
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            
+            now = datetime.now().isoformat()
+            self.metadata["entries"][cache_key] = {
+                "corp_code": corp_code,
+                "company_name": company_name,
+                "year": year,
+                "quarter": 0,
+                "data_type": "ratios",
+                "file_format": "json",
+                "cached_at": now,
+                "last_accessed": now,
+                "file_size": os.path.getsize(cache_file),
+                "record_count": len(payload)
+            }
+            self.metadata["total_entries"] = len(self.metadata["entries"])
+            self._save_metadata()
+            
+            logger.info(f"💾 Cached ratios: {corp_code} {year} - {len(payload)} ratios")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to cache ratios: {e}")
             if os.path.exists(cache_file):
                 os.remove(cache_file)
             return False
     
     def _remove_cache_entry(self, cache_key: str):
         """캐시 엔트리 제거"""
-        cache_file = self._get_cache_file_path(cache_key)
+        cache_file = self._get_entry_file_path(cache_key)
         
-        # 파일 삭제
-        if os.path.exists(cache_file):
+        # 파일(또는 parquet 디렉토리) 삭제
+        if os.path.isdir(cache_file):
+            shutil.rmtree(cache_file, ignore_errors=True)
+        elif os.path.exists(cache_file):
             os.remove(cache_file)
         
         # 메타데이터에서 제거
@@ -379,7 +577,7 @@ class DARTDataCache:
             entry_info = entry.copy()
             entry_info["cache_key"] = cache_key
             entry_info["is_valid"] = self.is_cache_valid(cache_key)
-            entry_info["file_exists"] = os.path.exists(self._get_cache_file_path(cache_key))
+            entry_info["file_exists"] = os.path.exists(self._get_entry_file_path(cache_key))
             
             entries.append(entry_info)
         
@@ -18,11 +18,36 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+import glob
+import shutil
 from datetime import datetime, date
 from typing import Dict, List, Tuple, Optional
 import warnings
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 계정명 등 한글 문자열 컬럼을 Arrow 기반 문자열로 저장 (pandas 2.1+)
+if PYARROW_AVAILABLE:
+    try:
+        pd.options.future.infer_string = True
+    except (AttributeError, KeyError, pd.errors.OptionError):
+        pass
+
+# pyarrow 사용 시 DataFrame 컬럼을 Arrow dtype으로 유지
+ARROW_DTYPE_BACKEND = {'dtype_backend': 'pyarrow'} if PYARROW_AVAILABLE else {}
+
 # 설정 및 매핑 정보 import
 from config import DART_API_KEY, FINANCIAL_RATIOS, DATA_START_YEAR, DATA_END_YEAR, QUARTERS
 try:
@@ -45,6 +70,11 @@ except ImportError as e:
     print("설치: pip install dart-fss")
     DART_FSS_AVAILABLE = False
 
+# 분기별 조회 구간 (Q4는 연간보고서로 처리)
+QUARTER_BEGIN = ('0101', '0401', '0701', '0101')
+QUARTER_END = ('0331', '0630', '0930', '1231')
+QUARTER_REPORT_TYPE = ('quarter', 'quarter', 'quarter', 'annual')
+
 class FinancialDataETL:
     """
     한국 항공사 재무데이터 ETL 파이프라인
@@ -64,6 +94,13 @@ class FinancialDataETL:
         self.data_dir = "financial_data"
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # 항공사별 파티션 저장 경로 (hive: raw/company_name=.../*.parquet)
+        self.raw_dataset_dir = os.path.join(self.data_dir, "raw")
+        
+        # 분기별 DART 응답 캐시 (재실행 시 이미 받은 분기는 건너뜀)
+        self.cache_dir = os.path.join(self.data_dir, "cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
         # 항공사 정보
         self.airlines = KOREAN_AIRLINES_CORP_MAPPING
         print(f"📊 타겟 항공사: {len(self.airlines)}개")
@@ -75,6 +112,20 @@ class FinancialDataETL:
         
         print(f"📅 수집 기간: {self.start_year}-{self.end_year}")
         
+        # 대상 분기 목록은 기업과 무관하므로 한 번만 계산
+        self.periods = self.generate_period_list()
+        self.period_windows = {period: self._period_window(period) for period in self.periods}
+        
+        # 분기별 수집 병렬화 설정 (DART 호출 제한 준수)
+        self.max_workers = 8
+        self._rate_limiter = threading.Semaphore(4)
+        
+        # 연결재무제표(CFS)가 없고 개별재무제표(OFS)만 확인된 (기업, 분기) 목록 - 해당 분기만 CFS 선조회 생략
+        # 분기 단위로 기록하므로 병렬 수집 순서와 무관하고, CFS가 있는 분기는 항상 CFS로 수집됨
+        self.prefer_ofs_path = os.path.join(self.data_dir, "prefer_ofs.json")
+        self._prefer_ofs = self._load_prefer_ofs()
+        self._prefer_ofs_lock = threading.Lock()
+        
     def generate_period_list(self) -> List[str]:
         """분기별 기간 리스트 생성 (예: ['20101', '20102', ...])"""
         
@@ -94,89 +145,179 @@ class FinancialDataETL:
         print(f"📆 총 {len(periods)}개 분기 대상")
         return periods
         
-    def extract_financial_statements(self, corp_code: str, company_name: str) -> pd.DataFrame:
-        """특정 기업의 모든 분기 재무제표 추출"""
+    def _load_prefer_ofs(self) -> set:
+        """OFS 우선 (기업, 분기) 목록 로드 ('{corp_code}_{period}' 키)"""
+        if os.path.exists(self.prefer_ofs_path):
+            try:
+                with open(self.prefer_ofs_path, 'r', encoding='utf-8') as f:
+                    # 기업 단위로 저장하던 이전 형식의 항목은 무시
+                    return {key for key in json.load(f) if '_' in key}
+            except Exception as e:
+                print(f"⚠️ OFS 우선 목록 로드 실패: {e}")
+        return set()
+    
+    def _save_prefer_ofs(self):
+        """OFS 우선 (기업, 분기) 목록 저장 (다음 실행에서 재사용)"""
+        with self._prefer_ofs_lock:
+            keys = sorted(self._prefer_ofs)
+        with open(self.prefer_ofs_path, 'w', encoding='utf-8') as f:
+            json.dump(keys, f, ensure_ascii=False, indent=2)
+    
+    @staticmethod
+    def _period_window(period: str) -> Tuple[str, str, str]:
+        """기간 코드 → (조회 시작일, 종료일, 보고서 유형)"""
+        year = period[:4]
+        q_idx = int(period[4:]) - 1
+        return f"{year}{QUARTER_BEGIN[q_idx]}", f"{year}{QUARTER_END[q_idx]}", QUARTER_REPORT_TYPE[q_idx]
         
-        print(f"📈 {company_name} ({corp_code}) 재무제표 수집 중...")
+    def _period_cache_path(self, corp_code: str, period: str) -> str:
+        """분기별 캐시 파일 경로"""
+        return os.path.join(self.cache_dir, f"{corp_code}_{period}.parquet")
+    
+    def invalidate_period_cache(self, period: Optional[str] = None) -> int:
+        """분기별 캐시 삭제 (period 미지정 시 전체 삭제)"""
+        
+        pattern = f"*_{period}.parquet" if period else "*.parquet"
+        removed = 0
+        for cache_path in glob.glob(os.path.join(self.cache_dir, pattern)):
+            os.remove(cache_path)
+            removed += 1
         
-        periods = self.generate_period_list()
-        all_statements = []
+        # 캐시를 지운 분기는 CFS부터 다시 확인
+        with self._prefer_ofs_lock:
+            stale = {key for key in self._prefer_ofs if period is None or key.endswith(f"_{period}")}
+            self._prefer_ofs -= stale
+        if stale:
+            self._save_prefer_ofs()
+        
+        print(f"🗑️ 분기 캐시 삭제: {period or '전체'} ({removed}개 파일)")
+        return removed
+    
+    def _extract_statement(self, corp_code: str, bgn_date: str, end_date: str,
+                           report_type: str, separate: bool):
+        """DART 재무제표 단일 호출 (연결: separate=False, 개별: separate=True)"""
+        with self._rate_limiter:
+            return extract(
+                corp_code=corp_code,
+                bgn_de=bgn_date,
+                end_de=end_date,
+                separate=separate,
+                report_tp=report_type  # 분기별 또는 연간
+            )
+    
+    def _fetch_one(self, corp_code: str, company_name: str, period: str) -> Optional[pd.DataFrame]:
+        """단일 분기 재무제표 추출 (연결 우선, 없으면 개별재무제표)"""
         
-        for period in tqdm(periods, desc=f"{company_name} 재무제표"):
+        cache_path = self._period_cache_path(corp_code, period)
+        if os.path.exists(cache_path):
             try:
-                # DART에서 재무제표 추출
-                # bgn_de: 시작일, end_de: 종료일, corp_code: 기업코드
-                year = int(period[:4])
-                quarter = int(period[4:])
-                
-                # 분기 종료일 계산
-                if quarter == 1:
-                    end_date = f"{year}0331"
-                elif quarter == 2:
-                    end_date = f"{year}0630"
-                elif quarter == 3:
-                    end_date = f"{year}0930"
-                else:  # quarter == 4
-                    end_date = f"{year}1231"
-                
-                # 재무제표 추출 (연결재무제표 우선) - 날짜 범위 수정
-                if quarter == 4:
-                    # 4분기는 연간보고서로 처리
-                    bgn_date = f"{year}0101"
-                    report_type = 'annual'
-                else:
-                    # 분기별 보고서
-                    if quarter == 1:
-                        bgn_date = f"{year}0101"
-                    elif quarter == 2:
-                        bgn_date = f"{year}0401"
-                    else:  # quarter == 3
-                        bgn_date = f"{year}0701"
-                    report_type = 'quarter'
-                
-                fs_data = extract(
-                    corp_code=corp_code,
-                    bgn_de=bgn_date,
-                    end_de=end_date,
-                    separate=False,  # 연결재무제표 (False), 개별재무제표 (True)
-                    report_tp=report_type  # 분기별 또는 연간
-                )
-                
-                if fs_data is not None and not fs_data.empty:
-                    fs_data['period'] = period
-                    fs_data['company_name'] = company_name
-                    fs_data['corp_code'] = corp_code
-                    fs_data['end_date'] = end_date
-                    all_statements.append(fs_data)
-                    
-                else:
-                    # 연결재무제표가 없으면 개별재무제표 시도
-                    fs_data = extract(
-                        corp_code=corp_code,
-                        bgn_de=bgn_date,  # 위에서 계산된 시작 날짜 사용
-                        end_de=end_date,
-                        separate=True,  # 개별재무제표
-                        report_tp=report_type  # 위에서 계산된 보고서 타입 사용
-                    )
-                    
-                    if fs_data is not None and not fs_data.empty:
-                        fs_data['period'] = period
-                        fs_data['company_name'] = company_name
-                        fs_data['corp_code'] = corp_code
-                        fs_data['end_date'] = end_date
-                        fs_data['fs_div'] = 'OFS'  # 개별재무제표 표시
-                        all_statements.append(fs_data)
+                return pd.read_parquet(cache_path, **ARROW_DTYPE_BACKEND)
+            except Exception as e:
+                logger.warning(f"⚠️ {company_name} {period} 캐시 로드 실패, 재수집: {e}")
+        
+        try:
+            # DART에서 재무제표 추출
+            # bgn_de: 시작일, end_de: 종료일, corp_code: 기업코드
+            window = self.period_windows.get(period)
+            bgn_date, end_date, report_type = window if window else self._period_window(period)
+            
+            # 이전에 이 분기의 CFS가 없고 OFS만 확인된 경우 개별재무제표부터 조회
+            prefer_ofs_key = f"{corp_code}_{period}"
+            prefer_ofs = prefer_ofs_key in self._prefer_ofs
+            fs_data = self._extract_statement(corp_code, bgn_date, end_date, report_type, separate=prefer_ofs)
+            fs_div = 'OFS' if prefer_ofs else None
+            
+            if fs_data is None or fs_data.empty:
+                # 첫 시도가 비어 있으면 다른 재무제표 구분으로 재시도
+                fs_data = self._extract_statement(corp_code, bgn_date, end_date, report_type, separate=not prefer_ofs)
+                fs_div = None if prefer_ofs else 'OFS'  # 개별재무제표 표시
                 
+                if not prefer_ofs and fs_data is not None and not fs_data.empty:
+                    with self._prefer_ofs_lock:
+                        self._prefer_ofs.add(prefer_ofs_key)
+            
+            if fs_data is None or fs_data.empty:
+                return None
+            
+            if PYARROW_AVAILABLE:
+                fs_data = fs_data.convert_dtypes(dtype_backend='pyarrow')
+            
+            fs_data['period'] = period
+            fs_data['company_name'] = company_name
+            fs_data['corp_code'] = corp_code
+            fs_data['end_date'] = end_date
+            if fs_div is not None:
+                fs_data['fs_div'] = fs_div
+            
+            try:
+                fs_data.to_parquet(cache_path, index=False)
             except Exception as e:
-                print(f"⚠️ {company_name} {period} 데이터 수집 실패: {e}")
-                continue
+                logger.warning(f"⚠️ {company_name} {period} 캐시 저장 실패: {e}")
+            
+            return fs_data
+            
+        except Exception as e:
+            logger.debug(f"⚠️ {company_name} {period} 데이터 수집 실패: {e}")
+            return None
+        
+    @staticmethod
+    def _concat_statements(frames: List[pd.DataFrame], as_arrow: bool = False):
+        """재무제표 조각 결합 (pyarrow 사용 가능 시 Arrow concat으로 pandas 블록 재결합 복사 회피)
+        
+        컬럼 구성이 다른 조각(OFS의 fs_div 등)은 스키마 승격으로 합치며,
+        Arrow 변환이 불가능한 혼합 타입 컬럼이 있으면 pd.concat으로 대체합니다.
+        """
+        
+        if PYARROW_AVAILABLE:
+            try:
+                tables = [
+                    frame if isinstance(frame, pa.Table) else pa.Table.from_pandas(frame, preserve_index=False)
+                    for frame in frames
+                ]
+                table = pa.concat_tables(tables, promote_options='default')
+                return table if as_arrow else table.to_pandas(types_mapper=pd.ArrowDtype)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+        
+        frames = [frame.to_pandas(types_mapper=pd.ArrowDtype) if PYARROW_AVAILABLE and isinstance(frame, pa.Table) else frame for frame in frames]
+        return pd.concat(frames, ignore_index=True)
+    
+    def extract_financial_statements(self, corp_code: str, company_name: str, as_arrow: bool = False):
+        """특정 기업의 모든 분기 재무제표 추출
+        
+        Args:
+            as_arrow: True면 pyarrow Table로 반환 (전체 수집 시 중간 pandas 변환 생략)
+        """
+        
+        logger.info(f"📈 {company_name} ({corp_code}) 재무제표 수집 중...")
+        
+        periods = self.periods
+        known_ofs = len(self._prefer_ofs)
+        
+        # 분기별 DART 호출은 I/O 대기가 대부분이므로 스레드로 병렬 수집
+        # (executor.map은 입력 순서를 유지하므로 결과도 분기 순서대로 정렬됨)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(tqdm(
+                executor.map(lambda period: self._fetch_one(corp_code, company_name, period), periods),
+                total=len(periods),
+                desc=f"{company_name} 재무제표",
+                mininterval=1.0,
+                leave=False,
+                disable=not sys.stderr.isatty()  # 비대화형 실행(로그 파일, CI)에서는 진행바 생략
+            ))
+        
+        all_statements = [fs_data for fs_data in results if fs_data is not None]
+        
+        # 새로 확인된 OFS 분기가 있을 때만 저장 (키는 추가만 되므로 개수로 판단)
+        if len(self._prefer_ofs) != known_ofs:
+            self._save_prefer_ofs()
         
         if all_statements:
-            result_df = pd.concat(all_statements, ignore_index=True)
-            print(f"✅ {company_name}: {len(result_df)}개 재무항목 수집 완료")
-            return result_df
+            result = self._concat_statements(all_statements, as_arrow=as_arrow)
+            logger.info(f"✅ {company_name}: {len(result)}개 재무항목 수집 완료")
+            return result
         else:
-            print(f"❌ {company_name}: 재무데이터 수집 실패")
+            logger.info(f"❌ {company_name}: 재무데이터 수집 실패")
             return pd.DataFrame()
     
     def collect_all_financial_data(self) -> pd.DataFrame:
@@ -191,40 +332,94 @@ class FinancialDataETL:
             corp_code = info['corp_code']
             
             if corp_code is None:
-                print(f"⏭️ {company_name}: corp_code 없음, 건너뛰기")
+                logger.info(f"⏭️ {company_name}: corp_code 없음, 건너뛰기")
                 continue
                 
-            # 각 기업별 재무데이터 수집
-            company_data = self.extract_financial_statements(corp_code, company_name)
+            # 각 기업별 재무데이터 수집 (Arrow Table로 받아 마지막에 한 번만 pandas 변환)
+            company_data = self.extract_financial_statements(corp_code, company_name, as_arrow=True)
             
-            if not company_data.empty:
+            if len(company_data) > 0:
                 all_company_data.append(company_data)
             
-            print(f"✅ {company_name} 완료")
-            print("-" * 40)
+            logger.info(f"✅ {company_name} 완료")
         
         if all_company_data:
-            final_df = pd.concat(all_company_data, ignore_index=True)
+            final_df = self._concat_statements(all_company_data)
             print(f"🎉 전체 수집 완료: {len(final_df)}개 재무항목")
             return final_df
         else:
             print("❌ 재무데이터 수집 실패")
             return pd.DataFrame()
     
+    @staticmethod
+    def _downcast_raw_data(df: pd.DataFrame) -> pd.DataFrame:
+        """반복 식별자 컬럼은 category, float64 수치 컬럼은 float32로 축소"""
+        
+        df = df.copy()
+        for col in ['company_name', 'corp_code', 'period', 'fs_div', 'end_date']:
+            if col in df.columns:
+                # 기간 컬럼은 min/max 비교가 가능하도록 순서형 카테고리로 저장
+                df[col] = pd.Categorical(df[col], ordered=col in ('period', 'end_date'))
+        
+        float_cols = df.select_dtypes('float64').columns
+        if len(float_cols) > 0:
+            df[float_cols] = df[float_cols].astype('float32')
+        
+        arrow_float_cols = [col for col in df.columns if str(df[col].dtype) == 'double[pyarrow]']
+        if arrow_float_cols:
+            df[arrow_float_cols] = df[arrow_float_cols].astype('float[pyarrow]')
+        return df
+    
     def save_raw_data(self, df: pd.DataFrame, filename: str = "raw_financial_statements.parquet"):
-        """원본 재무데이터 저장"""
+        """원본 재무데이터 저장 (pyarrow 사용 가능 시 항공사별 파티션 데이터셋)"""
         
-        filepath = os.path.join(self.data_dir, filename)
-        df.to_parquet(filepath, index=False)
-        print(f"💾 원본 재무데이터 저장: {filepath}")
+        df = self._downcast_raw_data(df)
+        
+        if PYARROW_AVAILABLE:
+            # 전체 스냅샷 저장이므로 이전 파티션은 정리 (단일 파일 덮어쓰기와 동일한 의미)
+            if os.path.isdir(self.raw_dataset_dir):
+                shutil.rmtree(self.raw_dataset_dir)
+            # 파티션 키는 경로에 문자열로 기록되므로 dictionary 인코딩을 풀어서 전달
+            table = pa.Table.from_pandas(df.astype({'company_name': str}), preserve_index=False)
+            ds.write_dataset(
+                table,
+                base_dir=self.raw_dataset_dir,
+                format='parquet',
+                partitioning=ds.partitioning(pa.schema([('company_name', pa.string())]), flavor='hive'),
+                existing_data_behavior='overwrite_or_ignore'
+            )
+            print(f"💾 원본 재무데이터 저장 (항공사별 파티션): {self.raw_dataset_dir}")
+        else:
+            filepath = os.path.join(self.data_dir, filename)
+            df.to_parquet(filepath, index=False)
+            print(f"💾 원본 재무데이터 저장: {filepath}")
         print(f"📊 데이터 크기: {df.shape}")
         
-    def load_raw_data(self, filename: str = "raw_financial_statements.parquet") -> pd.DataFrame:
-        """저장된 원본 재무데이터 로드"""
+    def has_raw_data(self, filename: str = "raw_financial_statements.parquet") -> bool:
+        """저장된 원본 재무데이터 존재 여부"""
+        return (
+            (PYARROW_AVAILABLE and os.path.isdir(self.raw_dataset_dir)) or
+            os.path.exists(os.path.join(self.data_dir, filename))
+        )
+        
+    def load_raw_data(self, filename: str = "raw_financial_statements.parquet",
+                      company_name: Optional[str] = None) -> pd.DataFrame:
+        """저장된 원본 재무데이터 로드 (company_name 지정 시 해당 파티션만 읽음)"""
+        
+        if PYARROW_AVAILABLE and os.path.isdir(self.raw_dataset_dir):
+            dataset = ds.dataset(self.raw_dataset_dir, format='parquet', partitioning='hive')
+            row_filter = ds.field('company_name') == company_name if company_name else None
+            # category 컬럼 복원을 위해 기본 변환 사용 (문자열은 infer_string으로 Arrow 기반)
+            df = dataset.to_table(filter=row_filter).to_pandas()
+            print(f"📂 원본 재무데이터 로드: {self.raw_dataset_dir}")
+            print(f"📊 데이터 크기: {df.shape}")
+            return df
         
         filepath = os.path.join(self.data_dir, filename)
         if os.path.exists(filepath):
             df = pd.read_parquet(filepath)
+            if company_name:
+                df = df[df['company_name'] == company_name].reset_index(drop=True)
             print(f"📂 원본 재무데이터 로드: {filepath}")
             print(f"📊 데이터 크기: {df.shape}")
             return df
@@ -232,17 +427,27 @@ class FinancialDataETL:
             print(f"❌ 파일이 존재하지 않습니다: {filepath}")
             return pd.DataFrame()
     
-    def run_etl_pipeline(self, force_refresh: bool = False):
-        """전체 ETL 파이프라인 실행"""
+    def run_etl_pipeline(self, force_refresh: bool = False, refresh_periods: Optional[List[str]] = None):
+        """전체 ETL 파이프라인 실행
+        
+        Args:
+            force_refresh: 모든 분기를 DART에서 다시 수집
+            refresh_periods: 지정한 분기(예: '201503')의 캐시만 무효화 후 재수집
+        """
         
         print("🏗️ Korean Airlines Financial Data ETL Pipeline")
         print("=" * 60)
         
         raw_data_file = "raw_financial_statements.parquet"
-        raw_data_path = os.path.join(self.data_dir, raw_data_file)
+        
+        if force_refresh:
+            self.invalidate_period_cache()
+        elif refresh_periods:
+            for period in refresh_periods:
+                self.invalidate_period_cache(period)
         
         # 기존 데이터가 있고 강제 새로고침이 아닌 경우 로드
-        if os.path.exists(raw_data_path) and not force_refresh:
+        if self.has_raw_data(raw_data_file) and not force_refresh and not refresh_periods:
             print("📂 기존 재무데이터 발견, 로드 중...")
             raw_df = self.load_raw_data(raw_data_file)
             
@@ -251,7 +456,7 @@ class FinancialDataETL:
                 return raw_df
         
         # 새로운 데이터 수집
-        print("🔄 새로운 재무데이터 수집 시작...")
+        print("🔄 새로운 재무데이터 수집 시작... (캐시된 분기는 재사용)")
         raw_df = self.collect_all_financial_data()
         
         if not raw_df.empty:
@@ -271,14 +476,26 @@ class FinancialDataETL:
 def main():
     """메인 실행 함수"""
     
+    # 기업/분기별 상세 로그는 --verbose 지정 시에만 출력
+    logging.basicConfig(
+        level=logging.DEBUG if '--verbose' in sys.argv else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     # ETL 파이프라인 실행
     etl = FinancialDataETL()
     
     # 강제 새로고침 여부 (명령행 인자로 제어)
     force_refresh = '--refresh' in sys.argv
     
+    # 특정 분기만 재수집 (예: --refresh-period 201503)
+    refresh_periods = [
+        sys.argv[i + 1] for i, arg in enumerate(sys.argv[:-1])
+        if arg == '--refresh-period'
+    ]
+    
     # ETL 실행
-    financial_data = etl.run_etl_pipeline(force_refresh=force_refresh)
+    financial_data = etl.run_etl_pipeline(force_refresh=force_refresh, refresh_periods=refresh_periods)
     
     if not financial_data.empty:
         print("\n📋 수집된 데이터 샘플:")
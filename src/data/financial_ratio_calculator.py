@@ -15,11 +15,46 @@ Features:
 Author: Korean Airlines Credit Rating Analysis
 """
 
+import re
+import math
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 import warnings
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+
+# Optional Aho-Corasick automaton for single-pass multi-name label matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional JIT compilation for the batch ratio kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Pure-Python fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# True로 설정하면 상세 처리 로그를 stderr로 출력 (기본은 NullHandler로 무출력)
+VERBOSE = False
+if VERBOSE:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.DEBUG)
 
 try:
     from config import FINANCIAL_RATIOS
@@ -36,6 +71,286 @@ except ImportError:
             'receivables_turnover', 'payables_turnover', 'total_asset_growth', 'sales_growth'
         ]
 
+
+class BS(IntEnum):
+    """재무상태표 항목 열 인덱스 (bs_arr[N, 14])"""
+    TOTAL_ASSETS = 0
+    CURRENT_ASSETS = 1
+    NON_CURRENT_ASSETS = 2
+    TOTAL_LIABILITIES = 3
+    CURRENT_LIABILITIES = 4
+    NON_CURRENT_LIABILITIES = 5
+    TOTAL_EQUITY = 6
+    CASH_AND_EQUIVALENTS = 7
+    SHORT_TERM_INVESTMENTS = 8
+    TRADE_RECEIVABLES = 9
+    INVENTORY = 10
+    TRADE_PAYABLES = 11
+    SHORT_TERM_DEBT = 12
+    LONG_TERM_DEBT = 13
+
+
+class IS(IntEnum):
+    """손익계산서 항목 열 인덱스 (is_arr[N, 7])"""
+    REVENUE = 0
+    GROSS_PROFIT = 1
+    OPERATING_PROFIT = 2
+    EBIT = 3
+    NET_INCOME = 4
+    INTEREST_EXPENSE = 5
+    COST_OF_SALES = 6
+
+
+class CF(IntEnum):
+    """현금흐름표 항목 열 인덱스 (cf_arr[N, 3])"""
+    OPERATING_CASH_FLOW = 0
+    INVESTING_CASH_FLOW = 1
+    FINANCING_CASH_FLOW = 2
+
+
+# 재무비율 출력 스키마 (영문 키 / 한글명, 같은 순서)
+RATIO_NAMES: Tuple[str, ...] = (
+    'debt_to_assets', 'current_ratio', 'roa', 'roe', 'operating_margin',
+    'equity_ratio', 'asset_turnover', 'interest_coverage', 'quick_ratio',
+    'working_capital_ratio', 'debt_to_equity', 'gross_margin', 'net_margin',
+    'cash_ratio', 'times_interest_earned', 'inventory_turnover',
+    'receivables_turnover', 'payables_turnover', 'total_asset_growth', 'sales_growth'
+)
+RATIO_KO: Tuple[str, ...] = (
+    '부채비율', '유동비율', '총자산수익률', '자기자본수익률', '영업이익률',
+    '자기자본비율', '총자산회전율', '이자보상배율', '당좌비율',
+    '운전자본비율', '부채자본비율', '매출총이익률', '순이익률',
+    '현금비율', '이자보상배수', '재고자산회전율',
+    '매출채권회전율', '매입채무회전율', '총자산증가율', '매출증가율'
+)
+
+# 배치 계산 결과 열 순서 (ratios[N, 10], RATIO_NAMES의 앞 10개)
+COMPUTED_RATIOS = RATIO_NAMES[:10]
+
+
+def normalize_label(label) -> str:
+    """계정과목명 정규화 (모든 공백 제거)"""
+    return re.sub(r'\s+', '', str(label))
+
+
+# 회사/분기별 재무비율 레코드 (float64 × 20, dict 대비 메모리·속성 접근 비용 절감)
+RATIO_DTYPE = np.dtype([(name, 'f8') for name in RATIO_NAMES])
+
+
+def ratios_to_records(ratios_list: List[Dict[str, float]]) -> np.ndarray:
+    """재무비율 dict 목록을 RATIO_DTYPE 구조화 배열로 변환 (누락 비율은 NaN)"""
+    records = np.empty(len(ratios_list), dtype=RATIO_DTYPE)
+    for name in RATIO_DTYPE.names:
+        records[name] = [ratios.get(name, np.nan) for ratios in ratios_list]
+    return records
+
+
+def pack_items(items: Dict[str, float], columns) -> np.ndarray:
+    """항목 dict를 고정 열 순서의 float 벡터로 변환 (누락값은 NaN)"""
+    return np.array([items.get(col.name.lower(), np.nan) for col in columns], dtype=np.float64)
+
+
+# 재무상태표 계정과목 매핑 (FinancialStatement.show 경로)
+_BS_MAPPINGS = {
+    'total_assets': ('자산총계', '자산 총계', 'Assets', 'Total assets'),
+    'current_assets': ('유동자산', '유동 자산', 'Current assets'),
+    'non_current_assets': ('비유동자산', '비유동 자산', 'Non-current assets'),
+    'total_liabilities': ('부채총계', '부채 총계', 'Liabilities', 'Total liabilities'),
+    'current_liabilities': ('유동부채', '유동 부채', 'Current liabilities'),
+    'non_current_liabilities': ('비유동부채', '비유동 부채', 'Non-current liabilities'),
+    'total_equity': ('자본총계', '자본 총계', 'Equity', 'Total equity'),
+    'cash_and_equivalents': ('현금및현금성자산', '현금 및 현금성자산', 'Cash and cash equivalents'),
+    'short_term_investments': ('단기투자자산', '단기 투자자산'),
+    'trade_receivables': ('매출채권', '매출 채권', 'Trade receivables'),
+    'inventory': ('재고자산', '재고 자산', 'Inventory'),
+    'trade_payables': ('매입채무', '매입 채무', 'Trade payables'),
+    'short_term_debt': ('단기차입금', '단기 차입금'),
+    'long_term_debt': ('장기차입금', '장기 차입금'),
+}
+
+# 손익계산서 계정과목 매핑
+_IS_MAPPINGS = {
+    'revenue': ('매출액', '매출', '수익', '영업수익', 'Revenue', 'Sales'),
+    'gross_profit': ('매출총이익', '매출 총이익', '총이익', 'Gross profit'),
+    'operating_profit': ('영업이익', '영업 이익', '영업손익', 'Operating profit'),
+    'ebit': ('세전이익', '세전 이익', '법인세비용차감전순이익', 'EBIT'),
+    'net_income': ('당기순이익', '당기 순이익', '순이익', '당기손익', 'Net income'),
+    'interest_expense': ('금융비용', '이자비용', '이자', 'Interest expense'),
+    'cost_of_sales': ('매출원가', '매출 원가', '원가', 'Cost of sales'),
+}
+
+# 현금흐름표 계정과목 매핑
+_CF_MAPPINGS = {
+    'operating_cash_flow': ('영업활동으로 인한 현금흐름', '영업활동', '영업현금', '영업활동현금흐름'),
+    'investing_cash_flow': ('투자활동으로 인한 현금흐름', '투자활동', '투자현금', '투자활동현금흐름'),
+    'financing_cash_flow': ('재무활동으로 인한 현금흐름', '재무활동', '재무현금', '재무활동현금흐름'),
+}
+
+# 캐시 dict 경로용 확장 매핑 (재무상태표)
+_CACHED_BS_MAPPINGS = {
+    'total_assets': (
+        '자산총계', '자산 총계', '자산총액', 'Assets', 'Total assets', '자산의 총계', '총자산', '자산계', '자산 계',
+    ),
+    'current_assets': (
+        '유동자산', '유동 자산', 'Current assets', '당좌자산', '유동성자산', '단기자산',
+    ),
+    'non_current_assets': (
+        '비유동자산', '비유동 자산', '고정자산', 'Non-current assets', '장기자산', '비유동성자산',
+    ),
+    'total_liabilities': (
+        '부채총계', '부채 총계', '부채총액', 'Liabilities', 'Total liabilities', '부채의 총계', '총부채', '부채계',
+        '부채 계',
+    ),
+    'current_liabilities': (
+        '유동부채', '유동 부채', 'Current liabilities', '단기부채', '유동성부채', '1년이내만기부채',
+    ),
+    'non_current_liabilities': (
+        '비유동부채', '비유동 부채', '고정부채', 'Non-current liabilities', '장기부채', '비유동성부채',
+    ),
+    'total_equity': (
+        '자본총계', '자본 총계', '자본총액', 'Equity', 'Total equity', '자본의 총계', '총자본', '자본계', '자본 계',
+        '자기자본', '주주지분', '소유주지분',
+    ),
+    'cash_and_equivalents': (
+        '현금및현금성자산', '현금 및 현금성자산', 'Cash and cash equivalents', '현금', '현금성자산', '현금 및 현금등가물',
+    ),
+}
+
+# 캐시 dict 경로용 확장 매핑 (손익계산서)
+_CACHED_IS_MAPPINGS = {
+    'revenue': (
+        '매출액', '매출', '수익', '영업수익', 'Revenue', 'Sales', '총매출액', '총수익', '영업매출액', '매출 수익',
+    ),
+    'gross_profit': (
+        '매출총이익', '매출 총이익', '총이익', 'Gross profit', '매출총손익', '총손익',
+    ),
+    'operating_profit': (
+        '영업이익', '영업 이익', '영업손익', 'Operating profit', '영업수익', '영업수지',
+    ),
+    'ebit': (
+        '세전이익', '세전 이익', '법인세비용차감전순이익', 'EBIT', '세전손익', '법인세차감전이익',
+    ),
+    'net_income': (
+        '당기순이익', '당기 순이익', '순이익', '당기손익', 'Net income', '총손익', '당기총손익', '최종손익',
+    ),
+    'interest_expense': (
+        '금융비용', '이자비용', '이자', 'Interest expense', '금융원가', '이자비용 및 할인료',
+    ),
+    'cost_of_sales': (
+        '매출원가', '매출 원가', '원가', 'Cost of sales', '제품매출원가', '상품매출원가',
+    ),
+}
+
+# 캐시 dict 경로용 확장 매핑 (현금흐름표)
+_CACHED_CF_MAPPINGS = {
+    'operating_cash_flow': (
+        '영업활동으로 인한 현금흐름', '영업활동', '영업현금', '영업활동현금흐름', '영업활동 현금흐름', '영업활동으로부터의 현금흐름',
+    ),
+    'investing_cash_flow': (
+        '투자활동으로 인한 현금흐름', '투자활동', '투자현금', '투자활동현금흐름', '투자활동 현금흐름', '투자활동으로부터의 현금흐름',
+    ),
+    'financing_cash_flow': (
+        '재무활동으로 인한 현금흐름', '재무활동', '재무현금', '재무활동현금흐름', '재무활동 현금흐름', '재무활동으로부터의 현금흐름',
+    ),
+}
+
+
+def _normalize_mappings(mappings: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """계정명 후보를 normalize_label로 한 번만 정규화"""
+    return {key: tuple(normalize_label(n) for n in names) for key, names in mappings.items()}
+
+
+_BS_MAPPINGS_NORM = _normalize_mappings(_BS_MAPPINGS)
+_IS_MAPPINGS_NORM = _normalize_mappings(_IS_MAPPINGS)
+_CF_MAPPINGS_NORM = _normalize_mappings(_CF_MAPPINGS)
+_ITEM_MAPPINGS_NORM = {'bs': _BS_MAPPINGS_NORM, 'is': _IS_MAPPINGS_NORM, 'cf': _CF_MAPPINGS_NORM}
+
+_CACHED_ITEM_MAPPINGS = {'bs': _CACHED_BS_MAPPINGS, 'is': _CACHED_IS_MAPPINGS, 'cf': _CACHED_CF_MAPPINGS}
+_CACHED_ITEM_MAPPINGS_NORM = {st: _normalize_mappings(m) for st, m in _CACHED_ITEM_MAPPINGS.items()}
+
+# 라벨 스캔 키 -> 정규화된 매핑 ('bs'/'is'/'cf'는 show 경로, ('cached', st)는 캐시 dict 경로)
+_SCAN_MAPPINGS = {
+    **_ITEM_MAPPINGS_NORM,
+    **{('cached', st): m for st, m in _CACHED_ITEM_MAPPINGS_NORM.items()},
+}
+
+# 라벨 스캔 키 -> 후보명 목록 / 후보명 전체를 묶은 선택(alternation) 정규식 (오토마톤 미설치 시 사전 필터)
+_SCAN_NAMES = {
+    key: tuple(dict.fromkeys(n for names in mappings.values() for n in names))
+    for key, mappings in _SCAN_MAPPINGS.items()
+}
+_SCAN_PATTERNS = {
+    key: re.compile('|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True)))
+    for key, names in _SCAN_NAMES.items()
+}
+
+
+def _build_scan_automata(automaton_factory) -> Dict:
+    """라벨 스캔 키별 후보명 오토마톤 생성 (automaton_factory: ahocorasick.Automaton 호환 클래스)"""
+    automata = {}
+    for key, names in _SCAN_NAMES.items():
+        automaton = automaton_factory()
+        for name in names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        automata[key] = automaton
+    return automata
+
+
+# JIT 커널용 정수 열 인덱스 (nopython 모드에서 상수로 고정)
+_TA, _CA, _CL = int(BS.TOTAL_ASSETS), int(BS.CURRENT_ASSETS), int(BS.CURRENT_LIABILITIES)
+_TL, _TE = int(BS.TOTAL_LIABILITIES), int(BS.TOTAL_EQUITY)
+_CASH, _STI, _AR = int(BS.CASH_AND_EQUIVALENTS), int(BS.SHORT_TERM_INVESTMENTS), int(BS.TRADE_RECEIVABLES)
+_REV, _OP, _NI, _INT = int(IS.REVENUE), int(IS.OPERATING_PROFIT), int(IS.NET_INCOME), int(IS.INTEREST_EXPENSE)
+
+
+# 이 모듈은 src.data / data / 단독 경로로 import되므로 디스크 캐시(cache=True)는
+# 모듈명이 달라지면 로드에 실패함 -> 프로세스 내 JIT + __init__ 워밍업만 사용
+@njit
+def compute_ratios_batch(bs: np.ndarray, is_: np.ndarray, cf: np.ndarray) -> np.ndarray:
+    """
+    행 단위 단일 패스로 핵심 비율 10개 계산 (열 순서는 COMPUTED_RATIOS)
+    
+    bs/is_/cf는 BS/IS/CF 열 순서의 C-contiguous float64 배열이며 누락값은 NaN.
+    분모가 0 (이자보상배율은 0 이하)이면 NaN.
+    """
+    n = bs.shape[0]
+    out = np.full((n, 10), np.nan)
+    for i in range(n):
+        ta = bs[i, _TA]
+        ca = bs[i, _CA]
+        cl = bs[i, _CL]
+        te = bs[i, _TE]
+        revenue = is_[i, _REV]
+        op = is_[i, _OP]
+        ni = is_[i, _NI]
+        interest = is_[i, _INT]
+        
+        # 당좌자산 = 현금 + 단기투자 + 매출채권 (누락 항목은 0)
+        quick_assets = 0.0
+        for j in (_CASH, _STI, _AR):
+            if not np.isnan(bs[i, j]):
+                quick_assets += bs[i, j]
+        
+        if ta != 0.0:
+            out[i, 0] = bs[i, _TL] / ta                     # debt_to_assets
+            out[i, 2] = ni / ta                             # roa
+            out[i, 5] = te / ta                             # equity_ratio
+            out[i, 6] = revenue / ta                        # asset_turnover
+            out[i, 9] = (ca - cl) / ta                      # working_capital_ratio
+        if cl != 0.0:
+            out[i, 1] = ca / cl                             # current_ratio
+            if quick_assets > 0.0:
+                out[i, 8] = quick_assets / cl               # quick_ratio
+        if te != 0.0:
+            out[i, 3] = ni / te                             # roe
+        if revenue != 0.0:
+            out[i, 4] = op / revenue                        # operating_margin
+        if interest > 0.0:
+            out[i, 7] = op / interest                       # interest_coverage
+    return out
+
+
 class FinancialRatioCalculator:
     """
     재무비율 계산기
@@ -43,32 +358,48 @@ class FinancialRatioCalculator:
     
     def __init__(self):
         """초기화"""
-        self.ratio_definitions = {
-            'debt_to_assets': '부채비율',
-            'current_ratio': '유동비율', 
-            'roa': '총자산수익률',
-            'roe': '자기자본수익률',
-            'operating_margin': '영업이익률',
-            'equity_ratio': '자기자본비율',
-            'asset_turnover': '총자산회전율',
-            'interest_coverage': '이자보상배율',
-            'quick_ratio': '당좌비율',
-            'working_capital_ratio': '운전자본비율',
-            'debt_to_equity': '부채자본비율',
-            'gross_margin': '매출총이익률',
-            'net_margin': '순이익률',
-            'cash_ratio': '현금비율',
-            'times_interest_earned': '이자보상배수',
-            'inventory_turnover': '재고자산회전율',
-            'receivables_turnover': '매출채권회전율',
-            'payables_turnover': '매입채무회전율',
-            'total_asset_growth': '총자산증가율',
-            'sales_growth': '매출증가율'
-        }
+        self.ratio_definitions = dict(zip(RATIO_NAMES, RATIO_KO))
+        
+        # 정규화된 계정명 후보 Aho-Corasick 오토마톤 (미설치 시 dict 조회 경로 사용)
+        self._automata = _build_scan_automata(ahocorasick.Automaton) if AHOCORASICK_AVAILABLE else {}
         
-        print(f"✅ 재무비율 계산기 초기화 완료")
-        print(f"📊 계산 가능한 비율: {len(self.ratio_definitions)}개")
+        # 회사 단위 캐시는 스레드별로 유지 (process_many에서 스레드 간 clear 간섭 방지)
+        self._local = threading.local()
         
+        # 병렬 처리 시 동시 show() 호출 수 제한 (DART 요청 제한 대응)
+        self.max_workers = 8
+        self._show_semaphore = threading.Semaphore(4)
+        
+        # JIT 워밍업 (첫 배치 호출의 컴파일 지연 제거)
+        if NUMBA_AVAILABLE:
+            compute_ratios_batch(np.zeros((1, len(BS))), np.zeros((1, len(IS))), np.zeros((1, len(CF))))
+        
+        logger.debug(f"✅ 재무비율 계산기 초기화 완료")
+        logger.debug(f"📊 계산 가능한 비율: {len(self.ratio_definitions)}개")
+        
+    @property
+    def _show_cache(self) -> Dict:
+        """fs_data.show() 결과 캐시 {(id(fs_data), statement_type): (fs_data, df)}"""
+        return self._thread_cache('show_cache')
+    
+    @property
+    def _year_col_cache(self) -> Dict:
+        """df별 최신 연도 컬럼 캐시 {id(df): (columns, latest_year_col)}"""
+        return self._thread_cache('year_col_cache')
+    
+    @property
+    def _label_cache(self) -> Dict:
+        """df별 정규화 계정명 캐시 {id(df): (df, label_index)}"""
+        return self._thread_cache('label_cache')
+    
+    def _thread_cache(self, name: str) -> Dict:
+        """현재 스레드의 캐시 dict 반환 (없으면 생성)"""
+        cache = getattr(self._local, name, None)
+        if cache is None:
+            cache = {}
+            setattr(self._local, name, cache)
+        return cache
+    
     def extract_financial_items(self, fs_data, statement_type: str = 'bs') -> Dict[str, float]:
         """
         재무제표에서 주요 계정과목 추출
@@ -83,25 +414,25 @@ class FinancialRatioCalculator:
         
         try:
             # FinancialStatement 객체는 오직 show() 메서드만 사용
-            df = fs_data.show(statement_type)
+            df = self._cached_show(fs_data, statement_type)
             
             # IS 데이터가 None인 경우 CIS (Comprehensive Income Statement) 시도
             if df is None and statement_type == 'is':
                 try:
-                    df = fs_data.show('cis')
+                    df = self._cached_show(fs_data, 'cis')
                     if df is not None:
-                        print(f"✅ IS 데이터를 'cis'에서 발견")
+                        logger.debug(f"✅ IS 데이터를 'cis'에서 발견")
                 except:
                     pass
             
             if df is None:
-                print(f"⚠️ {statement_type.upper()} 데이터가 None")
+                logger.debug(f"⚠️ {statement_type.upper()} 데이터가 None")
                 return {}
             elif hasattr(df, 'empty') and df.empty:
-                print(f"⚠️ {statement_type.upper()} 데이터가 비어있음")
+                logger.debug(f"⚠️ {statement_type.upper()} 데이터가 비어있음")
                 return {}
             elif hasattr(df, '__len__') and len(df) == 0:
-                print(f"⚠️ {statement_type.upper()} 데이터가 비어있음 (길이 0)")
+                logger.debug(f"⚠️ {statement_type.upper()} 데이터가 비어있음 (길이 0)")
                 return {}
             
             # 데이터 형태 정보 출력
@@ -111,171 +442,238 @@ class FinancialRatioCalculator:
                 data_info = f"길이 {len(df)}"
             else:
                 data_info = "unknown"
-            print(f"📊 {statement_type.upper()} 데이터 형태: {data_info}")
+            logger.debug(f"📊 {statement_type.upper()} 데이터 형태: {data_info}")
             
             # 디버깅: 실제 계정과목명들 보기 (처음 5개)
             if hasattr(df, 'columns') and len(df.columns) > 1:
                 if len(df) > 0:
                     label_col = df.columns[1] if len(df.columns) > 1 else df.columns[0]
                     sample_labels = df[label_col].head(5).astype(str).values
-                    print(f"🔍 {statement_type.upper()} 샘플 계정명: {list(sample_labels)}")
+                    logger.debug(f"🔍 {statement_type.upper()} 샘플 계정명: {list(sample_labels)}")
                 else:
-                    print(f"🔍 {statement_type.upper()} 데이터가 비어있음")
+                    logger.debug(f"🔍 {statement_type.upper()} 데이터가 비어있음")
             
             # 최신 연도 데이터 추출 - 가장 최근 연도 사용
-            latest_year_col = None
-            potential_cols = []
-            
-            for col in df.columns:
-                if isinstance(col, tuple) and len(col) > 0:
-                    col_str = str(col[0]) if col[0] else str(col)
-                    # 연도 데이터 컬럼만 선택 (메타데이터 컬럼 제외)
-                    if '20' in col_str and '연결재무제표' in str(col) and col_str not in ['concept_id', 'label_ko', 'label_en']:
-                        potential_cols.append((col, col_str))
-                elif '20' in str(col) and 'concept' not in str(col) and 'label' not in str(col):
-                    potential_cols.append((col, str(col)))
-            
-            # 가장 최신 연도 선택
-            if potential_cols:
-                # 연도 기준으로 정렬 (최신 먼저)
-                potential_cols.sort(key=lambda x: x[1], reverse=True)
-                latest_year_col = potential_cols[0][0]
-                print(f"📅 {statement_type.upper()} 사용 연도 컬럼: {latest_year_col}")
-            else:
-                # 최후의 수단: 숫자 데이터가 있는 컬럼 찾기
-                for col in df.columns[2:]:  # 처음 2개 컬럼은 보통 ID, 계정명
-                    if not df[col].isna().all():
-                        latest_year_col = col
-                        print(f"📅 {statement_type.upper()} 폴백 컬럼 사용: {latest_year_col}")
-                        break
+            latest_year_col = self._find_latest_year_col(df, statement_type)
             
             if latest_year_col is None:
-                print(f"⚠️ {statement_type.upper()}에서 연도 컬럼을 찾을 수 없음")
+                logger.debug(f"⚠️ {statement_type.upper()}에서 연도 컬럼을 찾을 수 없음")
                 return {}
             
             extracted_items = {}
             
-            if statement_type == 'bs':  # 재무상태표
-                # 주요 재무상태표 항목들 매핑
-                item_mappings = {
-                    'total_assets': ['자산총계', '자산 총계', 'Assets', 'Total assets'],
-                    'current_assets': ['유동자산', '유동 자산', 'Current assets'],
-                    'non_current_assets': ['비유동자산', '비유동 자산', 'Non-current assets'],
-                    'total_liabilities': ['부채총계', '부채 총계', 'Liabilities', 'Total liabilities'],
-                    'current_liabilities': ['유동부채', '유동 부채', 'Current liabilities'],
-                    'non_current_liabilities': ['비유동부채', '비유동 부채', 'Non-current liabilities'],
-                    'total_equity': ['자본총계', '자본 총계', 'Equity', 'Total equity'],
-                    'cash_and_equivalents': ['현금및현금성자산', '현금 및 현금성자산', 'Cash and cash equivalents'],
-                    'short_term_investments': ['단기투자자산', '단기 투자자산'],
-                    'trade_receivables': ['매출채권', '매출 채권', 'Trade receivables'],
-                    'inventory': ['재고자산', '재고 자산', 'Inventory'],
-                    'trade_payables': ['매입채무', '매입 채무', 'Trade payables'],
-                    'short_term_debt': ['단기차입금', '단기 차입금'],
-                    'long_term_debt': ['장기차입금', '장기 차입금']
-                }
-                
-            elif statement_type == 'is':  # 손익계산서
-                item_mappings = {
-                    'revenue': ['매출액', '매출', '수익', '영업수익', 'Revenue', 'Sales'],
-                    'gross_profit': ['매출총이익', '매출 총이익', '총이익', 'Gross profit'],
-                    'operating_profit': ['영업이익', '영업 이익', '영업손익', 'Operating profit'],
-                    'ebit': ['세전이익', '세전 이익', '법인세비용차감전순이익', 'EBIT'],
-                    'net_income': ['당기순이익', '당기 순이익', '순이익', '당기손익', 'Net income'],
-                    'interest_expense': ['금융비용', '이자비용', '이자', 'Interest expense'],
-                    'cost_of_sales': ['매출원가', '매출 원가', '원가', 'Cost of sales']
-                }
-                
-            elif statement_type == 'cf':  # 현금흐름표
-                item_mappings = {
-                    'operating_cash_flow': ['영업활동으로 인한 현금흐름', '영업활동', '영업현금', '영업활동현금흐름'],
-                    'investing_cash_flow': ['투자활동으로 인한 현금흐름', '투자활동', '투자현금', '투자활동현금흐름'],
-                    'financing_cash_flow': ['재무활동으로 인한 현금흐름', '재무활동', '재무현금', '재무활동현금흐름']
-                }
+            # 주요 계정과목 매핑 (모듈 상수, 정규화된 이름)
+            item_mappings = _ITEM_MAPPINGS_NORM[statement_type]
             
-            # 계정과목 매칭 및 값 추출
+            # 계정과목 매칭 및 값 추출 (정규화된 계정명 인덱스는 한 번만 생성)
+            label_index = self._build_label_index(df)
+            values = self._numeric_column(df, latest_year_col)
+            name_rows = self._scan_labels(label_index, statement_type)
             for item_key, possible_names in item_mappings.items():
-                value = self._find_account_value(df, possible_names, latest_year_col)
+                value = self._find_account_value(df, possible_names, latest_year_col, label_index, values, name_rows)
                 if value is not None:
                     extracted_items[item_key] = value
             
-            print(f"✅ {statement_type.upper()}에서 {len(extracted_items)}개 항목 추출")
+            logger.debug(f"✅ {statement_type.upper()}에서 {len(extracted_items)}개 항목 추출")
             return extracted_items
             
         except Exception as e:
-            print(f"❌ {statement_type.upper()} 항목 추출 실패: {e}")
-            print(f"📋 fs_data 타입: {type(fs_data)}")
+            logger.warning(f"❌ {statement_type.upper()} 항목 추출 실패: {e}")
+            logger.debug(f"📋 fs_data 타입: {type(fs_data)}")
             if hasattr(fs_data, '__dict__'):
-                print(f"📋 fs_data 속성: {list(fs_data.__dict__.keys())[:5]}")
+                logger.debug(f"📋 fs_data 속성: {list(fs_data.__dict__.keys())[:5]}")
             return {}
     
-    def _find_account_value(self, df: pd.DataFrame, possible_names: List[str], target_col) -> Optional[float]:
+    def _cached_show(self, fs_data, statement_type: str):
+        """
+        fs_data.show() 결과 캐시 (XBRL/Excel 재구성 비용 절감)
         """
-        가능한 계정과목명들로부터 값을 찾아 반환
+        key = (id(fs_data), statement_type)
+        cached = self._show_cache.get(key)
+        if cached is None or cached[0] is not fs_data:
+            with self._show_semaphore:
+                cached = (fs_data, fs_data.show(statement_type))
+            self._show_cache[key] = cached
+        return cached[1]
+    
+    def _find_latest_year_col(self, df: pd.DataFrame, statement_type: str):
         """
+        가장 최근 연도 컬럼 탐색 (컬럼 객체 기준 캐시)
+        """
+        cached = self._year_col_cache.get(id(df))
+        if cached is not None and cached[0] is df.columns:
+            return cached[1]
+        
+        columns = df.columns
+        is_tuple = np.fromiter((isinstance(c, tuple) and len(c) > 0 for c in columns), dtype=bool, count=len(columns))
+        top = np.array([(str(c[0]) if c[0] else str(c)) if t else str(c) for c, t in zip(columns, is_tuple)], dtype=str)
+        full = np.array([str(c) for c in columns], dtype=str)
+        
+        # 연도 데이터 컬럼만 선택 (메타데이터 컬럼 제외)
+        has_year = np.char.find(top, '20') >= 0
+        tuple_ok = (np.char.find(full, '연결재무제표') >= 0) & ~np.isin(top, ['concept_id', 'label_ko', 'label_en'])
+        flat_ok = (np.char.find(full, 'concept') < 0) & (np.char.find(full, 'label') < 0)
+        candidates = np.flatnonzero(has_year & np.where(is_tuple, tuple_ok, flat_ok))
+        
+        latest_year_col = None
+        if len(candidates):
+            # 가장 최신 연도 선택 (문자열 최대값, 동률이면 앞쪽 컬럼)
+            cand_top = top[candidates]
+            latest_year_col = columns[candidates[np.flatnonzero(cand_top == np.sort(cand_top)[-1])[0]]]
+            logger.debug(f"📅 {statement_type.upper()} 사용 연도 컬럼: {latest_year_col}")
+        else:
+            # 최후의 수단: 숫자 데이터가 있는 컬럼 찾기 (처음 2개 컬럼은 보통 ID, 계정명)
+            has_data = df.iloc[:, 2:].notna().any(axis=0).to_numpy()
+            if has_data.any():
+                latest_year_col = columns[2 + int(has_data.argmax())]
+                logger.debug(f"📅 {statement_type.upper()} 폴백 컬럼 사용: {latest_year_col}")
+        
+        self._year_col_cache[id(df)] = (df.columns, latest_year_col)
+        return latest_year_col
+    
+    def _scan_labels(self, label_index: Dict[str, int], scan_key) -> Dict[str, List[int]]:
+        """
+        매핑 후보명별로 해당 이름을 포함하는 행 위치 목록 생성 {후보명: [행 위치, ...]}
+        """
+        name_rows = {}
+        automaton = self._automata.get(scan_key)
+        if automaton is not None:
+            # 오토마톤으로 계정명을 한 번만 훑음
+            for label, row_idx in label_index.items():
+                for name in {name for _, name in automaton.iter(label)}:
+                    name_rows.setdefault(name, []).append(row_idx)
+            return name_rows
+        
+        # 폴백: 미리 컴파일한 선택 정규식으로 후보명을 하나라도 포함하는 계정명만 골라낸 뒤 확인
+        pattern = _SCAN_PATTERNS[scan_key]
+        names = _SCAN_NAMES[scan_key]
+        for label, row_idx in label_index.items():
+            if pattern.search(label) is None:
+                continue
+            for name in names:
+                if name in label:
+                    name_rows.setdefault(name, []).append(row_idx)
+        return name_rows
+    
+    @staticmethod
+    def _resolve_column_index(df: pd.DataFrame, col) -> int:
+        """컬럼 키를 정수 위치로 변환 (중복/부분 키는 첫 번째 위치 사용)"""
+        loc = df.columns.get_loc(col)
+        if isinstance(loc, slice):
+            return loc.start
+        if not isinstance(loc, (int, np.integer)):
+            return int(np.flatnonzero(loc)[0])
+        return int(loc)
+    
+    def _build_label_index(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        정규화된 계정과목명 -> 첫 번째 행 위치 dict 생성 (df별 캐시)
+        """
+        cached = self._label_cache.get(id(df))
+        if cached is not None and cached[0] is df:
+            return cached[1]
         
         # label_ko 컬럼에서 검색
         if 'label_ko' in df.columns:
-            label_col = df.columns[df.columns.get_loc('label_ko')]
+            label_idx = self._resolve_column_index(df, 'label_ko')
         else:
             # 두 번째 컬럼이 보통 계정과목명
-            label_col = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            label_idx = 1 if len(df.columns) > 1 else 0
         
-        for name in possible_names:
-            # 정확한 매칭 우선 시도
-            exact_mask = df[label_col].astype(str) == name
-            exact_matches = df[exact_mask]
-            
-            if not exact_matches.empty:
-                try:
-                    value = exact_matches.iloc[0][target_col]
-                    if pd.notna(value) and value != 'N/A':
-                        str_val = str(value).replace(',', '').replace(' ', '')
-                        # 음수 처리
-                        if str_val.startswith('(') and str_val.endswith(')'):
-                            str_val = '-' + str_val[1:-1]
-                        if str_val.replace('-', '').replace('.', '').isdigit():
-                            return float(str_val)
-                except Exception as e:
-                    print(f"🔍 값 변환 실패 ({name}): {value} -> {e}")
-                    continue
-            
-            # 부분 매칭 시도
-            partial_mask = df[label_col].astype(str).str.contains(name, na=False)
-            partial_matches = df[partial_mask]
-            
-            if not partial_matches.empty:
-                try:
-                    value = partial_matches.iloc[0][target_col]
-                    if pd.notna(value) and value != 'N/A':
-                        str_val = str(value).replace(',', '').replace(' ', '')
-                        # 음수 처리
-                        if str_val.startswith('(') and str_val.endswith(')'):
-                            str_val = '-' + str_val[1:-1]
-                        if str_val.replace('-', '').replace('.', '').isdigit():
-                            return float(str_val)
-                except Exception as e:
-                    print(f"🔍 값 변환 실패 ({name}): {value} -> {e}")
-                    continue
+        # 계정명 컬럼 전체를 한 번에 정규화하고 중복 라벨은 첫 번째 행만 유지
+        labels = pd.Series(df.iloc[:, label_idx].to_numpy(dtype=object).astype(str), dtype=object)
+        labels_norm = labels.str.replace(r'\s+', '', regex=True).to_numpy(dtype=str)
+        codes, uniques = pd.factorize(labels_norm)
+        _, first_rows = np.unique(codes, return_index=True)
+        label_index = dict(zip(uniques.tolist(), first_rows.tolist()))
+        
+        self._label_cache[id(df)] = (df, label_index)
+        return label_index
+    
+    @staticmethod
+    def _to_float(value) -> Optional[float]:
+        """
+        단일 셀 값을 float로 변환 (숫자형은 바로 반환, 문자열은 쉼표/괄호 음수 처리, 변환 불가 시 None)
+        """
+        if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            return float(value) if math.isfinite(value) else None
+        if isinstance(value, str):
+            str_val = value.replace(',', '').replace(' ', '')
+            # 음수 처리
+            if str_val.startswith('(') and str_val.endswith(')'):
+                str_val = '-' + str_val[1:-1]
+            try:
+                num = float(str_val)
+            except ValueError:
+                return None
+            return num if math.isfinite(num) else None
+        return None
+    
+    def _numeric_column(self, df: pd.DataFrame, target_col) -> np.ndarray:
+        """
+        대상 컬럼 전체를 한 번에 숫자로 변환 (쉼표/공백 제거, 괄호 음수 처리, 변환 불가 시 NaN)
+        """
+        text = (df.iloc[:, self._resolve_column_index(df, target_col)]
+                .astype(str)
+                .str.replace(r'[,\s]', '', regex=True)
+                .str.replace(r'^\((.*)\)$', r'-\1', regex=True))
+        return pd.to_numeric(text, errors='coerce').to_numpy(dtype=np.float64)
+    
+    def _find_account_value(self, df: pd.DataFrame, possible_names: List[str], target_col,
+                            label_index: Optional[Dict[str, int]] = None,
+                            values: Optional[np.ndarray] = None,
+                            name_rows: Optional[Dict[str, List[int]]] = None) -> Optional[float]:
+        """
+        가능한 계정과목명들로부터 값을 찾아 반환 (possible_names는 normalize_label로 정규화된 이름)
+        """
+        if label_index is None:
+            label_index = self._build_label_index(df)
+        if values is None:
+            values = self._numeric_column(df, target_col)
+        
+        for name_norm in possible_names:
+            # 정확한 매칭 우선 시도 (dict 조회)
+            row_idx = label_index.get(name_norm)
+            if row_idx is not None and np.isfinite(values[row_idx]):
+                return float(values[row_idx])
+            
+            # 부분 매칭 시도 (계정명을 포함하는 첫 번째 행만 사용, 값이 없으면 다음 후보명)
+            if name_rows is not None:
+                rows = name_rows.get(name_norm, ())
+            else:
+                rows = (row_idx for label, row_idx in label_index.items() if name_norm in label)
+            row_idx = next(iter(rows), None)
+            if row_idx is not None and np.isfinite(values[row_idx]):
+                return float(values[row_idx])
         
         return None
     
-    def _find_account_value_enhanced(self, df: pd.DataFrame, possible_names: List[str], target_col) -> Optional[float]:
+    def _find_account_value_enhanced(self, df: pd.DataFrame, possible_names: List[str], target_col,
+                                     label_index: Optional[Dict[str, int]] = None,
+                                     values: Optional[np.ndarray] = None,
+                                     names_norm: Optional[Tuple[str, ...]] = None,
+                                     name_rows: Optional[Dict[str, List[int]]] = None) -> Optional[float]:
         """
         향상된 계정과목 값 찾기 메서드 (부분 매칭 개선)
         """
+        if names_norm is None:
+            names_norm = tuple(normalize_label(n) for n in possible_names)
         
         # 먼저 기존 방법 시도
-        result = self._find_account_value(df, possible_names, target_col)
+        result = self._find_account_value(df, names_norm, target_col, label_index, values, name_rows)
         if result is not None:
             return result
         
-        # label_ko 컬럼에서 검색
-        if 'label_ko' in df.columns:
-            label_col = 'label_ko'
-        elif len(df.columns) > 1:
-            label_col = df.columns[1]
-        else:
-            label_col = df.columns[0]
+        # label_ko 컬럼에서 검색 (행/열 모두 정수 위치로 접근)
+        try:
+            if 'label_ko' in df.columns:
+                label_idx = self._resolve_column_index(df, 'label_ko')
+            else:
+                label_idx = 1 if len(df.columns) > 1 else 0
+            target_idx = self._resolve_column_index(df, target_col)
+            labels = df.iloc[:, label_idx].astype(str)
+        except Exception:
+            return None
         
         # 더 유연한 매칭 시도
         for name in possible_names:
@@ -284,19 +682,14 @@ class FinancialRatioCalculator:
             for keyword in keywords:
                 if len(keyword) >= 2:  # 2글자 이상 키워드만
                     try:
-                        mask = df[label_col].astype(str).str.contains(keyword, na=False, case=False)
-                        matches = df[mask]
+                        hits = np.flatnonzero(labels.str.contains(keyword, na=False, case=False).to_numpy())
                         
-                        if not matches.empty:
-                            value = matches.iloc[0][target_col]
-                            if pd.notna(value) and value != 'N/A':
-                                str_val = str(value).replace(',', '').replace(' ', '')
-                                if str_val.startswith('(') and str_val.endswith(')'):
-                                    str_val = '-' + str_val[1:-1]
-                                if str_val.replace('-', '').replace('.', '').isdigit():
-                                    print(f"🔍 키워드 매칭 성공: '{keyword}' -> {name}")
-                                    return float(str_val)
-                    except Exception as e:
+                        if len(hits):
+                            value = self._to_float(df.iat[hits[0], target_idx])
+                            if value is not None:
+                                logger.debug(f"🔍 키워드 매칭 성공: '{keyword}' -> {name}")
+                                return value
+                    except Exception:
                         continue
         
         return None
@@ -312,15 +705,9 @@ class FinancialRatioCalculator:
             numeric_values = []
             for _, row in df.iterrows():
                 try:
-                    value = row.get('value', None)
-                    if pd.notna(value) and value != 'N/A':
-                        str_val = str(value).replace(',', '').replace(' ', '')
-                        if str_val.startswith('(') and str_val.endswith(')'):
-                            str_val = '-' + str_val[1:-1]
-                        if str_val.replace('-', '').replace('.', '').isdigit():
-                            numeric_val = float(str_val)
-                            if abs(numeric_val) > 1000:  # 천원 이상만
-                                numeric_values.append((abs(numeric_val), numeric_val, row))
+                    numeric_val = self._to_float(row.get('value', None))
+                    if numeric_val is not None and abs(numeric_val) > 1000:  # 천원 이상만
+                        numeric_values.append((abs(numeric_val), numeric_val, row))
                 except:
                     continue
             
@@ -341,7 +728,7 @@ class FinancialRatioCalculator:
                     extracted_items['total_liabilities'] = numeric_values[1][1]
                     extracted_items['total_equity'] = numeric_values[0][1] - numeric_values[1][1]
                 
-                print(f"🔧 [ALT EXTRACT] BS 대체 추출: 자산={extracted_items['total_assets']:,.0f}, 부채={extracted_items['total_liabilities']:,.0f}")
+                logger.debug(f"🔧 [ALT EXTRACT] BS 대체 추출: 자산={extracted_items['total_assets']:,.0f}, 부채={extracted_items['total_liabilities']:,.0f}")
                 
             elif statement_type == 'is' and len(numeric_values) >= 1:
                 # 가장 큰 값을 매출액으로 추정
@@ -349,12 +736,12 @@ class FinancialRatioCalculator:
                 if len(numeric_values) >= 2:
                     extracted_items['net_income'] = numeric_values[-1][1]  # 가장 작은 값을 순이익으로
                 
-                print(f"🔧 [ALT EXTRACT] IS 대체 추출: 매출={extracted_items['revenue']:,.0f}")
+                logger.debug(f"🔧 [ALT EXTRACT] IS 대체 추출: 매출={extracted_items['revenue']:,.0f}")
             
             return extracted_items
             
         except Exception as e:
-            print(f"❌ [ALT EXTRACT] 대체 추출 실패: {e}")
+            logger.warning(f"❌ [ALT EXTRACT] 대체 추출 실패: {e}")
             return {}
     
     def _extract_from_cached_dict(self, df: pd.DataFrame, statement_type: str) -> Dict[str, float]:
@@ -364,132 +751,54 @@ class FinancialRatioCalculator:
         try:
             extracted_items = {}
             
-            print(f"🔍 [EXTRACT] Processing {statement_type.upper()} data...")
-            print(f"🔍 [EXTRACT] DataFrame shape: {df.shape}")
-            print(f"🔍 [EXTRACT] DataFrame columns: {list(df.columns)}")
+            logger.debug(f"🔍 [EXTRACT] Processing {statement_type.upper()} data...")
+            logger.debug(f"🔍 [EXTRACT] DataFrame shape: {df.shape}")
+            logger.debug(f"🔍 [EXTRACT] DataFrame columns: {list(df.columns)}")
             
-            # 데이터 샘플 확인
-            if len(df) > 0:
-                print(f"🔍 [EXTRACT] Sample rows (first 3):")
+            # 데이터 샘플 확인 (DEBUG 레벨일 때만 행 dict 생성)
+            if len(df) > 0 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 [EXTRACT] Sample rows (first 3):")
                 for i in range(min(3, len(df))):
                     row = df.iloc[i]
-                    print(f"  Row {i}: {dict(row)}")
+                    logger.debug(f"  Row {i}: {dict(row)}")
             
-            if statement_type == 'bs':  # 재무상태표
-                item_mappings = {
-                    'total_assets': [
-                        '자산총계', '자산 총계', '자산총액', 'Assets', 'Total assets',
-                        '자산의 총계', '총자산', '자산계', '자산 계'
-                    ],
-                    'current_assets': [
-                        '유동자산', '유동 자산', 'Current assets', '당좌자산',
-                        '유동성자산', '단기자산'
-                    ],
-                    'non_current_assets': [
-                        '비유동자산', '비유동 자산', '고정자산', 'Non-current assets',
-                        '장기자산', '비유동성자산'
-                    ],
-                    'total_liabilities': [
-                        '부채총계', '부채 총계', '부채총액', 'Liabilities', 'Total liabilities',
-                        '부채의 총계', '총부채', '부채계', '부채 계'
-                    ],
-                    'current_liabilities': [
-                        '유동부채', '유동 부채', 'Current liabilities', '단기부채',
-                        '유동성부채', '1년이내만기부채'
-                    ],
-                    'non_current_liabilities': [
-                        '비유동부채', '비유동 부채', '고정부채', 'Non-current liabilities',
-                        '장기부채', '비유동성부채'
-                    ],
-                    'total_equity': [
-                        '자본총계', '자본 총계', '자본총액', 'Equity', 'Total equity',
-                        '자본의 총계', '총자본', '자본계', '자본 계', '자기자본',
-                        '주주지분', '소유주지분'
-                    ],
-                    'cash_and_equivalents': [
-                        '현금및현금성자산', '현금 및 현금성자산', 'Cash and cash equivalents',
-                        '현금', '현금성자산', '현금 및 현금등가물'
-                    ]
-                }
-                
-            elif statement_type == 'is':  # 손익계산서
-                item_mappings = {
-                    'revenue': [
-                        '매출액', '매출', '수익', '영업수익', 'Revenue', 'Sales',
-                        '총매출액', '총수익', '영업매출액', '매출 수익'
-                    ],
-                    'gross_profit': [
-                        '매출총이익', '매출 총이익', '총이익', 'Gross profit',
-                        '매출총손익', '총손익'
-                    ],
-                    'operating_profit': [
-                        '영업이익', '영업 이익', '영업손익', 'Operating profit',
-                        '영업수익', '영업수지'
-                    ],
-                    'ebit': [
-                        '세전이익', '세전 이익', '법인세비용차감전순이익', 'EBIT',
-                        '세전손익', '법인세차감전이익'
-                    ],
-                    'net_income': [
-                        '당기순이익', '당기 순이익', '순이익', '당기손익', 'Net income',
-                        '총손익', '당기총손익', '최종손익'
-                    ],
-                    'interest_expense': [
-                        '금융비용', '이자비용', '이자', 'Interest expense',
-                        '금융원가', '이자비용 및 할인료'
-                    ],
-                    'cost_of_sales': [
-                        '매출원가', '매출 원가', '원가', 'Cost of sales',
-                        '제품매출원가', '상품매출원가'
-                    ]
-                }
-                
-            elif statement_type == 'cf':  # 현금흐름표
-                item_mappings = {
-                    'operating_cash_flow': [
-                        '영업활동으로 인한 현금흐름', '영업활동', '영업현금', '영업활동현금흐름',
-                        '영업활동 현금흐름', '영업활동으로부터의 현금흐름'
-                    ],
-                    'investing_cash_flow': [
-                        '투자활동으로 인한 현금흐름', '투자활동', '투자현금', '투자활동현금흐름',
-                        '투자활동 현금흐름', '투자활동으로부터의 현금흐름'
-                    ],
-                    'financing_cash_flow': [
-                        '재무활동으로 인한 현금흐름', '재무활동', '재무현금', '재무활동현금흐름',
-                        '재무활동 현금흐름', '재무활동으로부터의 현금흐름'
-                    ]
-                }
+            item_mappings = _CACHED_ITEM_MAPPINGS[statement_type]
+            mappings_norm = _CACHED_ITEM_MAPPINGS_NORM[statement_type]
             
             # 계정과목 매칭 및 값 추출 (개선된 매칭 로직)
+            label_index = self._build_label_index(df)
+            values = self._numeric_column(df, 'value')
+            name_rows = self._scan_labels(label_index, ('cached', statement_type))
             for item_key, possible_names in item_mappings.items():
-                value = self._find_account_value_enhanced(df, possible_names, 'value')
+                value = self._find_account_value_enhanced(df, possible_names, 'value', label_index, values,
+                                                          mappings_norm[item_key], name_rows)
                 if value is not None:
                     extracted_items[item_key] = value
-                    print(f"  ✅ {statement_type.upper()} 매칭: {item_key} = {value:,.0f}")
+                    logger.debug(f"  ✅ {statement_type.upper()} 매칭: {item_key} = {value:,.0f}")
                 else:
-                    print(f"  ❌ {statement_type.upper()} 매칭 실패: {item_key}")
+                    logger.debug(f"  ❌ {statement_type.upper()} 매칭 실패: {item_key}")
             
-            print(f"🔧 {statement_type.upper()} 캐시에서 {len(extracted_items)}개 표준 항목 추출")
+            logger.debug(f"🔧 {statement_type.upper()} 캐시에서 {len(extracted_items)}개 표준 항목 추출")
             
             # 매칭 실패시 숫자 인덱스 기반 대체 방법 시도
             if len(extracted_items) == 0:
-                print(f"⚠️ [EXTRACT] No items matched, trying numeric index extraction...")
+                logger.debug(f"⚠️ [EXTRACT] No items matched, trying numeric index extraction...")
                 
                 # 🔍 DART 캐시 데이터는 label_ko가 숫자 인덱스로 저장됨을 확인
                 if 'label_ko' in df.columns:
                     unique_labels = df['label_ko'].unique()[:10]  # 처음 10개만 확인
-                    print(f"🔍 [DEBUG] label_ko 샘플: {unique_labels}")
+                    logger.debug(f"🔍 [DEBUG] label_ko 샘플: {unique_labels}")
                     if all(isinstance(label, (int, float)) for label in unique_labels):
-                        print(f"✅ [DEBUG] DART 캐시 데이터 확인: 숫자 인덱스 형태로 저장됨")
+                        logger.debug(f"✅ [DEBUG] DART 캐시 데이터 확인: 숫자 인덱스 형태로 저장됨")
                 
                 extracted_items = self._extract_by_numeric_index(df, statement_type)
                 
             return extracted_items
             
         except Exception as e:
-            print(f"❌ {statement_type.upper()} 캐시 데이터 추출 실패: {e}")
+            logger.warning(f"❌ {statement_type.upper()} 캐시 데이터 추출 실패: {e}")
             import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
+            logger.debug(f"❌ Traceback: {traceback.format_exc()}")
             return {}
     
     def _extract_by_numeric_index(self, df: pd.DataFrame, statement_type: str) -> Dict[str, float]:
@@ -505,7 +814,7 @@ class FinancialRatioCalculator:
         """
         extracted_items = {}
         
-        print(f"🔧 [NUMERIC_EXTRACT] Processing {statement_type.upper()} with numeric indices...")
+        logger.debug(f"🔧 [NUMERIC_EXTRACT] Processing {statement_type.upper()} with numeric indices...")
         
         # 🔧 DART 재무제표 숫자 인덱스 기반 매핑 (경험적 추정)
         # 실제 DART 데이터 순서는 회사별/년도별로 다를 수 있으므로 유연한 접근
@@ -577,10 +886,18 @@ class FinancialRatioCalculator:
         
         # 실제 가용한 인덱스 확인
         try:
-            available_indices = set(pd.to_numeric(df['label_ko'], errors='coerce').dropna().astype(int).tolist())
-            print(f"🔍 [NUMERIC_EXTRACT] 가용 인덱스: {sorted(list(available_indices))[:10]}...")
+            label_nums = pd.to_numeric(df['label_ko'], errors='coerce')
+            available_indices = set(label_nums.dropna().astype(int).tolist())
+            value_idx = self._resolve_column_index(df, 'value')
+            # 인덱스 -> 해당 인덱스를 가진 첫 번째 행 위치 (정수 라벨만)
+            label_arr = label_nums.to_numpy(dtype=float)
+            integral = np.flatnonzero(np.isfinite(label_arr) & (label_arr == np.floor(label_arr)))
+            first_row = {}
+            for pos, num in zip(integral.tolist(), label_arr[integral].tolist()):
+                first_row.setdefault(int(num), pos)
+            logger.debug(f"🔍 [NUMERIC_EXTRACT] 가용 인덱스: {sorted(list(available_indices))[:10]}...")
         except Exception as e:
-            print(f"❌ [NUMERIC_EXTRACT] 인덱스 변환 실패: {e}")
+            logger.warning(f"❌ [NUMERIC_EXTRACT] 인덱스 변환 실패: {e}")
             return extracted_items
         
         # 각 표준 항목에 대해 매칭 시도
@@ -592,14 +909,14 @@ class FinancialRatioCalculator:
             for idx in index_info['primary']:
                 if idx in available_indices:
                     try:
-                        row = df[pd.to_numeric(df['label_ko'], errors='coerce') == idx]
-                        if not row.empty:
-                            candidate_value = row.iloc[0]['value']
-                            if pd.notna(candidate_value) and candidate_value != 0:
-                                value = float(candidate_value)
+                        pos = first_row.get(idx)
+                        if pos is not None:
+                            candidate_value = self._to_float(df.iat[pos, value_idx])
+                            if candidate_value is not None and candidate_value != 0:
+                                value = candidate_value
                                 matched_index = idx
                                 break
-                    except Exception as e:
+                    except Exception:
                         continue
             
             # 2차: primary에서 못 찾았으면 fallback에서 최대값 찾기 (자산/부채/자본의 경우)
@@ -608,13 +925,13 @@ class FinancialRatioCalculator:
                 for idx in index_info['fallback']:
                     if idx in available_indices:
                         try:
-                            row = df[pd.to_numeric(df['label_ko'], errors='coerce') == idx]
-                            if not row.empty:
-                                candidate_value = row.iloc[0]['value']
-                                if pd.notna(candidate_value) and candidate_value > max_value:
+                            pos = first_row.get(idx)
+                            if pos is not None:
+                                candidate_value = self._to_float(df.iat[pos, value_idx])
+                                if candidate_value is not None and candidate_value > max_value:
                                     max_value = candidate_value
                                     matched_index = idx
-                        except Exception as e:
+                        except Exception:
                             continue
                 
                 if max_value > 0:
@@ -622,9 +939,9 @@ class FinancialRatioCalculator:
             
             if value is not None:
                 extracted_items[standard_item] = value
-                print(f"  ✅ {standard_item} = 인덱스[{matched_index}]: {value:,.0f}")
+                logger.debug(f"  ✅ {standard_item} = 인덱스[{matched_index}]: {value:,.0f}")
         
-        print(f"🔧 [NUMERIC_EXTRACT] {statement_type.upper()}에서 {len(extracted_items)}개 항목 추출")
+        logger.debug(f"🔧 [NUMERIC_EXTRACT] {statement_type.upper()}에서 {len(extracted_items)}개 항목 추출")
         return extracted_items
     
     def calculate_financial_ratios(self, bs_items: Dict[str, float], 
@@ -644,8 +961,8 @@ class FinancialRatioCalculator:
         
         ratios = {}
         
-        print(f"🔢 [RATIO CALC] Starting ratio calculation...")
-        print(f"📊 [RATIO CALC] Input data: BS={len(bs_items)}, IS={len(is_items)}, CF={len(cf_items)}")
+        logger.debug(f"🔢 [RATIO CALC] Starting ratio calculation...")
+        logger.debug(f"📊 [RATIO CALC] Input data: BS={len(bs_items)}, IS={len(is_items)}, CF={len(cf_items)}")
         
         # 항공업계 평균값 (fallback 용도)
         airline_industry_defaults = {
@@ -666,115 +983,29 @@ class FinancialRatioCalculator:
             bs_items = self._validate_and_estimate_missing_items(bs_items, 'bs')
             is_items = self._validate_and_estimate_missing_items(is_items, 'is')
             
-            # 1. 부채비율 (Debt to Assets)
-            debt_to_assets = self._safe_ratio_calc(
-                bs_items.get('total_liabilities'),
-                bs_items.get('total_assets'),
-                'debt_to_assets',
-                airline_industry_defaults['debt_to_assets']
-            )
-            if debt_to_assets is not None:
-                ratios['debt_to_assets'] = debt_to_assets
-            
-            # 2. 유동비율 (Current Ratio)
-            current_ratio = self._safe_ratio_calc(
-                bs_items.get('current_assets'),
-                bs_items.get('current_liabilities'),
-                'current_ratio', 
-                airline_industry_defaults['current_ratio']
-            )
-            if current_ratio is not None:
-                ratios['current_ratio'] = current_ratio
-            
-            # 3. 총자산수익률 (ROA)
-            roa = self._safe_ratio_calc(
-                is_items.get('net_income'),
-                bs_items.get('total_assets'),
-                'roa',
-                airline_industry_defaults['roa']
-            )
-            if roa is not None:
-                ratios['roa'] = roa
-            
-            # 4. 자기자본수익률 (ROE)
-            roe = self._safe_ratio_calc(
-                is_items.get('net_income'),
-                bs_items.get('total_equity'),
-                'roe',
-                airline_industry_defaults['roe']
-            )
-            if roe is not None:
-                ratios['roe'] = roe
-            
-            # 5. 영업이익률 (Operating Margin)
-            operating_margin = self._safe_ratio_calc(
-                is_items.get('operating_profit'),
-                is_items.get('revenue'),
-                'operating_margin',
-                airline_industry_defaults['operating_margin']
-            )
-            if operating_margin is not None:
-                ratios['operating_margin'] = operating_margin
-            
-            # 6. 자기자본비율 (Equity Ratio)
-            equity_ratio = self._safe_ratio_calc(
-                bs_items.get('total_equity'),
-                bs_items.get('total_assets'),
-                'equity_ratio',
-                airline_industry_defaults['equity_ratio']
-            )
-            if equity_ratio is not None:
-                ratios['equity_ratio'] = equity_ratio
-            
-            # 7. 총자산회전율 (Asset Turnover)
-            asset_turnover = self._safe_ratio_calc(
-                is_items.get('revenue'),
-                bs_items.get('total_assets'),
-                'asset_turnover',
-                airline_industry_defaults['asset_turnover']
-            )
-            if asset_turnover is not None:
-                ratios['asset_turnover'] = asset_turnover
-            
-            # 8. 이자보상배율 (Interest Coverage)
-            interest_coverage = self._safe_ratio_calc(
-                is_items.get('operating_profit'),
-                is_items.get('interest_expense'),
-                'interest_coverage',
-                airline_industry_defaults['interest_coverage'],
-                check_denominator_positive=True
-            )
-            if interest_coverage is not None:
-                ratios['interest_coverage'] = interest_coverage
-            
-            # 9. 당좌비율 (Quick Ratio)
-            quick_assets = (bs_items.get('cash_and_equivalents', 0) + 
-                          bs_items.get('short_term_investments', 0) + 
-                          bs_items.get('trade_receivables', 0))
-            
-            quick_ratio = self._safe_ratio_calc(
-                quick_assets if quick_assets > 0 else None,
-                bs_items.get('current_liabilities'),
-                'quick_ratio',
-                airline_industry_defaults['quick_ratio']
-            )
-            if quick_ratio is not None:
-                ratios['quick_ratio'] = quick_ratio
-            
-            # 10. 운전자본비율 (Working Capital Ratio)
-            if (bs_items.get('current_assets') is not None and 
-                bs_items.get('current_liabilities') is not None and 
-                bs_items.get('total_assets') is not None):
-                
-                working_capital = bs_items['current_assets'] - bs_items['current_liabilities']
-                working_capital_ratio = self._safe_ratio_calc(
-                    working_capital,
-                    bs_items['total_assets'],
-                    'working_capital_ratio',
-                    airline_industry_defaults['working_capital_ratio']
-                )
-                if working_capital_ratio is not None:
-                    ratios['working_capital_ratio'] = working_capital_ratio
+            # 고정 열 순서로 패킹 (누락 항목은 NaN)하여 배치 계산 (1개 행)
+            bs_row = pack_items(bs_items, BS)
+            computed = self.calculate_financial_ratios_batch(
+                bs_row[None, :],
+                pack_items(is_items, IS)[None, :],
+                pack_items(cf_items, CF)[None, :]
+            )[0]
+            computed[~np.isfinite(computed)] = np.nan
+            
+            # 운전자본비율은 유동자산/유동부채/총자산이 모두 있을 때만 포함
+            has_working_capital = not np.isnan(
+                bs_row[[BS.CURRENT_ASSETS, BS.CURRENT_LIABILITIES, BS.TOTAL_ASSETS]]
+            ).any()
+            
+            for ratio_name, value in zip(COMPUTED_RATIOS, computed):
+                if np.isnan(value):
+                    if ratio_name == 'working_capital_ratio' and not has_working_capital:
+                        continue
+                    ratios[ratio_name] = airline_industry_defaults[ratio_name]
+                    logger.debug(f"  ⚠️ {ratio_name}: not computable, using default={ratios[ratio_name]}")
+                else:
+                    ratios[ratio_name] = float(value)
+                    logger.debug(f"  ✅ {ratio_name} = {value:.4f}")
             
             # 나머지 비율들은 기본값으로 설정
             additional_ratios = {
@@ -792,46 +1023,78 @@ class FinancialRatioCalculator:
             
             ratios.update(additional_ratios)
             
-            # 계산된 비율 수 확인
-            calculated_count = sum(1 for v in ratios.values() if not pd.isna(v))
-            print(f"✅ {calculated_count}개 재무비율 계산 완료")
+            # 계산된 비율 수 확인 (디버그 로그가 꺼져 있으면 집계 생략)
+            if logger.isEnabledFor(logging.DEBUG):
+                vals = np.fromiter(ratios.values(), dtype=np.float64, count=len(ratios))
+                calculated_count = int(np.isfinite(vals).sum())
+                logger.debug(f"✅ {calculated_count}개 재무비율 계산 완료")
             
             return ratios
             
         except Exception as e:
-            print(f"❌ 재무비율 계산 실패: {e}")
+            logger.warning(f"❌ 재무비율 계산 실패: {e}")
             import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
-            print(f"📋 bs_items: {len(bs_items) if bs_items else 0}개")
-            print(f"📋 is_items: {len(is_items) if is_items else 0}개") 
-            print(f"📋 cf_items: {len(cf_items) if cf_items else 0}개")
+            logger.debug(f"❌ Traceback: {traceback.format_exc()}")
+            logger.debug(f"📋 bs_items: {len(bs_items) if bs_items else 0}개")
+            logger.debug(f"📋 is_items: {len(is_items) if is_items else 0}개") 
+            logger.debug(f"📋 cf_items: {len(cf_items) if cf_items else 0}개")
             return self._get_default_ratios()  # 실패시 기본값 반환
     
-    def _safe_ratio_calc(self, numerator, denominator, ratio_name: str, 
-                        default_value: float, check_denominator_positive: bool = False) -> Optional[float]:
+    def calculate_financial_ratios_batch(self, bs_arr: np.ndarray, is_arr: np.ndarray,
+                                         cf_arr: np.ndarray) -> np.ndarray:
         """
-        안전한 비율 계산 (0으로 나누기 방지)
+        N개 회사/분기의 핵심 비율 10개를 한 번에 계산
+        
+        Args:
+            bs_arr: 재무상태표 항목 배열 [N, 14] (열 순서는 BS, 누락값은 NaN)
+            is_arr: 손익계산서 항목 배열 [N, 7] (열 순서는 IS)
+            cf_arr: 현금흐름표 항목 배열 [N, 3] (열 순서는 CF)
+        
+        Returns:
+            np.ndarray: [N, 10] 비율 배열 (열 순서는 COMPUTED_RATIOS, 계산 불가 시 NaN)
         """
-        try:
-            if numerator is None or denominator is None:
-                print(f"  ⚠️ {ratio_name}: None values (numerator={numerator}, denominator={denominator}), using default={default_value}")
-                return default_value
-            
-            if denominator == 0:
-                print(f"  ⚠️ {ratio_name}: Zero denominator, using default={default_value}")
-                return default_value
-            
-            if check_denominator_positive and denominator <= 0:
-                print(f"  ⚠️ {ratio_name}: Non-positive denominator ({denominator}), using default={default_value}")
-                return default_value
-            
-            calculated_value = numerator / denominator
-            print(f"  ✅ {ratio_name} = {calculated_value:.4f}")
-            return calculated_value
-            
-        except Exception as e:
-            print(f"  ❌ {ratio_name} calculation error: {e}, using default={default_value}")
-            return default_value
+        bs_arr = np.ascontiguousarray(bs_arr, dtype=np.float64)
+        is_arr = np.ascontiguousarray(is_arr, dtype=np.float64)
+        
+        # 비율은 BS/IS 항목만 사용 -> 둘 다 전부 NaN이면(수집 실패 분기만 있는 배치) 계산 생략
+        if np.isnan(bs_arr).all() and np.isnan(is_arr).all():
+            return np.full((bs_arr.shape[0], len(COMPUTED_RATIOS)), np.nan)
+        
+        if NUMBA_AVAILABLE:
+            cf_arr = np.ascontiguousarray(cf_arr, dtype=np.float64)
+            return compute_ratios_batch(bs_arr, is_arr, cf_arr)
+        
+        # numba 미설치 시 NumPy 벡터 연산으로 계산 (분기 없이 나눈 뒤 비유한값을 NaN 처리)
+        ta = bs_arr[:, BS.TOTAL_ASSETS]
+        ca = bs_arr[:, BS.CURRENT_ASSETS]
+        cl = bs_arr[:, BS.CURRENT_LIABILITIES]
+        te = bs_arr[:, BS.TOTAL_EQUITY]
+        revenue = is_arr[:, IS.REVENUE]
+        op = is_arr[:, IS.OPERATING_PROFIT]
+        ni = is_arr[:, IS.NET_INCOME]
+        interest = is_arr[:, IS.INTEREST_EXPENSE]
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # 당좌자산 = 현금 + 단기투자 + 매출채권 (누락 항목은 0), 양수일 때만 사용
+            quick_assets = np.nansum(bs_arr[:, [BS.CASH_AND_EQUIVALENTS,
+                                                BS.SHORT_TERM_INVESTMENTS,
+                                                BS.TRADE_RECEIVABLES]], axis=1)
+            quick_assets = np.where(quick_assets > 0, quick_assets, np.nan)
+            
+            ratios = np.column_stack([
+                bs_arr[:, BS.TOTAL_LIABILITIES] / ta,                 # debt_to_assets
+                ca / cl,                                               # current_ratio
+                ni / ta,                                               # roa
+                ni / te,                                               # roe
+                op / revenue,                                          # operating_margin
+                te / ta,                                               # equity_ratio
+                revenue / ta,                                          # asset_turnover
+                np.where(interest > 0, op / interest, np.nan),         # interest_coverage
+                quick_assets / cl,                                     # quick_ratio
+                (ca - cl) / ta,                                        # working_capital_ratio
+            ])
+        ratios[~np.isfinite(ratios)] = np.nan
+        return ratios
     
     def _validate_and_estimate_missing_items(self, items: Dict[str, float], statement_type: str) -> Dict[str, float]:
         """
@@ -848,50 +1111,50 @@ class FinancialRatioCalculator:
             # 3개 중 2개가 있으면 나머지 하나 계산
             if total_assets is not None and total_liabilities is not None and total_equity is None:
                 validated_items['total_equity'] = total_assets - total_liabilities
-                print(f"  🔧 [VALIDATE] 추정: total_equity = {validated_items['total_equity']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: total_equity = {validated_items['total_equity']:,.0f}")
             elif total_assets is not None and total_equity is not None and total_liabilities is None:
                 validated_items['total_liabilities'] = total_assets - total_equity
-                print(f"  🔧 [VALIDATE] 추정: total_liabilities = {validated_items['total_liabilities']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: total_liabilities = {validated_items['total_liabilities']:,.0f}")
             elif total_liabilities is not None and total_equity is not None and total_assets is None:
                 validated_items['total_assets'] = total_liabilities + total_equity
-                print(f"  🔧 [VALIDATE] 추정: total_assets = {validated_items['total_assets']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: total_assets = {validated_items['total_assets']:,.0f}")
             
             # 유동자산/비유동자산 추정
             if 'current_assets' not in validated_items and 'total_assets' in validated_items:
                 # 항공업계 평균 유동자산 비율 30% 적용
                 validated_items['current_assets'] = validated_items['total_assets'] * 0.3
-                print(f"  🔧 [VALIDATE] 추정: current_assets = {validated_items['current_assets']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: current_assets = {validated_items['current_assets']:,.0f}")
             
             # 유동부채 추정
             if 'current_liabilities' not in validated_items and 'total_liabilities' in validated_items:
                 # 항공업계 평균 유동부채 비율 25% 적용
                 validated_items['current_liabilities'] = validated_items['total_liabilities'] * 0.25
-                print(f"  🔧 [VALIDATE] 추정: current_liabilities = {validated_items['current_liabilities']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: current_liabilities = {validated_items['current_liabilities']:,.0f}")
         
         elif statement_type == 'is':
             # 매출원가 추정
             if 'cost_of_sales' not in validated_items and 'revenue' in validated_items:
                 # 항공업계 평균 원가율 75% 적용
                 validated_items['cost_of_sales'] = validated_items['revenue'] * 0.75
-                print(f"  🔧 [VALIDATE] 추정: cost_of_sales = {validated_items['cost_of_sales']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: cost_of_sales = {validated_items['cost_of_sales']:,.0f}")
             
             # 매출총이익 추정
             if ('gross_profit' not in validated_items and 
                 'revenue' in validated_items and 'cost_of_sales' in validated_items):
                 validated_items['gross_profit'] = validated_items['revenue'] - validated_items['cost_of_sales']
-                print(f"  🔧 [VALIDATE] 추정: gross_profit = {validated_items['gross_profit']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: gross_profit = {validated_items['gross_profit']:,.0f}")
                 
             # 영업이익 추정
             if 'operating_profit' not in validated_items and 'revenue' in validated_items:
                 # 항공업계 평균 영업이익률 8% 적용
                 validated_items['operating_profit'] = validated_items['revenue'] * 0.08
-                print(f"  🔧 [VALIDATE] 추정: operating_profit = {validated_items['operating_profit']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: operating_profit = {validated_items['operating_profit']:,.0f}")
             
             # 순이익 추정  
             if 'net_income' not in validated_items and 'revenue' in validated_items:
                 # 항공업계 평균 순이익률 3% 적용
                 validated_items['net_income'] = validated_items['revenue'] * 0.03
-                print(f"  🔧 [VALIDATE] 추정: net_income = {validated_items['net_income']:,.0f}")
+                logger.debug(f"  🔧 [VALIDATE] 추정: net_income = {validated_items['net_income']:,.0f}")
         
         return validated_items
     
@@ -933,11 +1196,11 @@ class FinancialRatioCalculator:
             Dict[str, float]: 계산된 모든 재무비율
         """
         
-        print("📊 재무제표 데이터 처리 시작...")
+        logger.debug("📊 재무제표 데이터 처리 시작...")
         
         # 캐시된 dict 데이터인지 확인
         if isinstance(fs_data, dict):
-            print("📦 캐시된 dict 데이터 처리 중...")
+            logger.debug("📦 캐시된 dict 데이터 처리 중...")
             
             # dict에서 원시 재무제표 데이터 추출
             raw_bs_data = fs_data.get('bs_data', {})
@@ -954,7 +1217,7 @@ class FinancialRatioCalculator:
                     elif key == 'cf':
                         raw_cf_data.update(fs_data[key])
             
-            print(f"📦 캐시 데이터: BS={len(raw_bs_data)}, IS={len(raw_is_data)}, CF={len(raw_cf_data)}")
+            logger.debug(f"📦 캐시 데이터: BS={len(raw_bs_data)}, IS={len(raw_is_data)}, CF={len(raw_cf_data)}")
             
             # 🔧 캐시된 데이터를 DataFrame으로 변환하여 extract_financial_items 사용
             bs_items = {}
@@ -963,60 +1226,89 @@ class FinancialRatioCalculator:
             
             if raw_bs_data:
                 # 🔧 실제 캐시 데이터 구조 확인
-                print(f"🔍 BS 샘플 데이터: {list(raw_bs_data.keys())[:5]}")
-                print(f"🔍 BS 샘플 값들:")
-                for i, (key, value) in enumerate(list(raw_bs_data.items())[:3]):
-                    print(f"  🔍 [{key}]: {value} (type: {type(value)})")
-                    if i >= 2:  # 처음 3개만 출력
-                        break
+                logger.debug(f"🔍 BS 샘플 데이터: {list(raw_bs_data.keys())[:5]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔍 BS 샘플 값들:")
+                    for i, (key, value) in enumerate(list(raw_bs_data.items())[:3]):
+                        logger.debug(f"  🔍 [{key}]: {value} (type: {type(value)})")
+                        if i >= 2:  # 처음 3개만 출력
+                            break
                 
                 # Dict를 DataFrame으로 변환하여 extract_financial_items 호출
                 bs_df = pd.DataFrame(list(raw_bs_data.items()), columns=['label_ko', 'value'])
                 bs_items = self._extract_from_cached_dict(bs_df, 'bs')
                 
             if raw_is_data:
-                print(f"🔍 IS 샘플 데이터: {list(raw_is_data.keys())[:5]}")
-                print(f"🔍 IS 샘플 값들:")
-                for i, (key, value) in enumerate(list(raw_is_data.items())[:3]):
-                    print(f"  🔍 [{key}]: {value} (type: {type(value)})")
-                    if i >= 2:
-                        break
+                logger.debug(f"🔍 IS 샘플 데이터: {list(raw_is_data.keys())[:5]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔍 IS 샘플 값들:")
+                    for i, (key, value) in enumerate(list(raw_is_data.items())[:3]):
+                        logger.debug(f"  🔍 [{key}]: {value} (type: {type(value)})")
+                        if i >= 2:
+                            break
                         
                 is_df = pd.DataFrame(list(raw_is_data.items()), columns=['label_ko', 'value'])
                 is_items = self._extract_from_cached_dict(is_df, 'is')
                 
             if raw_cf_data:
-                print(f"🔍 CF 샘플 데이터: {list(raw_cf_data.keys())[:5]}")
-                print(f"🔍 CF 샘플 값들:")
-                for i, (key, value) in enumerate(list(raw_cf_data.items())[:3]):
-                    print(f"  🔍 [{key}]: {value} (type: {type(value)})")
-                    if i >= 2:
-                        break
+                logger.debug(f"🔍 CF 샘플 데이터: {list(raw_cf_data.keys())[:5]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔍 CF 샘플 값들:")
+                    for i, (key, value) in enumerate(list(raw_cf_data.items())[:3]):
+                        logger.debug(f"  🔍 [{key}]: {value} (type: {type(value)})")
+                        if i >= 2:
+                            break
                         
                 cf_df = pd.DataFrame(list(raw_cf_data.items()), columns=['label_ko', 'value'])
                 cf_items = self._extract_from_cached_dict(cf_df, 'cf')
             
-            print(f"🔧 표준화된 항목: BS={len(bs_items)}, IS={len(is_items)}, CF={len(cf_items)}")
+            logger.debug(f"🔧 표준화된 항목: BS={len(bs_items)}, IS={len(is_items)}, CF={len(cf_items)}")
             
         else:
-            print("📊 FinancialStatement 객체 처리 중...")
+            logger.debug("📊 FinancialStatement 객체 처리 중...")
             
             # 1. 재무상태표 항목 추출
             bs_items = self.extract_financial_items(fs_data, 'bs')
-            print(f"📋 재무상태표: {len(bs_items)}개 항목")
+            logger.debug(f"📋 재무상태표: {len(bs_items)}개 항목")
             
             # 2. 손익계산서 항목 추출 (있는 경우)
             is_items = self.extract_financial_items(fs_data, 'is')
-            print(f"📈 손익계산서: {len(is_items)}개 항목")
+            logger.debug(f"📈 손익계산서: {len(is_items)}개 항목")
             
             # 3. 현금흐름표 항목 추출 (있는 경우)
             cf_items = self.extract_financial_items(fs_data, 'cf')
-            print(f"💰 현금흐름표: {len(cf_items)}개 항목")
+            logger.debug(f"💰 현금흐름표: {len(cf_items)}개 항목")
         
         # 4. 재무비율 계산
         ratios = self.calculate_financial_ratios(bs_items, is_items, cf_items)
+        self._show_cache.clear()
+        self._year_col_cache.clear()
+        self._label_cache.clear()
         
         return ratios
+    
+    def process_many(self, fs_list: List[Any], max_workers: Optional[int] = None,
+                     as_records: bool = False):
+        """
+        여러 회사 재무제표를 스레드 풀로 병렬 처리 (show() 조회가 I/O 바운드)
+        
+        Args:
+            fs_list: FinancialStatement 객체 또는 캐시된 dict 데이터 목록
+            max_workers: 최대 스레드 수 (기본값 self.max_workers)
+            as_records: True면 RATIO_DTYPE 구조화 배열로 반환
+        
+        Returns:
+            List[Dict[str, float]] 또는 np.ndarray: 입력 순서대로 계산된 재무비율
+        """
+        fs_list = list(fs_list)
+        n_workers = min(max_workers or self.max_workers, len(fs_list))
+        if n_workers <= 1:
+            results = [self.process_company_financial_data(fs_data) for fs_data in fs_list]
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(self.process_company_financial_data, fs_list))
+        
+        return ratios_to_records(results) if as_records else results
 
 def main():
     """테스트용 메인 함수"""
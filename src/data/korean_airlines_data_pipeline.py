@@ -22,17 +22,61 @@ Output Format:
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import logging
 import time
 import os
+import json
+import hashlib
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 # Configure logging first
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# DART 응답 JSON 디코딩 (orjson 설치 시 사용, 없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+# 분기별 재무제표 parquet 캐시 (선택 사항)
+try:
+    import pyarrow  # noqa: F401  (parquet engine)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 비동기 DART 수집 (선택 사항)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+    _ASYNC_RETRY_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    _ASYNC_RETRY_ERRORS = (asyncio.TimeoutError,)
+
+# Optional JIT compilation for the ratio kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Pure-Python fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Import the new preprocessor
 try:
     from ..core.credit_rating_preprocessor import CreditRatingPreprocessor, PreprocessingConfig
@@ -54,34 +98,274 @@ except ImportError:
             PREPROCESSOR_AVAILABLE = False
             logger.warning("Credit rating preprocessor not available")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AirlineCompany:
-    """Airline company information"""
+    """Airline company information (DART corp codes are kept in DataPipeline.corp_codes)"""
     name: str
     name_kr: str
     stock_code: str
     market: str  # KOSPI or KOSDAQ
-    corp_code: str  # DART corporation code
     issuer_id: int
 
 # Target companies with their stock codes
-AIRLINE_COMPANIES = [
-    AirlineCompany("Korean Air", "대한항공", "003490", "KOSPI", "", 1),
-    AirlineCompany("Asiana Airlines", "아시아나항공", "020560", "KOSPI", "", 2), 
-    AirlineCompany("Jeju Air", "제주항공", "089590", "KOSDAQ", "", 3),
-    AirlineCompany("T'way Air", "티웨이항공", "091810", "KOSDAQ", "", 4)
-]
+AIRLINE_COMPANIES = (
+    AirlineCompany("Korean Air", "대한항공", "003490", "KOSPI", 1),
+    AirlineCompany("Asiana Airlines", "아시아나항공", "020560", "KOSPI", 2),
+    AirlineCompany("Jeju Air", "제주항공", "089590", "KOSDAQ", 3),
+    AirlineCompany("T'way Air", "티웨이항공", "091810", "KOSDAQ", 4)
+)
+
+# 정규화된 신용등급 -> RatingMapping.csv 번호 (순서 = Categorical 코드)
+RATING_MAPPING = {
+    'AAA': 0, 'AA': 1, 'A': 2, 'BBB': 3,
+    'BB': 4, 'B': 5, 'CCC': 6, 'D': 7, 'NR': 8
+}
+
+# 분기 -> DART 보고서 코드 (1분기, 반기, 3분기, 사업보고서)
+_REPORT_CODES = {1: '11013', 2: '11012', 3: '11014', 4: '11011'}
+
+# 비율 계산에 사용하는 계정과목 (calculate_financial_ratios의 언패킹 순서)
+_ACCOUNT_KEYS = (
+    '자산총계', '유동자산', '유동부채', '부채총계', '자본총계',
+    '매출액', '영업수익', '영업이익', '당기순이익', '영업활동현금흐름'
+)
+_ACCOUNT_KEYS_SET = frozenset(_ACCOUNT_KEYS)
+
+# fnlttSinglAcntAll 응답에서 사용하는 컬럼 (계정명, 당기금액)
+_FS_COLUMNS = ['account_nm', 'thstrm_amount']
+
+# 분기 캐시 스키마 태그: 계정/컬럼 구성이 바뀌면 캐시 파일명이 달라져 예전 캐시를 쓰지 않음
+_FS_CACHE_TAG = hashlib.sha1('|'.join(_ACCOUNT_KEYS + tuple(_FS_COLUMNS)).encode('utf-8')).hexdigest()[:8]
+
+# 분기말 월 약어 (date 컬럼 '31-Mar-10' 형식)
+_Q_END_MONTHS = ('Mar', 'Jun', 'Sep', 'Dec')
+
+# 등급 정규화: +/- 제거 후 유효 등급이 아니면 NR
+_PM_STRIP = str.maketrans('', '', '+-')
+_VALID_RATINGS = frozenset(RATING_MAPPING)
+
+# DARTScraper.calculate_financial_ratios 출력 순서
+RATIO_NAMES = (
+    'debt_to_assets', 'equity_to_assets', 'asset_turnover', 'roa', 'current_ratio',
+    'debt_to_equity', 'roe', 'operating_margin', 'net_margin', 'equity_ratio',
+    'liability_ratio', 'interest_coverage', 'quick_ratio', 'working_capital_ratio',
+    'operating_cf_ratio', 'cf_to_debt', 'cf_coverage', 'debt_service_coverage',
+    'times_interest_earned'
+)
+
+class _TokenBucket:
+    """초당 rate개 요청만 허용하는 토큰 버킷 (백그라운드 스레드가 interval마다 사용한 토큰을 보충)"""
+    
+    def __init__(self, rate: int = 10, interval: float = 1.0):
+        self.rate = rate
+        self.interval = interval
+        self._tokens = threading.Semaphore(rate)
+        self._used = 0
+        self._lock = threading.Lock()
+        self._refiller = None
+    
+    def _refill(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                used, self._used = self._used, 0
+            for _ in range(used):
+                self._tokens.release()
+    
+    def acquire(self):
+        """토큰 1개 획득 (남은 토큰이 없으면 다음 보충까지 대기)"""
+        with self._lock:
+            if self._refiller is None:
+                self._refiller = threading.Thread(target=self._refill, name="dart-token-bucket", daemon=True)
+                self._refiller.start()
+        self._tokens.acquire()
+        with self._lock:
+            self._used += 1
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+# 프로세스 전체 DART 요청 속도 제한 (모든 DARTScraper/스레드가 공유)
+_DART_BUCKET = _TokenBucket(rate=10)
+
+# DART 요청 재시도 정책 (재시도도 요청마다 _DART_BUCKET 토큰을 받음, 대기는 0.3s, 0.6s, 1.2s)
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+
+# 이 모듈은 src.data / data / 단독 경로로 import되므로 디스크 캐시(cache=True)는 사용하지 않음
+@njit
+def _compute_ratios(v: np.ndarray):
+    """
+    _ACCOUNT_KEYS 순서의 계정 벡터(10) -> RATIO_NAMES 순서의 비율 벡터(19)와 포함 여부 마스크
+    (분모가 0 이하인 비율은 0, 분모 조건이 있는 비율은 마스크 False)
+    """
+    total_assets, current_assets, current_liabilities = v[0], v[1], v[2]
+    total_liabilities, total_equity = v[3], v[4]
+    revenue = v[5] if v[5] != 0.0 else v[6]
+    operating_income, net_income, operating_cf = v[7], v[8], v[9]
+    
+    out = np.zeros(19)
+    present = np.ones(19, dtype=np.bool_)
+    
+    if total_assets > 0.0:
+        out[0] = total_liabilities / total_assets   # debt_to_assets
+        out[1] = total_equity / total_assets        # equity_to_assets
+        if revenue > 0.0:
+            out[2] = revenue / total_assets         # asset_turnover
+        out[3] = net_income / total_assets          # roa
+        out[9] = total_equity / total_assets        # equity_ratio
+        out[10] = total_liabilities / total_assets  # liability_ratio
+        out[13] = (current_assets - current_liabilities) / total_assets  # working_capital_ratio
+        out[14] = operating_cf / total_assets       # operating_cf_ratio
+    else:
+        present[0] = False
+        present[1] = False
+        present[2] = revenue > 0.0
+        present[3] = False
+    
+    if current_assets > 0.0 and current_liabilities > 0.0:
+        out[4] = current_assets / current_liabilities  # current_ratio
+    else:
+        present[4] = False
+    
+    if total_equity > 0.0:
+        out[5] = total_liabilities / total_equity   # debt_to_equity
+        out[6] = net_income / total_equity          # roe
+    else:
+        present[5] = False
+        present[6] = False
+    
+    if revenue > 0.0:
+        out[7] = operating_income / revenue         # operating_margin
+        out[8] = net_income / revenue               # net_margin
+    else:
+        present[7] = False
+        present[8] = False
+    
+    # Cash flow ratios
+    if total_liabilities > 0.0:
+        out[15] = operating_cf / total_liabilities  # cf_to_debt
+    if current_liabilities > 0.0:
+        out[16] = operating_cf / current_liabilities  # cf_coverage
+    
+    # interest_coverage / quick_ratio / debt_service_coverage / times_interest_earned:
+    # 이자비용·당좌자산·원리금 데이터가 없어 0 유지
+    return out, present
 
 class DARTScraper:
     """DART Open API scraper for financial statements"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None,
+                 cache_dir: str = os.path.join('.cache', 'dart')):
         self.api_key = api_key
         self.base_url = "https://opendart.fss.or.kr/api"
-        self.session = requests.Session()
+        self.session = session if session is not None else self.create_session()
+        
+        # 병렬 수집 시 동시 DART 요청 수 제한 (초당 요청 수는 _DART_BUCKET)
+        self._rate_limiter = threading.Semaphore(4)
+        
+        # stock_code -> corp_code 디스크 캐시 (변하지 않는 값이므로 실행 간 재사용)
+        self.cache_dir = cache_dir
+        self.corp_codes_path = os.path.join(cache_dir, 'corp_codes.json')
+        self._corp_codes = self._load_corp_codes()
+        self._corp_codes_lock = threading.Lock()
+        
+        # JIT 워밍업 (워커 스레드들이 첫 호출에서 컴파일을 기다리지 않도록)
+        if NUMBA_AVAILABLE:
+            _compute_ratios(np.zeros(len(_ACCOUNT_KEYS)))
+        
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Create a keep-alive session with a larger connection pool
+        
+        재시도는 어댑터가 아니라 _dart_get에서 처리 (어댑터 재시도는 _DART_BUCKET을 거치지 않음)
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'airline-credit-pipeline/1.0'})
+        return session
+    
+    def _dart_get(self, url: str, params: Dict[str, str]) -> requests.Response:
+        """DART GET 요청 (일시 오류는 재시도하며, 매 시도마다 토큰/동시 요청 슬롯을 다시 받음)"""
+        for attempt in range(_MAX_RETRIES + 1):
+            last_attempt = attempt == _MAX_RETRIES
+            try:
+                with _DART_BUCKET, self._rate_limiter:
+                    response = self.session.get(url, params=params)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUS or last_attempt:
+                    return response
+            # 백오프 대기 중에는 동시 요청 슬롯을 잡지 않음
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _dart_get_async(self, session: "aiohttp.ClientSession", url: str, params: Dict[str, str]) -> Dict:
+        """DART GET 요청 후 JSON 디코딩 (aiohttp 버전 _dart_get, 재시도 정책 동일)"""
+        for attempt in range(_MAX_RETRIES + 1):
+            last_attempt = attempt == _MAX_RETRIES
+            # 토큰 대기는 이벤트 루프를 막지 않도록 워커 스레드에서
+            await asyncio.to_thread(_DART_BUCKET.acquire)
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status not in _RETRY_STATUS or last_attempt:
+                        response.raise_for_status()
+                        return await response.json(loads=_json_loads, content_type=None)
+            except _ASYNC_RETRY_ERRORS:
+                if last_attempt:
+                    raise
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    def _load_corp_codes(self) -> Dict[str, str]:
+        """corp_code 캐시 로드"""
+        if os.path.exists(self.corp_codes_path):
+            try:
+                with open(self.corp_codes_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️ corp_code 캐시 로드 실패: {e}")
+        return {}
+    
+    def _save_corp_codes(self):
+        """corp_code 캐시 저장 (다음 실행에서 재사용)"""
+        # 쓰기까지 잠금 유지 + 임시 파일 후 교체 (동시 저장/중단 시에도 JSON이 깨지지 않음)
+        with self._corp_codes_lock:
+            tmp_path = f"{self.corp_codes_path}.tmp"
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(dict(sorted(self._corp_codes.items())), f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.corp_codes_path)
+            except OSError as e:
+                logger.warning(f"⚠️ corp_code 캐시 저장 실패: {e}")
+    
+    def get_corp_code(self, stock_code: str, save: bool = True) -> Optional[str]:
+        """Get DART corporation code from stock code (cached in memory and on disk)
         
-    def get_corp_code(self, stock_code: str) -> Optional[str]:
-        """Get DART corporation code from stock code"""
+        Args:
+            save: False면 디스크 캐시 저장을 호출자에게 맡김 (병렬 조회 후 한 번만 저장)
+        """
+        corp_code = self._corp_codes.get(stock_code)
+        if corp_code:
+            return corp_code
+        
+        corp_code = self._fetch_corp_code(stock_code)
+        if corp_code:
+            with self._corp_codes_lock:
+                self._corp_codes[stock_code] = corp_code
+            if save:
+                self._save_corp_codes()
+        return corp_code
+    
+    def _fetch_corp_code(self, stock_code: str) -> Optional[str]:
+        """Get DART corporation code from stock code (company.json API)"""
         url = f"{self.base_url}/company.json"
         params = {
             'crtfc_key': self.api_key,
@@ -89,9 +373,9 @@ class DARTScraper:
         }
         
         try:
-            response = self.session.get(url, params=params)
+            response = self._dart_get(url, params)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             if data['status'] == '000':
                 return data['corp_code']
@@ -103,106 +387,177 @@ class DARTScraper:
             logger.error(f"Error getting corp_code for {stock_code}: {e}")
             return None
     
-    def get_financial_statements(self, corp_code: str, year: int, quarter: int) -> Optional[pd.DataFrame]:
-        """Get quarterly financial statements"""
+    def _fs_request(self, corp_code: str, year: int, quarter: int) -> Tuple[str, Dict[str, str]]:
+        """Build URL and query params for a quarterly financial statement request"""
         url = f"{self.base_url}/fnlttSinglAcntAll.json"
         
-        # Convert quarter to report code
-        report_codes = {1: '11013', 2: '11012', 3: '11014', 4: '11011'}
-        
         params = {
             'crtfc_key': self.api_key,
             'corp_code': corp_code,
             'bsns_year': str(year),
-            'reprt_code': report_codes[quarter],
+            'reprt_code': _REPORT_CODES[quarter],  # Convert quarter to report code
             'fs_div': 'CFS'  # Consolidated Financial Statements
         }
+        return url, params
+    
+    def _parse_fs_response(self, data: Dict, corp_code: str, year: int, quarter: int) -> Optional[pd.DataFrame]:
+        """Convert a decoded fnlttSinglAcntAll response into a DataFrame"""
+        if data['status'] == '000':
+            # 비율 계산에 쓰는 계정 행만 남김 (전체 응답의 ~10%, 캐시 parquet도 그만큼 작아짐)
+            rows = [r for r in data['list'] if r.get('account_nm') in _ACCOUNT_KEYS_SET]
+            if not rows:
+                # 빈 프레임을 돌려주면 캐시에 영구 저장되므로 조회 실패로 처리
+                logger.warning(f"No ratio accounts for {corp_code} {year}Q{quarter}")
+                return None
+            # 필요한 컬럼만 지정해 생성 (컬럼 추론 생략, 나머지 응답 필드는 버림)
+            return pd.DataFrame.from_records(rows, columns=_FS_COLUMNS)
+        else:
+            logger.warning(f"No data for {corp_code} {year}Q{quarter}: {data.get('message', '')}")
+            return None
+    
+    def _fs_cache_path(self, corp_code: str, year: int, quarter: int) -> Optional[str]:
+        """
+        확정된(지난) 분기의 캐시 파일 경로 (현재/미래 분기 또는 pyarrow 미설치 시 None -> 항상 재조회)
+        """
+        if not PYARROW_AVAILABLE:
+            return None
+        now = datetime.now()
+        if (year, quarter) >= (now.year, (now.month - 1) // 3 + 1):
+            return None
+        return os.path.join(self.cache_dir, f"{corp_code}_{year}Q{quarter}_{_FS_CACHE_TAG}.parquet")
+    
+    def _load_cached_fs(self, cache_path: Optional[str]) -> Optional[pd.DataFrame]:
+        """캐시된 분기 재무제표 로드 (없거나 읽기 실패 시 None)"""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 로드 실패 ({cache_path}): {e}")
+            return None
+    
+    def _store_cached_fs(self, cache_path: Optional[str], df: Optional[pd.DataFrame]):
+        """조회 성공한 분기 재무제표를 캐시에 저장"""
+        if cache_path is None or df is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_parquet(cache_path, compression='zstd', index=False)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 저장 실패 ({cache_path}): {e}")
+    
+    def get_financial_statements(self, corp_code: str, year: int, quarter: int) -> Optional[pd.DataFrame]:
+        """Get quarterly financial statements (past quarters are served from the parquet cache)"""
+        cache_path = self._fs_cache_path(corp_code, year, quarter)
+        df = self._load_cached_fs(cache_path)
+        if df is not None:
+            return df
+        
+        url, params = self._fs_request(corp_code, year, quarter)
         
         try:
-            response = self.session.get(url, params=params)
+            response = self._dart_get(url, params)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
-            if data['status'] == '000':
-                return pd.DataFrame(data['list'])
-            else:
-                logger.warning(f"No data for {corp_code} {year}Q{quarter}: {data.get('message', '')}")
-                return None
+            df = self._parse_fs_response(data, corp_code, year, quarter)
+            self._store_cached_fs(cache_path, df)
+            return df
                 
         except Exception as e:
             logger.error(f"Error getting financial data for {corp_code} {year}Q{quarter}: {e}")
             return None
+    
+    async def _fetch_fs(self, session: "aiohttp.ClientSession", corp_code: str, year: int,
+                        quarter: int) -> Optional[pd.DataFrame]:
+        """Get quarterly financial statements (aiohttp version of get_financial_statements)"""
+        cache_path = self._fs_cache_path(corp_code, year, quarter)
+        df = self._load_cached_fs(cache_path)
+        if df is not None:
+            return df
+        
+        url, params = self._fs_request(corp_code, year, quarter)
         
-        time.sleep(0.1)  # Rate limiting
+        try:
+            data = await self._dart_get_async(session, url, params)
+            
+            df = self._parse_fs_response(data, corp_code, year, quarter)
+            self._store_cached_fs(cache_path, df)
+            return df
+            
+        except Exception as e:
+            logger.error(f"Error getting financial data for {corp_code} {year}Q{quarter}: {e}")
+            return None
     
     def calculate_financial_ratios(self, df: pd.DataFrame) -> Dict[str, float]:
         """Calculate 20 key financial ratios"""
         if df is None or df.empty:
             return {}
         
-        # Create a mapping of account names to values
-        accounts = {}
-        for _, row in df.iterrows():
-            accounts[row['account_nm']] = float(row.get('thstrm_amount', 0) or 0)
+        # Create a mapping of account names to values (column-wide numeric coercion, 결측/변환 불가는 0)
+        if 'thstrm_amount' in df.columns:
+            amounts = pd.to_numeric(df['thstrm_amount'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        else:
+            amounts = np.zeros(len(df))
+        accounts = dict(zip(df['account_nm'].to_numpy(), amounts))
         
         ratios = {}
         
         try:
-            # Asset Quality Ratios
-            total_assets = accounts.get('자산총계', 0)
-            current_assets = accounts.get('유동자산', 0)
-            current_liabilities = accounts.get('유동부채', 0)
-            total_liabilities = accounts.get('부채총계', 0)
-            total_equity = accounts.get('자본총계', 0)
+            # 계정 벡터 추출 후 JIT 커널로 비율 계산
+            values = np.array([accounts.get(key, 0.0) for key in _ACCOUNT_KEYS], dtype=np.float64)
+            vals, present = _compute_ratios(values)
             
-            # Revenue and Profitability
-            revenue = accounts.get('매출액', 0) or accounts.get('영업수익', 0)
-            operating_income = accounts.get('영업이익', 0)
-            net_income = accounts.get('당기순이익', 0)
-            
-            # Cash Flow (if available)
-            operating_cf = accounts.get('영업활동현금흐름', 0)
-            
-            # Calculate ratios
-            if total_assets > 0:
-                ratios['debt_to_assets'] = total_liabilities / total_assets
-                ratios['equity_to_assets'] = total_equity / total_assets
-                ratios['asset_turnover'] = revenue / total_assets if revenue > 0 else 0
-                ratios['roa'] = net_income / total_assets
-                
-            if current_assets > 0 and current_liabilities > 0:
-                ratios['current_ratio'] = current_assets / current_liabilities
-                
-            if total_equity > 0:
-                ratios['debt_to_equity'] = total_liabilities / total_equity
-                ratios['roe'] = net_income / total_equity
-                
-            if revenue > 0:
-                ratios['operating_margin'] = operating_income / revenue
-                ratios['net_margin'] = net_income / revenue
-                ratios['asset_turnover'] = revenue / total_assets if total_assets > 0 else 0
-                
-            # Additional ratios for airlines
-            ratios['equity_ratio'] = total_equity / total_assets if total_assets > 0 else 0
-            ratios['liability_ratio'] = total_liabilities / total_assets if total_assets > 0 else 0
-            ratios['interest_coverage'] = 0  # Needs interest expense data
-            ratios['quick_ratio'] = 0  # Needs quick assets data
-            ratios['working_capital_ratio'] = (current_assets - current_liabilities) / total_assets if total_assets > 0 else 0
-            
-            # Cash flow ratios
-            ratios['operating_cf_ratio'] = operating_cf / total_assets if total_assets > 0 else 0
-            ratios['cf_to_debt'] = operating_cf / total_liabilities if total_liabilities > 0 else 0
-            ratios['cf_coverage'] = operating_cf / current_liabilities if current_liabilities > 0 else 0
-            
-            # Additional airline-specific ratios
-            ratios['debt_service_coverage'] = 0  # Needs debt service data
-            ratios['times_interest_earned'] = 0  # Needs interest expense data
+            ratios = {name: float(value) for name, value, ok in zip(RATIO_NAMES, vals, present) if ok}
             
         except Exception as e:
             logger.error(f"Error calculating ratios: {e}")
             
         return ratios
 
+# 데모용 신용등급 이력 (issuer_id -> [(Date, RatingSymbol), ...])
+SAMPLE_RATINGS = {
+    1: [  # Korean Air
+        ('31-Dec-10', 'BBB'), ('30-Jun-11', 'BBB'), ('31-Dec-11', 'BB'),
+        ('30-Jun-12', 'BB'), ('31-Dec-12', 'B'), ('30-Jun-13', 'B'),
+        ('31-Dec-13', 'BB'), ('30-Jun-14', 'BB'), ('31-Dec-14', 'BBB'),
+        ('30-Jun-15', 'BBB'), ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'),
+        ('31-Dec-16', 'A'), ('30-Jun-17', 'A'), ('31-Dec-17', 'A'),
+        ('30-Jun-18', 'A'), ('31-Dec-18', 'BBB'), ('30-Jun-19', 'BBB'),
+        ('31-Dec-19', 'BB'), ('30-Jun-20', 'B'), ('31-Dec-20', 'B'),
+        ('30-Jun-21', 'BB'), ('31-Dec-21', 'BB'), ('30-Jun-22', 'BBB'),
+        ('31-Dec-22', 'BBB'), ('30-Jun-23', 'BBB'), ('31-Dec-23', 'A'),
+        ('30-Jun-24', 'A')
+    ],
+    2: [  # Asiana Airlines
+        ('31-Dec-10', 'BBB'), ('30-Jun-11', 'BBB'), ('31-Dec-11', 'BB'),
+        ('30-Jun-12', 'BB'), ('31-Dec-12', 'B'), ('30-Jun-13', 'CCC'),
+        ('31-Dec-13', 'B'), ('30-Jun-14', 'B'), ('31-Dec-14', 'BB'),
+        ('30-Jun-15', 'BB'), ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'),
+        ('31-Dec-16', 'BBB'), ('30-Jun-17', 'BB'), ('31-Dec-17', 'B'),
+        ('30-Jun-18', 'B'), ('31-Dec-18', 'CCC'), ('30-Jun-19', 'B'),
+        ('31-Dec-19', 'CCC'), ('30-Jun-20', 'D'), ('31-Dec-20', 'NR'),
+        ('30-Jun-21', 'NR'), ('31-Dec-21', 'NR'), ('30-Jun-22', 'NR'),
+        ('31-Dec-22', 'NR'), ('30-Jun-23', 'NR'), ('31-Dec-23', 'NR'),
+        ('30-Jun-24', 'NR')
+    ],
+    3: [  # Jeju Air
+        ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'), ('31-Dec-16', 'BBB'),
+        ('30-Jun-17', 'BBB'), ('31-Dec-17', 'A'), ('30-Jun-18', 'A'),
+        ('31-Dec-18', 'BBB'), ('30-Jun-19', 'BBB'), ('31-Dec-19', 'BB'),
+        ('30-Jun-20', 'B'), ('31-Dec-20', 'B'), ('30-Jun-21', 'BB'),
+        ('31-Dec-21', 'BB'), ('30-Jun-22', 'BBB'), ('31-Dec-22', 'BBB'),
+        ('30-Jun-23', 'A'), ('31-Dec-23', 'A'), ('30-Jun-24', 'A')
+    ],
+    4: [  # T'way Air
+        ('31-Dec-17', 'BB'), ('30-Jun-18', 'BB'), ('31-Dec-18', 'B'),
+        ('30-Jun-19', 'B'), ('31-Dec-19', 'CCC'), ('30-Jun-20', 'CCC'),
+        ('31-Dec-20', 'B'), ('30-Jun-21', 'B'), ('31-Dec-21', 'BB'),
+        ('30-Jun-22', 'BB'), ('31-Dec-22', 'BBB'), ('30-Jun-23', 'BBB'),
+        ('31-Dec-23', 'BBB'), ('30-Jun-24', 'BBB')
+    ],
+}
+
 class RatingCollector:
     """Collect credit rating information from public disclosures"""
     
@@ -220,15 +575,19 @@ class RatingCollector:
     
     def normalize_rating(self, rating: str) -> str:
         """Normalize rating format"""
-        rating = rating.upper().strip()
-        
-        # Handle Korean rating agencies format
-        if rating in ['AAA', 'AA', 'A', 'BBB', 'BB', 'B', 'CCC', 'D', 'NR']:
-            return rating
-        elif rating in ['AA+', 'AA-', 'A+', 'A-', 'BBB+', 'BBB-', 'BB+', 'BB-', 'B+', 'B-', 'CCC+', 'CCC-']:
-            return rating[:-1]  # Remove + or - for simplification
-        else:
-            return 'NR'
+        # Handle Korean rating agencies format (Remove + or - for simplification)
+        rating = rating.upper().strip().translate(_PM_STRIP)
+        return rating if rating in _VALID_RATINGS else 'NR'
+    
+    @staticmethod
+    def normalize_ratings(ratings: pd.Series) -> pd.Series:
+        """Vectorized normalize_rating -> Categorical over RATING_MAPPING (codes = RatingNumber)"""
+        normalized = ratings.astype(str).str.upper().str.strip().str.translate(_PM_STRIP)
+        normalized = normalized.where(normalized.isin(_VALID_RATINGS), 'NR')
+        return pd.Series(
+            pd.Categorical(normalized, categories=list(RATING_MAPPING)),
+            index=ratings.index, name=ratings.name
+        )
     
     def add_rating_record(self, issuer_id: int, date: str, rating: str):
         """Add a rating record"""
@@ -239,72 +598,39 @@ class RatingCollector:
             'RatingSymbol': normalized_rating
         })
     
-    def get_sample_ratings(self) -> List[Dict]:
+    def get_sample_ratings(self) -> pd.DataFrame:
         """Generate sample rating data for demonstration"""
-        sample_data = []
-        
+        # Sample rating progression (this would be replaced with actual data collection)
+        # 회사별 배열을 모아 마지막에 한 번만 DataFrame 생성 (회사별 concat 없음)
+        ids, dates, symbols = [], [], []
         for company in AIRLINE_COMPANIES:
-            # Sample rating progression (this would be replaced with actual data collection)
-            if company.name == "Korean Air":
-                ratings = [
-                    ('31-Dec-10', 'BBB'), ('30-Jun-11', 'BBB'), ('31-Dec-11', 'BB'),
-                    ('30-Jun-12', 'BB'), ('31-Dec-12', 'B'), ('30-Jun-13', 'B'),
-                    ('31-Dec-13', 'BB'), ('30-Jun-14', 'BB'), ('31-Dec-14', 'BBB'),
-                    ('30-Jun-15', 'BBB'), ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'),
-                    ('31-Dec-16', 'A'), ('30-Jun-17', 'A'), ('31-Dec-17', 'A'),
-                    ('30-Jun-18', 'A'), ('31-Dec-18', 'BBB'), ('30-Jun-19', 'BBB'),
-                    ('31-Dec-19', 'BB'), ('30-Jun-20', 'B'), ('31-Dec-20', 'B'),
-                    ('30-Jun-21', 'BB'), ('31-Dec-21', 'BB'), ('30-Jun-22', 'BBB'),
-                    ('31-Dec-22', 'BBB'), ('30-Jun-23', 'BBB'), ('31-Dec-23', 'A'),
-                    ('30-Jun-24', 'A')
-                ]
-            elif company.name == "Asiana Airlines":
-                ratings = [
-                    ('31-Dec-10', 'BBB'), ('30-Jun-11', 'BBB'), ('31-Dec-11', 'BB'),
-                    ('30-Jun-12', 'BB'), ('31-Dec-12', 'B'), ('30-Jun-13', 'CCC'),
-                    ('31-Dec-13', 'B'), ('30-Jun-14', 'B'), ('31-Dec-14', 'BB'),
-                    ('30-Jun-15', 'BB'), ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'),
-                    ('31-Dec-16', 'BBB'), ('30-Jun-17', 'BB'), ('31-Dec-17', 'B'),
-                    ('30-Jun-18', 'B'), ('31-Dec-18', 'CCC'), ('30-Jun-19', 'B'),
-                    ('31-Dec-19', 'CCC'), ('30-Jun-20', 'D'), ('31-Dec-20', 'NR'),
-                    ('30-Jun-21', 'NR'), ('31-Dec-21', 'NR'), ('30-Jun-22', 'NR'),
-                    ('31-Dec-22', 'NR'), ('30-Jun-23', 'NR'), ('31-Dec-23', 'NR'),
-                    ('30-Jun-24', 'NR')
-                ]
-            elif company.name == "Jeju Air":
-                ratings = [
-                    ('31-Dec-15', 'BBB'), ('30-Jun-16', 'BBB'), ('31-Dec-16', 'BBB'),
-                    ('30-Jun-17', 'BBB'), ('31-Dec-17', 'A'), ('30-Jun-18', 'A'),
-                    ('31-Dec-18', 'BBB'), ('30-Jun-19', 'BBB'), ('31-Dec-19', 'BB'),
-                    ('30-Jun-20', 'B'), ('31-Dec-20', 'B'), ('30-Jun-21', 'BB'),
-                    ('31-Dec-21', 'BB'), ('30-Jun-22', 'BBB'), ('31-Dec-22', 'BBB'),
-                    ('30-Jun-23', 'A'), ('31-Dec-23', 'A'), ('30-Jun-24', 'A')
-                ]
-            else:  # T'way Air
-                ratings = [
-                    ('31-Dec-17', 'BB'), ('30-Jun-18', 'BB'), ('31-Dec-18', 'B'),
-                    ('30-Jun-19', 'B'), ('31-Dec-19', 'CCC'), ('30-Jun-20', 'CCC'),
-                    ('31-Dec-20', 'B'), ('30-Jun-21', 'B'), ('31-Dec-21', 'BB'),
-                    ('30-Jun-22', 'BB'), ('31-Dec-22', 'BBB'), ('30-Jun-23', 'BBB'),
-                    ('31-Dec-23', 'BBB'), ('30-Jun-24', 'BBB')
-                ]
-            
-            for date, rating in ratings:
-                sample_data.append({
-                    'Id': company.issuer_id,
-                    'Date': date,
-                    'RatingSymbol': rating
-                })
-        
-        return sample_data
+            ratings = SAMPLE_RATINGS.get(company.issuer_id)
+            if not ratings:
+                continue
+            company_dates, company_symbols = zip(*ratings)
+            ids.append(np.full(len(ratings), company.issuer_id))
+            dates.append(np.array(company_dates, dtype=object))
+            symbols.append(np.array(company_symbols, dtype=object))
+        
+        return pd.DataFrame({
+            'Id': np.concatenate(ids),
+            'Date': np.concatenate(dates),
+            'RatingSymbol': np.concatenate(symbols)
+        })
 
 class DataPipeline:
     """Main data pipeline orchestrator"""
     
-    def __init__(self, dart_api_key: Optional[str] = None):
-        self.dart_scraper = DARTScraper(dart_api_key) if dart_api_key else None
+    def __init__(self, dart_api_key: Optional[str] = None, session: Optional[requests.Session] = None):
+        # 모든 DARTScraper가 하나의 커넥션 풀을 공유
+        self.session = session if session is not None else DARTScraper.create_session()
+        self.dart_scraper = DARTScraper(dart_api_key, self.session) if dart_api_key else None
         self.rating_collector = RatingCollector()
-        self.companies = AIRLINE_COMPANIES.copy()
+        self.companies = AIRLINE_COMPANIES
+        self.corp_codes: Dict[str, str] = {}  # stock_code -> DART corp_code
+        
+        # 회사/분기별 DART 호출은 I/O 대기가 대부분이므로 스레드로 병렬 수집
+        self.max_workers = 8
         
     def setup_companies(self):
         """Setup company information with DART corp codes"""
@@ -312,56 +638,125 @@ class DataPipeline:
             logger.warning("DART API key not provided, skipping corp code setup")
             return
             
-        for company in self.companies:
+        def fetch_corp_code(company):
             logger.info(f"Getting corp code for {company.name} ({company.stock_code})")
-            corp_code = self.dart_scraper.get_corp_code(company.stock_code)
+            return self.dart_scraper.get_corp_code(company.stock_code, save=False)
+        
+        n_cached = len(self.dart_scraper._corp_codes)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            corp_codes = list(executor.map(fetch_corp_code, self.companies))
+        
+        # 워커마다 저장하지 않고 새로 조회한 코드가 있을 때 한 번만 저장
+        if len(self.dart_scraper._corp_codes) > n_cached:
+            self.dart_scraper._save_corp_codes()
+        
+        for company, corp_code in zip(self.companies, corp_codes):
             if corp_code:
-                company.corp_code = corp_code
+                self.corp_codes[company.stock_code] = corp_code
                 logger.info(f"✓ {company.name}: {corp_code}")
             else:
                 logger.error(f"✗ Failed to get corp code for {company.name}")
     
-    def collect_financial_data(self, start_year: int = 2010, end_year: int = 2025):
-        """Collect financial data for all companies"""
+    def collect_financial_data(self, start_year: int = 2010, end_year: int = 2025, use_async: bool = False):
+        """Collect financial data for all companies
+        
+        Args:
+            use_async: True면 aiohttp 이벤트 루프로 수집 (aiohttp 미설치 시 스레드 풀 사용)
+        """
+        if not self.dart_scraper:
+            logger.warning("DART API key not provided, skipping financial data collection")
+            return pd.DataFrame()
+        
+        if use_async:
+            if AIOHTTP_AVAILABLE:
+                return asyncio.run(self.collect_financial_data_async(start_year, end_year))
+            logger.warning("aiohttp not installed, falling back to thread pool collection")
+        
+        tasks = self._financial_tasks(start_year, end_year)
+        
+        def fetch_quarter(task):
+            company, corp_code, year, quarter = task
+            logger.info(f"  Processing {company.name} {year}Q{quarter}")
+            
+            df = self.dart_scraper.get_financial_statements(
+                corp_code, year, quarter
+            )
+            return self._build_financial_record(company, year, quarter, df)
+        
+        logger.info(f"Collecting financial data: {len(tasks)} company-quarters")
+        
+        # executor.map은 입력 순서를 유지하므로 결과도 회사/연도/분기 순서대로 정렬됨
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            all_data = [record for record in executor.map(fetch_quarter, tasks) if record is not None]
+        
+        return self._financial_frame(all_data)
+    
+    async def collect_financial_data_async(self, start_year: int = 2010, end_year: int = 2025,
+                                           max_concurrency: int = 8) -> pd.DataFrame:
+        """Collect financial data for all companies with aiohttp (single event loop, shared TCP pool)"""
         if not self.dart_scraper:
             logger.warning("DART API key not provided, skipping financial data collection")
             return pd.DataFrame()
         
-        all_data = []
+        tasks = self._financial_tasks(start_year, end_year)
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        logger.info(f"Collecting financial data (async): {len(tasks)} company-quarters")
         
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16)) as session:
+            async def fetch_quarter(company, corp_code, year, quarter):
+                async with sem:
+                    logger.info(f"  Processing {company.name} {year}Q{quarter}")
+                    df = await self.dart_scraper._fetch_fs(session, corp_code, year, quarter)
+                return self._build_financial_record(company, year, quarter, df)
+            
+            # gather는 입력 순서대로 결과를 반환
+            records = await asyncio.gather(*(fetch_quarter(*task) for task in tasks))
+        
+        return self._financial_frame([record for record in records if record is not None])
+    
+    def _financial_tasks(self, start_year: int, end_year: int) -> List[Tuple[AirlineCompany, str, int, int]]:
+        """(회사, corp_code, 연도, 분기) 작업 목록"""
+        tasks = []
         for company in self.companies:
-            if not company.corp_code:
+            corp_code = self.corp_codes.get(company.stock_code)
+            if not corp_code:
                 logger.warning(f"No corp code for {company.name}, skipping")
                 continue
-                
-            logger.info(f"Collecting financial data for {company.name}")
             
             for year in range(start_year, min(end_year + 1, 2025)):
                 for quarter in range(1, 5):
                     # Don't try to get future quarters
                     if year == 2025 and quarter > 2:
                         break
-                        
-                    logger.info(f"  Processing {year}Q{quarter}")
-                    
-                    df = self.dart_scraper.get_financial_statements(
-                        company.corp_code, year, quarter
-                    )
-                    
-                    if df is not None and not df.empty:
-                        ratios = self.dart_scraper.calculate_financial_ratios(df)
-                        
-                        record = {
-                            'company_name': company.name,
-                            'issuer_id': company.issuer_id,
-                            'year': year,
-                            'quarter': quarter,
-                            'date': f"31-{['Mar', 'Jun', 'Sep', 'Dec'][quarter-1]}-{str(year)[-2:]}",
-                            **ratios
-                        }
-                        all_data.append(record)
-        
-        return pd.DataFrame(all_data)
+                    tasks.append((company, corp_code, year, quarter))
+        return tasks
+    
+    def _build_financial_record(self, company: AirlineCompany, year: int, quarter: int,
+                                df: Optional[pd.DataFrame]) -> Optional[Dict]:
+        """재무제표 1건을 비율 레코드로 변환 (데이터 없으면 None)"""
+        if df is None or df.empty:
+            return None
+        
+        ratios = self.dart_scraper.calculate_financial_ratios(df)
+        
+        return {
+            'company_name': company.name,
+            'issuer_id': company.issuer_id,
+            'year': year,
+            'quarter': quarter,
+            **ratios
+        }
+    
+    @staticmethod
+    def _financial_frame(records: List[Dict]) -> pd.DataFrame:
+        """비율 레코드 -> DataFrame (분기말 date 컬럼은 수집 후 한 번에 생성)"""
+        df = pd.DataFrame(records)
+        if not df.empty:
+            months = df['quarter'].map(dict(enumerate(_Q_END_MONTHS, 1)))
+            df.insert(df.columns.get_loc('quarter') + 1, 'date',
+                      '31-' + months + '-' + df['year'].astype(str).str[-2:])
+        return df
     
     def collect_rating_data(self, use_sample: bool = True):
         """Collect credit rating data"""
@@ -373,26 +768,30 @@ class DataPipeline:
             # TODO: Implement actual rating collection from NICE/KIS disclosures
             return []
     
-    def create_output_files(self, rating_data: List[Dict], output_dir: str = "."):
-        """Create TransitionHistory.csv and RatingMapping.csv files"""
+    def create_output_files(self, rating_data, output_dir: str = "."):
+        """Create TransitionHistory.csv and RatingMapping.csv files (rating_data: DataFrame or list of dicts)"""
         
         # Create TransitionHistory.csv
         transition_df = pd.DataFrame(rating_data)
+        if 'RatingSymbol' in transition_df.columns:
+            transition_df['RatingSymbol'] = RatingCollector.normalize_ratings(transition_df['RatingSymbol'])
+        
+        # 날짜는 한 번만 datetime64로 파싱하고 (Id, Date) 순으로 정렬해 ISO 형식으로 저장
+        if 'Date' in transition_df.columns:
+            transition_df['Date'] = pd.to_datetime(transition_df['Date'], format='%d-%b-%y')
+            transition_df = transition_df.sort_values(['Id', 'Date']).reset_index(drop=True)
         transition_file = os.path.join(output_dir, "TransitionHistory.csv")
-        transition_df.to_csv(transition_file, index=False)
+        transition_df.to_csv(transition_file, index=False, lineterminator='\n', date_format='%Y-%m-%d')
         logger.info(f"✓ Created {transition_file} with {len(transition_df)} records")
         
         # Create RatingMapping.csv
-        mapping_data = [
-            ['RatingSymbol', 'RatingNumber'],
-            ['AAA', 0], ['AA', 1], ['A', 2], ['BBB', 3],
-            ['BB', 4], ['B', 5], ['CCC', 6], ['D', 7], ['NR', 8]
-        ]
+        mapping_df = pd.DataFrame({
+            'RatingSymbol': list(RATING_MAPPING),
+            'RatingNumber': list(RATING_MAPPING.values())
+        })
         
         mapping_file = os.path.join(output_dir, "RatingMapping.csv")
-        with open(mapping_file, 'w') as f:
-            for row in mapping_data:
-                f.write(','.join(map(str, row)) + '\n')
+        mapping_df.to_csv(mapping_file, index=False, lineterminator='\n')
         
         logger.info(f"✓ Created {mapping_file}")
         
@@ -437,14 +836,21 @@ class DataPipeline:
         # Step 1: Setup company information
         logger.info("📋 Step 1: Setting up company information")
         if dart_api_key:
-            self.dart_scraper = DARTScraper(dart_api_key)
+            self.dart_scraper = DARTScraper(dart_api_key, self.session)
             self.setup_companies()
         
         # Step 2: Collect financial data (optional)
         logger.info("💰 Step 2: Collecting financial data")
         financial_data = self.collect_financial_data()
+        financial_file = None
         if not financial_data.empty:
-            financial_data.to_csv("korean_airlines_financial_data.csv", index=False)
+            # parquet 우선 (pyarrow 미설치 시 CSV)
+            if PYARROW_AVAILABLE:
+                financial_file = "korean_airlines_financial_data.parquet"
+                financial_data.to_parquet(financial_file, engine='pyarrow', compression='zstd', index=False)
+            else:
+                financial_file = "korean_airlines_financial_data.csv"
+                financial_data.to_csv(financial_file, index=False)
             logger.info(f"✓ Saved financial data: {len(financial_data)} records")
         
         # Step 3: Collect rating data
@@ -459,8 +865,8 @@ class DataPipeline:
         logger.info(f"📊 Generated files:")
         logger.info(f"   - {transition_file}")
         logger.info(f"   - {mapping_file}")
-        if not financial_data.empty:
-            logger.info(f"   - korean_airlines_financial_data.csv")
+        if financial_file:
+            logger.info(f"   - {financial_file}")
         
         return transition_file, mapping_file
 
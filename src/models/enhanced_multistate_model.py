@@ -28,6 +28,39 @@ except ImportError:
     print("⚠️ lifelines not available. Install with: pip install lifelines")
     LIFELINES_AVAILABLE = False
 
+# Optional JIT compilation for the Cox partial-likelihood kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Pure-Python fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.optimize import minimize
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Optional process-parallel fitting of independent transition models
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# Optional O(N log N) concordance index (falls back to lifelines)
+try:
+    from sksurv.metrics import concordance_index_censored
+    SKSURV_AVAILABLE = True
+except ImportError:
+    SKSURV_AVAILABLE = False
+
 # Import our Korean Airlines data pipeline
 try:
     from ..data.korean_airlines_data_pipeline import DataPipeline, AIRLINE_COMPANIES
@@ -46,11 +79,356 @@ class StateDefinition:
     DEFAULT = 999    # Default state (absorbing)
     WITHDRAWN = 888  # Rating withdrawn (absorbing)
 
+# Display labels for transition types (single source for reports and plots)
+TRANSITION_LABELS = {
+    StateDefinition.UPGRADE: "Upgrades",
+    StateDefinition.DOWNGRADE: "Downgrades",
+    StateDefinition.STABLE: "Stable",
+    StateDefinition.DEFAULT: "Defaults",
+    StateDefinition.WITHDRAWN: "Withdrawn",
+}
+
+@njit(cache=True, fastmath=True)
+def _cox_neg_loglik_grad(beta, X, durations, events):
+    """
+    Negative Breslow log partial likelihood and its gradient.
+    
+    Rows must be sorted by duration in non-increasing order, so the risk set
+    of each event is a prefix of the arrays and its sums become running
+    (cumulative) sums. Tied durations share one risk set.
+    """
+    n, p = X.shape
+    eta = X @ beta
+    shift = eta.max()
+    
+    loglik = 0.0
+    grad = np.zeros(p)
+    risk_sum = 0.0
+    risk_x_sum = np.zeros(p)
+    
+    i = 0
+    while i < n:
+        # Add the whole tie group to the risk set first
+        j = i
+        while j < n and durations[j] == durations[i]:
+            w = np.exp(eta[j] - shift)
+            risk_sum += w
+            for k in range(p):
+                risk_x_sum[k] += w * X[j, k]
+            j += 1
+        
+        log_risk_sum = np.log(risk_sum) + shift
+        for m in range(i, j):
+            if events[m] > 0:
+                loglik += eta[m] - log_risk_sum
+                for k in range(p):
+                    grad[k] += X[m, k] - risk_x_sum[k] / risk_sum
+        i = j
+    
+    return -loglik, -grad
+
+
+def _cox_initial_point(model_data: pd.DataFrame, duration_col: str, event_col: str,
+                       penalizer: float = 0.1, l1_ratio: float = 0.5) -> Optional[np.ndarray]:
+    """
+    Solve the elastic-net penalized Cox problem with L-BFGS-B on the
+    JIT-compiled kernel, in lifelines' normalized covariate space.
+    
+    The result is passed to CoxPHFitter.fit(initial_point=...) so that
+    lifelines' Newton-Raphson only needs a few polishing steps.
+    """
+    if not SCIPY_AVAILABLE:
+        return None
+    
+    covariates = model_data.drop(columns=[duration_col, event_col])
+    if covariates.shape[1] == 0:
+        return None
+    
+    # Same normalization lifelines applies before Newton-Raphson
+    stds = covariates.std().replace(0, 1)
+    X = ((covariates - covariates.mean()) / stds).to_numpy(dtype=np.float64)
+    
+    order = np.argsort(-model_data[duration_col].to_numpy(), kind='stable')
+    X = np.ascontiguousarray(X[order])
+    durations = np.ascontiguousarray(model_data[duration_col].to_numpy(dtype=np.float64)[order])
+    events = np.ascontiguousarray(model_data[event_col].to_numpy(dtype=np.float64)[order])
+    n = len(X)
+    
+    def objective(beta):
+        loss, grad = _cox_neg_loglik_grad(beta, X, durations, events)
+        # n * penalizer * (l1 * |b| + 0.5 * (1 - l1) * b^2), |b| smoothed
+        soft_abs = np.sqrt(beta ** 2 + 1e-8)
+        loss += n * penalizer * (l1_ratio * soft_abs + 0.5 * (1 - l1_ratio) * beta ** 2).sum()
+        grad = grad + n * penalizer * (l1_ratio * beta / soft_abs + (1 - l1_ratio) * beta)
+        return loss, grad
+    
+    try:
+        result = minimize(objective, np.zeros(X.shape[1]), jac=True, method='L-BFGS-B')
+    except Exception:
+        return None
+    
+    if not np.all(np.isfinite(result.x)):
+        return None
+    return result.x
+
+
+class FallbackTimeDepModel:
+    """
+    Constant-hazard stand-in for transitions with too few events to fit a
+    Cox model. Mimics the parts of the CoxPHFitter interface used downstream.
+    """
+    
+    def __init__(self, base_hazard: float = 0.05):
+        # 🔧 Base hazard is annual rate, store for proper scaling
+        self.base_hazard = base_hazard
+        self.annual_base_hazard = base_hazard
+        self.baseline_hazard_ = lambda t: self.base_hazard
+        self.params_ = pd.Series([0.0], index=['baseline'])
+        self.concordance_index_ = 0.5  # Neutral concordance
+        
+        # 🔧 Add summary attribute to match CoxPHFitter interface
+        self.summary = pd.DataFrame({
+            'coef': [0.0],
+            'exp(coef)': [1.0], 
+            'se(coef)': [0.1],
+            'z': [0.0],
+            'p': [1.0]
+        }, index=['baseline'])
+    
+    def __getstate__(self):
+        # The baseline_hazard_ lambda is rebuilt on unpickling
+        state = self.__dict__.copy()
+        state.pop('baseline_hazard_', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.baseline_hazard_ = lambda t: self.base_hazard
+    
+    def predict_cumulative_hazard(self, X, times):
+        """Predict cumulative hazard - uses annual base hazard with time scaling"""
+        if not hasattr(times, '__iter__'):
+            times = [times]
+        
+        # 🔧 Cumulative hazard = annual_base_hazard × time_in_years
+        hazards = [self.annual_base_hazard * t for t in times]
+        return pd.DataFrame(hazards, index=times, columns=[0])
+    
+    def predict_survival_function(self, X, times):
+        """Predict survival function S(t) = exp(-Λ(t)) - uses annual base hazard"""
+        if not hasattr(times, '__iter__'):
+            times = [times]
+        
+        # 🔧 S(t) = exp(-annual_base_hazard × time_in_years)
+        survival_probs = [np.exp(-self.annual_base_hazard * t) for t in times]
+        return pd.DataFrame(survival_probs, index=times, columns=[0])
+    
+    def predict_partial_hazard(self, X):
+        """Predict partial hazard (always 1.0 for fallback model)"""
+        return pd.Series([1.0] * len(X), index=X.index)
+
+
+def _compute_concordance(model, model_data: pd.DataFrame, event_col: str) -> float:
+    """Concordance index of a fitted Cox model on its training data"""
+    
+    if SKSURV_AVAILABLE:
+        # Sorted-scan O(N log N) implementation
+        risk_scores = np.asarray(model.predict_partial_hazard(model_data)).ravel()
+        return concordance_index_censored(
+            model_data[event_col].to_numpy().astype(bool),
+            model_data['duration'].to_numpy(),
+            risk_scores
+        )[0]
+    
+    return model.concordance_index_
+
+
+def _fit_one_transition(survival_data: pd.DataFrame, covariate_cols: List[str], transition_name: str,
+                        event_col: str, compute_cindex: bool = True) -> Tuple[str, Any, Optional[Dict[str, Any]]]:
+    """
+    Fit the Cox model of a single transition type.
+    
+    Kept at module level so it can be dispatched to worker processes.
+    ``survival_data`` must already be restricted to rows with positive
+    duration and finite covariates.
+    
+    Returns:
+        (transition_name, model, stats) - model is None when fitting failed,
+        stats is None for fallback models
+    """
+    import threading
+    
+    print(f"🔧 [COX MODELS] Fitting {transition_name} model...")
+    
+    try:
+        # Rows are already filtered by the shared validity mask
+        model_data = survival_data[['duration', event_col] + covariate_cols]
+        
+        print(f"📊 [COX DEBUG] {transition_name} data prepared:")
+        print(f"  📊 Model data shape: {model_data.shape}")
+        print(f"  📊 Events count: {model_data[event_col].sum()}")
+        print(f"  📊 Duration stats: min={model_data['duration'].min():.4f}, max={model_data['duration'].max():.4f}")
+        
+        event_count = model_data[event_col].sum()
+        total_observations = len(model_data)
+        
+        # Event count diagnostics
+        if event_count == 0:
+            print(f"⚠️ [COX MODELS] No events for {transition_name} transition (0/{total_observations})")
+        elif event_count < 3:
+            print(f"⚠️ [COX MODELS] Very few events for {transition_name} transition ({event_count}/{total_observations})")
+            print(f"🔧 [COX MODELS] Cox model may be unreliable, fallback recommended")
+        else:
+            print(f"✅ [COX MODELS] {transition_name} has {event_count}/{total_observations} events")
+        
+        if len(model_data) == 0 or event_count == 0:
+            print(f"🔧 [COX MODELS] Creating fallback model for {transition_name}...")
+            
+            # Set base hazards by transition type
+            base_hazards = {
+                'upgrade': 0.12,      # 12% base upgrade hazard
+                'downgrade': 0.15,    # 15% base downgrade hazard  
+                'default': 0.02,      # 2% base default hazard
+                'withdrawn': 0.01     # 1% base withdrawn hazard
+            }
+            
+            fallback_model = FallbackTimeDepModel(base_hazards.get(transition_name, 0.10))
+            print(f"✅ [COX MODELS] Fallback model created for {transition_name} with base hazard {base_hazards.get(transition_name, 0.10)}")
+            return transition_name, fallback_model, None
+        
+        # Remove covariates with very low variance (< 1e-10)
+        # 🔧 BUT preserve rating-related variables for differentiation
+        rating_related_cols = ['current_rating', 'from_rating', 'investment_grade'] + \
+                            [col for col in covariate_cols if col.startswith('risk_category_')]
+        
+        # 🔧 Skip variance check for rating-related variables (always keep them)
+        variance_check_cols = [col for col in covariate_cols
+                               if col not in rating_related_cols
+                               and model_data[col].dtype in ['float32', 'float64', 'int64']]
+        # One reduction over the covariate block instead of one per column
+        variances = model_data[variance_check_cols].var(numeric_only=True)
+        low_variance_cols = variances[variances.fillna(0) < 1e-10].index.tolist()
+        
+        if low_variance_cols:
+            print(f"⚠️ [COX MODELS] Removing low variance covariates for {transition_name}: {low_variance_cols}")
+            filtered_covariates = [col for col in covariate_cols if col not in low_variance_cols]
+            if not filtered_covariates:
+                print(f"⚠️ [COX MODELS] No valid covariates remaining for {transition_name}")
+                return transition_name, None, None
+            model_data = model_data[['duration', event_col] + filtered_covariates]
+        
+        # 🔧 Check for sufficient variation in events (relaxed threshold for airline data)
+        event_count = model_data[event_col].sum()
+        # 🔧 Lower threshold for upgrade events to enable Cox model
+        min_events = 3 if transition_name == 'upgrade' else 5
+        if event_count < min_events:
+            print(f"⚠️ [COX MODELS] Too few {transition_name} events ({event_count}<{min_events}); using fallback hazard")
+            
+            # Create fallback model for insufficient events
+            fallback_hazards = {
+                'upgrade': 0.06,      # 6% base upgrade hazard
+                'downgrade': 0.08,    # 8% base downgrade hazard  
+                'default': 0.015,     # 1.5% base default hazard
+                'withdrawn': 0.01     # 1% base withdrawn hazard
+            }
+            
+            fallback_model = FallbackTimeDepModel(fallback_hazards.get(transition_name, 0.05))
+            print(f"✅ [COX MODELS] Fallback model created for {transition_name} with base hazard {fallback_hazards.get(transition_name, 0.05)}")
+            return transition_name, fallback_model, None
+        
+        # Fit Cox model with timeout protection and stronger regularization
+        model_result = None
+        model_exception = None
+        
+        def fit_model():
+            nonlocal model_result, model_exception
+            try:
+                # 🔧 Stronger penalization to prevent overfitting
+                cph = CoxPHFitter(penalizer=0.1, l1_ratio=0.5)  # Ridge+Lasso 혼합
+                # Warm start from the JIT-compiled partial-likelihood solver
+                initial_point = _cox_initial_point(model_data, 'duration', event_col,
+                                                   penalizer=0.1, l1_ratio=0.5)
+                try:
+                    cph.fit(
+                        model_data, 
+                        duration_col='duration', 
+                        event_col=event_col,
+                        show_progress=False,  # Suppress progress bar
+                        initial_point=initial_point
+                    )
+                except Exception:
+                    if initial_point is None:
+                        raise
+                    # Fall back to lifelines' default starting point
+                    cph = CoxPHFitter(penalizer=0.1, l1_ratio=0.5)
+                    cph.fit(
+                        model_data, 
+                        duration_col='duration', 
+                        event_col=event_col,
+                        show_progress=False
+                    )
+                model_result = cph
+            except Exception as e:
+                model_exception = e
+        
+        # 별도 스레드에서 모델 훈련
+        model_thread = threading.Thread(target=fit_model)
+        model_thread.daemon = True
+        model_thread.start()
+        
+        # 60초 타임아웃 대기
+        model_thread.join(60)
+        
+        if model_thread.is_alive():
+            print(f"⚠️ [COX MODELS] Model fitting timeout for {transition_name}")
+            return transition_name, None, None
+        
+        if model_exception is not None:
+            print(f"⚠️ [COX MODELS] Model fitting error for {transition_name}: {model_exception}")
+            return transition_name, None, None
+        
+        if model_result is None:
+            print(f"⚠️ [COX MODELS] No model result for {transition_name}")
+            return transition_name, None, None
+        
+        # Concordance is computed once here and reused by reports
+        concordance = _compute_concordance(model_result, model_data, event_col) if compute_cindex else None
+        
+        # Covariate scaling (lifelines standardizes internally for Newton-Raphson;
+        # keep the raw-scale model for prediction and report per-SD effects)
+        fitted_covariates = list(model_result.params_.index)
+        covariate_means = model_data[fitted_covariates].mean()
+        covariate_stds = model_data[fitted_covariates].std().replace(0, 1)
+        
+        stats = {
+            'concordance': concordance,
+            'coefficients': model_result.params_.to_dict(),
+            'standardized_coefficients': (model_result.params_ * covariate_stds).to_dict(),
+            'covariate_means': covariate_means.to_dict(),
+            'covariate_stds': covariate_stds.to_dict(),
+            'p_values': model_result.summary.p.to_dict(),
+            'n_events': model_data[event_col].sum(),
+            'n_samples': len(model_data)
+        }
+        
+        concordance_text = f"{concordance:.3f}" if concordance is not None else "skipped"
+        print(f"✅ [COX MODELS] {transition_name} model fitted successfully (concordance: {concordance_text})")
+        return transition_name, model_result, stats
+        
+    except Exception as e:
+        print(f"❌ [COX MODELS] Error fitting {transition_name} model: {e}")
+        return transition_name, None, None
+
+
 class EnhancedMultiStateModel:
     """
     Complete multi-state hazard model with Korean Airlines financial data
     """
     
+    # Financial data shared across instances, keyed by (USE_REAL_DATA, company set)
+    _financial_data_cache: Dict[tuple, pd.DataFrame] = {}
+    _FINANCIAL_DATA_CACHE_SIZE = 4
+    
     def __init__(self, use_financial_data: bool = True):
         """
         Initialize enhanced model with Korean Airlines data
@@ -63,9 +441,10 @@ class EnhancedMultiStateModel:
         self.use_financial_data = use_financial_data
         self.rating_data = None
         self.financial_data = None
-        self.transition_episodes = []
+        self.transition_episodes_df = None
         self.survival_data = None
         self.cox_models = {}
+        self.cox_results = {}
         self.baseline_hazards = {}
         
         # Generate Korean Airlines data (with timeout protection)
@@ -187,8 +566,10 @@ class EnhancedMultiStateModel:
             print("⚠️ RatingMapping.csv not found, generating sample mapping...")
             rating_mapping = self._generate_sample_rating_mapping()
         
-        # Merge rating numbers
-        self.rating_data = rating_data.merge(rating_mapping, on='RatingSymbol', how='left')
+        # Resolve rating numbers via a dict lookup on the handful of rating symbols
+        symbol_to_number = dict(zip(rating_mapping['RatingSymbol'], rating_mapping['RatingNumber']))
+        rating_data['RatingNumber'] = rating_data['RatingSymbol'].map(symbol_to_number)
+        self.rating_data = rating_data
         
         # Map sample company IDs to Korean Airlines
         company_mapping = {
@@ -206,10 +587,9 @@ class EnhancedMultiStateModel:
         if self.financial_data is not None:
             print(f"✅ Generated financial data with {len(self.financial_data)} records")
             
-    def _generate_synthetic_financial_data(self, company_mapping):
-        """Collect real financial data from DART API or use synthetic data based on configuration"""
-        
-        # Import configuration
+    @staticmethod
+    def _use_real_data() -> bool:
+        """USE_REAL_DATA 설정 조회"""
         try:
             # Try different import paths for config
             try:
@@ -218,8 +598,39 @@ class EnhancedMultiStateModel:
                 from config import USE_REAL_DATA
         except ImportError:
             USE_REAL_DATA = False  # Default to synthetic data if config unavailable
+        return USE_REAL_DATA
+    
+    def _generate_synthetic_financial_data(self, company_mapping):
+        """
+        Collect real financial data from DART API or use synthetic data based on configuration
+        
+        Results are memoized at class level per (USE_REAL_DATA, company set), so
+        repeated model instantiation (tuning, ensembling) skips the whole pipeline.
+        """
         
-        if USE_REAL_DATA:
+        use_real_data = self._use_real_data()
+        cache_key = (use_real_data, tuple(sorted(
+            (company_id, tuple(sorted(info.items()))) for company_id, info in company_mapping.items()
+        )))
+        
+        cache = EnhancedMultiStateModel._financial_data_cache
+        if cache_key in cache:
+            print("📦 Using in-memory financial data from a previous model instance")
+            cache[cache_key] = cache.pop(cache_key)  # mark as most recently used
+            self.financial_data = cache[cache_key].copy()
+            return
+        
+        self._load_financial_data(company_mapping, use_real_data)
+        
+        if self.financial_data is not None:
+            cache[cache_key] = self.financial_data.copy()
+            while len(cache) > self._FINANCIAL_DATA_CACHE_SIZE:
+                cache.pop(next(iter(cache)))  # evict least recently used
+    
+    def _load_financial_data(self, company_mapping, use_real_data: bool):
+        """Collect real financial data from DART API or use synthetic data"""
+        
+        if use_real_data:
             print("💰 [REAL DATA MODE] Checking cache and collecting real financial data...")
             
             # 먼저 캐시 확인
@@ -242,6 +653,7 @@ class EnhancedMultiStateModel:
                     # 🔧 Additional data quality checks
                     self._validate_financial_data_quality()
                     
+                    self.financial_data = self._downcast_financial_data(self.financial_data)
                     print(f"📊 Final cached data columns: {list(self.financial_data.columns)[:15]}")
                     return
                 else:
@@ -271,6 +683,7 @@ class EnhancedMultiStateModel:
                         # Fill missing ratios with industry averages
                         self.financial_data = self._fill_missing_ratios(self.financial_data)
                     
+                    self.financial_data = self._downcast_financial_data(self.financial_data)
                     print(f"✅ Using real financial data from DART API ({len(self.financial_data)} records)")
                     print(f"📊 Final data columns: {list(self.financial_data.columns)[:15]}")
                     return
@@ -284,7 +697,35 @@ class EnhancedMultiStateModel:
         
         # Use synthetic data (either as fallback or by configuration)
         print("💰 Generating fallback synthetic financial data...")
-        self.financial_data = self._generate_fallback_synthetic_data(company_mapping)
+        self.financial_data = self._downcast_financial_data(
+            self._generate_fallback_synthetic_data(company_mapping)
+        )
+    
+    @staticmethod
+    def _period_dates(years, months, days) -> np.ndarray:
+        """Assemble datetime64 values from integer year/month/day arrays (no string parsing)
+        
+        Returns a plain array so callers can assign it positionally to a column
+        regardless of the frame index.
+        """
+        years = np.asarray(years)
+        return pd.to_datetime(pd.DataFrame({
+            'year': years,
+            'month': np.broadcast_to(months, years.shape),
+            'day': np.broadcast_to(days, years.shape)
+        })).to_numpy()
+    
+    @staticmethod
+    def _downcast_financial_data(df: pd.DataFrame) -> pd.DataFrame:
+        """Store ratios as float32 and calendar fields as small ints (halves the covariate footprint)"""
+        
+        ratio_cols = [col for col in df.columns if df[col].dtype == np.float64]
+        df[ratio_cols] = df[ratio_cols].astype(np.float32)
+        
+        for col, dtype in (('year', np.int16), ('quarter', np.int8)):
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                df[col] = df[col].astype(dtype)
+        return df
     
     def _check_cache_availability(self, company_mapping):
         """Check if sufficient cached data is available"""
@@ -556,7 +997,7 @@ class EnhancedMultiStateModel:
                             if ratios:
                                 ratios['company_id'] = company_id
                                 ratios['company_name'] = company_name
-                                ratios['date'] = f"{year}-12-31"
+                                ratios['year'] = year
                                 all_financial_data.append(ratios)
                                 print(f"  ✅ [CACHE LOAD] Loaded cached data for {company_name} {year}")
                             else:
@@ -570,6 +1011,7 @@ class EnhancedMultiStateModel:
             
             if all_financial_data:
                 df = pd.DataFrame(all_financial_data)
+                df['date'] = self._period_dates(df['year'], 12, 31)
                 print(f"✅ [CACHE LOAD] Loaded {len(df)} cached financial records")
                 return df
             else:
@@ -647,202 +1089,208 @@ class EnhancedMultiStateModel:
         # 전체 타임아웃 설정 (10분)
         import time
         import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
         start_time = time.time()
         max_total_time = 600  # 10분
         
+        def add_ratio_record(ratios, company_id, company_name, year):
+            ratios['company_id'] = company_id
+            ratios['company_name'] = company_name
+            ratios['year'] = year
+            financial_records.append(ratios)
+        
+        def calculate_and_store(fs_data, corp_code, company_id, company_name, year):
+            # 재무비율 계산
+            try:
+                # 올바른 메서드 호출 - process_company_financial_data 사용
+                ratios = calculator.process_company_financial_data(fs_data)
+                if ratios:
+                    cache.cache_ratios(corp_code, year, ratios, company_name)
+                    add_ratio_record(ratios, company_id, company_name, year)
+                    print(f"  ✅ Ratios calculated for {company_name} {year}: {len(ratios)} ratios")
+                else:
+                    print(f"  ⚠️ No ratios calculated for {company_name} {year}")
+            except Exception as ratio_error:
+                print(f"  ⚠️ Ratio calculation error for {company_name} {year}: {ratio_error}")
+        
+        # Collect data for multiple years (동적 10년 데이터)
+        current_year = datetime.now().year
+        start_year = current_year - 10
+        
+        # 1단계: 캐시 조회 - 캐시에 없는 (corp_code, company_name, company_id, year)만 API 호출 대상으로 수집
+        cache_hits = 0
+        pending_fetches = []
+        
         for company_id, info in company_mapping.items():
-            # 전체 타임아웃 체크
-            if time.time() - start_time > max_total_time:
-                print(f"⚠️ [DART DATA] Total timeout reached ({max_total_time}s), stopping data collection")
-                break
-                
             company_name = info["name"]
             print(f"\n🏢 [DART DATA] Processing company: {company_name}")
             
             # Get corp_code from mapping
-            corp_code = None
-            for name, corp_info in KOREAN_AIRLINES_CORP_MAPPING.items():
-                if name == company_name:
-                    corp_code = corp_info['corp_code']
-                    print(f"🔍 [DART DATA] Found corp_code: {corp_code} for {company_name}")
-                    break
+            corp_info = KOREAN_AIRLINES_CORP_MAPPING.get(company_name)
+            corp_code = corp_info['corp_code'] if corp_info else None
             
             if corp_code is None:
                 print(f"⚠️ [DART DATA] Corp code not found for {company_name}, skipping...")
                 continue
-            
-            print(f"📊 [DART DATA] Starting data collection for {company_name} ({corp_code})...")
-            
-            # 캐시 통계 초기화
-            cache_hits = 0
-            api_calls = 0
-            
-            # Collect data for multiple years (동적 10년 데이터)
-            current_year = datetime.now().year
-            start_year = current_year - 10
-            
-            # 회사별 타임아웃 설정 (2분)
-            company_start_time = time.time()
-            max_company_time = 120  # 2분
+            print(f"🔍 [DART DATA] Found corp_code: {corp_code} for {company_name}")
             
             for year in range(start_year, current_year + 1):  # 동적 연도 범위
-                # 회사별 타임아웃 체크
-                if time.time() - company_start_time > max_company_time:
-                    print(f"⚠️ [DART DATA] Company timeout reached for {company_name}, moving to next company")
-                    break
-                    
                 try:
+                    # 계산된 재무비율 캐시 확인 (DART 호출 및 비율 재계산 생략)
+                    cached_ratios = cache.get_cached_ratios(corp_code, year)
+                    if cached_ratios is not None:
+                        cache_hits += 1
+                        add_ratio_record(dict(cached_ratios), company_id, company_name, year)
+                        print(f"  📦 Using cached ratios for {company_name} {year}")
+                        continue
+                    
                     # 연간 데이터를 분기별로 캐시 확인
                     cached_data = cache.get_cached_data(corp_code, year, 0, "annual")  # quarter=0 for annual
-                    
                     if cached_data is not None:
                         print(f"  📦 Using cached data for {company_name} {year}")
                         cache_hits += 1
-                        fs_data = cached_data
-                    else:
-                        # API 호출 타임아웃 설정 (30초)
-                        api_timeout = 30
-                        fs_data = None
-                        api_exception = None
-                        
-                        def fetch_fs_data():
-                            nonlocal fs_data, api_exception
-                        try:
-                                # 올바른 DART API 호출 방식 (날짜 범위 수정)
-                                fs_data = extract(
-                                corp_code=corp_code,
-                                    bgn_de=f"{year}0101",  # 연초 시작
-                                    end_de=f"{year}1231",  # 연말 종료
-                                    separate=False,  # 연결재무제표
-                                    report_tp='annual'  # 연간보고서
-                                )
-                        except Exception as e:
-                                api_exception = e
-                        
-                        # 별도 스레드에서 API 호출
-                        api_thread = threading.Thread(target=fetch_fs_data)
-                        api_thread.daemon = True
-                        api_thread.start()
-                        
-                        # API 타임아웃 대기
-                        api_thread.join(api_timeout)
-                        
-                        if api_thread.is_alive():
-                            print(f"  ⚠️ API timeout for {company_name} {year}, skipping...")
-                            continue
-                        
-                        if api_exception is not None:
-                            print(f"  ⚠️ API error for {company_name} {year}: {api_exception}")
-                            continue
-                        
-                        if fs_data is None:
-                            print(f"  ⚠️ No data returned for {company_name} {year}")
-                            continue
-                        
-                        api_calls += 1
-                        print(f"  📡 API call successful for {company_name} {year}")
-                        
-                        # 🔥 캐시 저장 추가 - FinancialStatement를 dict로 변환해서 저장
-                        try:
-                            # FinancialStatement 객체를 직렬화 가능한 dict로 변환
-                            cache_data = {
-                                'company_name': company_name,
-                                'year': year,
-                                'bs_data': {},  # Balance Sheet
-                                'is_data': {},  # Income Statement  
-                                'cf_data': {},  # Cash Flow
-                                'metadata': {
-                                    'corp_code': corp_code,
-                                    'cached_at': datetime.now().isoformat(),
-                                    'data_type': 'annual'
-                                }
-                            }
-                            
-                            # FinancialStatement에서 실제 재무제표 데이터 추출
-                            try:
-                                # 재무상태표 데이터 추출
-                                if hasattr(fs_data, 'show'):
-                                    bs_df = fs_data.show('bs')
-                                    if bs_df is not None and not bs_df.empty:
-                                        # DataFrame을 dict로 변환 (최신값만)
-                                        if len(bs_df.columns) > 0:
-                                            latest_col = bs_df.columns[-1]  # 최신 연도 데이터
-                                            cache_data['bs_data'] = bs_df[latest_col].dropna().to_dict()
-                                    
-                                    # 손익계산서 데이터 추출
-                                    is_df = fs_data.show('is')
-                                    if is_df is None:
-                                        is_df = fs_data.show('cis')  # Comprehensive Income Statement
-                                    if is_df is not None and not is_df.empty:
-                                        if len(is_df.columns) > 0:
-                                            latest_col = is_df.columns[-1]
-                                            cache_data['is_data'] = is_df[latest_col].dropna().to_dict()
-                                    
-                                    # 현금흐름표 데이터 추출
-                                    cf_df = fs_data.show('cf')
-                                    if cf_df is not None and not cf_df.empty:
-                                        if len(cf_df.columns) > 0:
-                                            latest_col = cf_df.columns[-1]
-                                            cache_data['cf_data'] = cf_df[latest_col].dropna().to_dict()
-                                
-                                print(f"  📊 Extracted: BS={len(cache_data['bs_data'])}, IS={len(cache_data['is_data'])}, CF={len(cache_data['cf_data'])}")
-                                
-                            except Exception as extract_error:
-                                print(f"  ⚠️ Error extracting financial data: {extract_error}")
-                                # 추출 실패 시 원본 객체 정보라도 저장
-                                cache_data['raw_data_type'] = str(type(fs_data))
-                                cache_data['available_methods'] = [method for method in dir(fs_data) if not method.startswith('_')]
-                            
-                            cache_saved = cache.cache_data(
-                                    corp_code=corp_code,
-                                year=year,
-                                quarter=0,  # 연간 데이터
-                                data=cache_data,  # 변환된 dict 저장
-                                data_type="annual",
-                                company_name=company_name
-                            )
-                            if cache_saved:
-                                print(f"  💾 Cached DART data for {company_name} {year}")
-                            else:
-                                print(f"  ⚠️ Failed to cache DART data for {company_name} {year}")
-                        except Exception as cache_error:
-                            print(f"  ⚠️ Cache save error for {company_name} {year}: {cache_error}")
-                            import traceback
-                            print(f"  📋 Cache error details: {traceback.format_exc()}")
-                    
-                    # 재무비율 계산 (타임아웃 보호)
-                    try:
-                        # 올바른 메서드 호출 - process_company_financial_data 사용
-                        ratios = calculator.process_company_financial_data(fs_data)
-                        if ratios:
-                            ratios['company_id'] = company_id
-                            ratios['company_name'] = company_name
-                            ratios['year'] = year
-                            ratios['date'] = f"{year}-12-31"
-                            financial_records.append(ratios)
-                            print(f"  ✅ Ratios calculated for {company_name} {year}: {len(ratios)} ratios")
-                        else:
-                            print(f"  ⚠️ No ratios calculated for {company_name} {year}")
-                    except Exception as ratio_error:
-                        print(f"  ⚠️ Ratio calculation error for {company_name} {year}: {ratio_error}")
+                        calculate_and_store(cached_data, corp_code, company_id, company_name, year)
                         continue
-                        
                 except Exception as year_error:
                     print(f"  ⚠️ Error processing {company_name} {year}: {year_error}")
                     continue
+                
+                pending_fetches.append((corp_code, company_name, company_id, year))
+        
+        # 2단계: 캐시 미스 구간만 DART API 병렬 호출 (I/O 바운드)
+        print(f"📡 [DART DATA] {cache_hits} cache hits, {len(pending_fetches)} API calls pending")
+        
+        # DART 요청 제한 준수를 위한 동시 요청 수 제한
+        rate_limiter = threading.Semaphore(4)
+        
+        def fetch_fs_data(corp_code, year):
+            with rate_limiter:
+                # 올바른 DART API 호출 방식 (날짜 범위 수정)
+                return extract(
+                    corp_code=corp_code,
+                    bgn_de=f"{year}0101",  # 연초 시작
+                    end_de=f"{year}1231",  # 연말 종료
+                    separate=False,  # 연결재무제표
+                    report_tp='annual'  # 연간보고서
+                )
+        
+        api_calls = 0
+        if pending_fetches:
+            executor = ThreadPoolExecutor(max_workers=8)
+            futures = {
+                executor.submit(fetch_fs_data, corp_code, year): (corp_code, company_name, company_id, year)
+                for corp_code, company_name, company_id, year in pending_fetches
+            }
             
-            print(f"📊 [DART DATA] Completed {company_name}: {cache_hits} cache hits, {api_calls} API calls")
+            try:
+                remaining_time = max(max_total_time - (time.time() - start_time), 1)
+                # 캐시 저장 및 비율 계산은 메인 스레드에서 수행 (캐시 쓰기 단일 스레드 유지)
+                for future in as_completed(futures, timeout=remaining_time):
+                    corp_code, company_name, company_id, year = futures[future]
+                    
+                    try:
+                        fs_data = future.result()
+                    except Exception as api_exception:
+                        print(f"  ⚠️ API error for {company_name} {year}: {api_exception}")
+                        continue
+                    
+                    if fs_data is None:
+                        print(f"  ⚠️ No data returned for {company_name} {year}")
+                        continue
+                    
+                    api_calls += 1
+                    print(f"  📡 API call successful for {company_name} {year}")
+                    
+                    # 🔥 캐시 저장 추가 - FinancialStatement를 dict로 변환해서 저장
+                    try:
+                        cache_data = self._financial_statement_to_cache_dict(fs_data, corp_code, company_name, year)
+                        cache_saved = cache.cache_data(
+                            corp_code=corp_code,
+                            year=year,
+                            quarter=0,  # 연간 데이터
+                            data=cache_data,  # 변환된 dict 저장
+                            data_type="annual",
+                            company_name=company_name
+                        )
+                        if cache_saved:
+                            print(f"  💾 Cached DART data for {company_name} {year}")
+                        else:
+                            print(f"  ⚠️ Failed to cache DART data for {company_name} {year}")
+                    except Exception as cache_error:
+                        print(f"  ⚠️ Cache save error for {company_name} {year}: {cache_error}")
+                        import traceback
+                        print(f"  📋 Cache error details: {traceback.format_exc()}")
+                    
+                    calculate_and_store(fs_data, corp_code, company_id, company_name, year)
+                    
+            except FuturesTimeoutError:
+                print(f"⚠️ [DART DATA] Total timeout reached ({max_total_time}s), stopping data collection")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        print(f"📊 [DART DATA] Collection summary: {cache_hits} cache hits, {api_calls} API calls")
         
         print(f"🏁 [DART DATA] Data collection completed: {len(financial_records)} records")
         
         if financial_records:
             df = pd.DataFrame(financial_records)
+            df['date'] = self._period_dates(df['year'], 12, 31)
             print(f"✅ [DART DATA] Created DataFrame with {len(df)} records and {len(df.columns)} columns")
             return df
         else:
             print("⚠️ [DART DATA] No financial records collected, using fallback data")
             return self._generate_fallback_synthetic_data(company_mapping)
     
+    def _financial_statement_to_cache_dict(self, fs_data, corp_code: str, company_name: str, year: int) -> Dict[str, Any]:
+        """FinancialStatement 객체를 직렬화 가능한 dict로 변환"""
+        
+        cache_data = {
+            'company_name': company_name,
+            'year': year,
+            'bs_data': {},  # Balance Sheet
+            'is_data': {},  # Income Statement  
+            'cf_data': {},  # Cash Flow
+            'metadata': {
+                'corp_code': corp_code,
+                'cached_at': datetime.now().isoformat(),
+                'data_type': 'annual'
+            }
+        }
+        
+        # FinancialStatement에서 실제 재무제표 데이터 추출
+        try:
+            if hasattr(fs_data, 'show'):
+                # 재무상태표 데이터 추출
+                bs_df = fs_data.show('bs')
+                if bs_df is not None and not bs_df.empty and len(bs_df.columns) > 0:
+                    # DataFrame을 dict로 변환 (최신값만)
+                    latest_col = bs_df.columns[-1]  # 최신 연도 데이터
+                    cache_data['bs_data'] = bs_df[latest_col].dropna().to_dict()
+                
+                # 손익계산서 데이터 추출
+                is_df = fs_data.show('is')
+                if is_df is None:
+                    is_df = fs_data.show('cis')  # Comprehensive Income Statement
+                if is_df is not None and not is_df.empty and len(is_df.columns) > 0:
+                    latest_col = is_df.columns[-1]
+                    cache_data['is_data'] = is_df[latest_col].dropna().to_dict()
+                
+                # 현금흐름표 데이터 추출
+                cf_df = fs_data.show('cf')
+                if cf_df is not None and not cf_df.empty and len(cf_df.columns) > 0:
+                    latest_col = cf_df.columns[-1]
+                    cache_data['cf_data'] = cf_df[latest_col].dropna().to_dict()
+            
+            print(f"  📊 Extracted: BS={len(cache_data['bs_data'])}, IS={len(cache_data['is_data'])}, CF={len(cache_data['cf_data'])}")
+            
+        except Exception as extract_error:
+            print(f"  ⚠️ Error extracting financial data: {extract_error}")
+            # 추출 실패 시 원본 객체 정보라도 저장
+            cache_data['raw_data_type'] = str(type(fs_data))
+            cache_data['available_methods'] = [method for method in dir(fs_data) if not method.startswith('_')]
+        
+        return cache_data
+    
     def _fill_missing_ratios(self, df):
         """Fill missing financial ratios with industry averages and interpolation"""
         
@@ -872,12 +1320,10 @@ class EnhancedMultiStateModel:
             'sales_growth': 0.05
         }
         
-        # Fill missing values
-        for ratio, avg_value in industry_averages.items():
-            if ratio in df.columns:
-                df[ratio] = df[ratio].fillna(avg_value)
-            else:
-                df[ratio] = avg_value
+        # Add absent ratio columns, then fill missing values in a single pass
+        df = df.assign(**{ratio: avg_value for ratio, avg_value in industry_averages.items()
+                          if ratio not in df.columns})
+        df = df.fillna(value=industry_averages)
         
         print(f"✅ Missing ratios filled for {len(df)} records")
         return df
@@ -887,103 +1333,82 @@ class EnhancedMultiStateModel:
         
         print("💰 Generating fallback synthetic financial data...")
         
-        # Set random seed for consistency
-        np.random.seed(42)
-        
-        financial_records = []
-        
-        for company_id, info in company_mapping.items():
-            # Generate data for dynamic 10-year range
-            current_year = datetime.now().year
-            start_year = current_year - 10
-            for year in range(start_year, current_year + 1):
-                for quarter in [1, 2, 3, 4]:
-                    current_year = datetime.now().year
-                    current_month = datetime.now().month
-                    current_quarter = (current_month - 1) // 3 + 1
-                    
-                    if year == current_year and quarter > current_quarter:  # Don't generate future data
-                        break
-                        
-                    # Generate ratios based on company characteristics and real industry data
-                    if info["name"] == "대한항공":  # Large, stable airline - use real data insights
-                        base_ratios = {
-                            'debt_to_assets': np.random.normal(0.74, 0.03),  # Based on real data
-                            'current_ratio': np.random.normal(0.79, 0.1),
-                            'roa': np.random.normal(0.01, 0.02),
-                            'roe': np.random.normal(0.02, 0.03),
-                            'operating_margin': np.random.normal(0.02, 0.02),
-                            'equity_ratio': np.random.normal(0.26, 0.03),  # Based on real data
-                            'asset_turnover': np.random.normal(0.6, 0.1),
-                            'interest_coverage': np.random.normal(2.5, 0.5),
-                            'quick_ratio': np.random.normal(0.27, 0.05),  # Based on real data
-                            'working_capital_ratio': np.random.normal(-0.07, 0.03)  # Based on real data
-                        }
-                    elif info["name"] == "아시아나항공":  # Financial difficulties
-                        base_ratios = {
-                            'debt_to_assets': np.random.normal(0.85, 0.1),
-                            'current_ratio': np.random.normal(0.6, 0.15),
-                            'roa': np.random.normal(-0.02, 0.03),
-                            'roe': np.random.normal(-0.05, 0.05),
-                            'operating_margin': np.random.normal(-0.01, 0.03),
-                            'equity_ratio': np.random.normal(0.15, 0.08),
-                            'asset_turnover': np.random.normal(0.5, 0.1),
-                            'interest_coverage': np.random.normal(1.2, 0.3),
-                            'quick_ratio': np.random.normal(0.5, 0.1),
-                            'working_capital_ratio': np.random.normal(-0.05, 0.05)
-                        }
-                    else:  # Other airlines - use industry averages
-                        base_ratios = {
-                            'debt_to_assets': np.random.normal(0.70, 0.1),
-                            'current_ratio': np.random.normal(0.85, 0.2),
-                            'roa': np.random.normal(0.01, 0.03),
-                            'roe': np.random.normal(0.02, 0.04),
-                            'operating_margin': np.random.normal(0.02, 0.03),
-                            'equity_ratio': np.random.normal(0.30, 0.1),
-                            'asset_turnover': np.random.normal(0.65, 0.1),
-                            'interest_coverage': np.random.normal(2.0, 0.5),
-                            'quick_ratio': np.random.normal(0.75, 0.1),
-                            'working_capital_ratio': np.random.normal(0.05, 0.05)
-                        }
-                    
-                    # Add COVID-19 impact (2020-2021)
-                    if year in [2020, 2021]:
-                        base_ratios['roa'] *= 0.3
-                        base_ratios['roe'] *= 0.2
-                        base_ratios['operating_margin'] *= 0.1
-                        base_ratios['current_ratio'] *= 0.8
-                        base_ratios['debt_to_assets'] *= 1.1
-                    
-                    # Add additional ratios
-                    additional_ratios = {
-                        'net_margin': base_ratios['operating_margin'] * 0.8,
-                        'debt_to_equity': base_ratios['debt_to_assets'] / max(base_ratios['equity_ratio'], 0.01),
-                        'cash_ratio': base_ratios['quick_ratio'] * 0.6,
-                        'gross_margin': base_ratios['operating_margin'] * 1.5,
-                        'times_interest_earned': base_ratios['interest_coverage'],
-                        'inventory_turnover': np.random.normal(8.0, 2.0),
-                        'receivables_turnover': np.random.normal(12.0, 3.0),
-                        'payables_turnover': np.random.normal(6.0, 2.0),
-                        'total_asset_growth': np.random.normal(0.03, 0.05),
-                        'sales_growth': np.random.normal(0.05, 0.1)
-                    }
-                    
-                    base_ratios.update(additional_ratios)
-                    
-                    # Create record
-                    record = {
-                        'company_id': company_id,  # Consistent with DART data structure
-                        'company_name': info["name"],
-                        'year': year,
-                        'quarter': quarter,
-                        'date': f"{year}-{quarter*3:02d}-01",
-                        **base_ratios
-                    }
-                    
-                    financial_records.append(record)
+        base_ratio_names = [
+            'debt_to_assets', 'current_ratio', 'roa', 'roe', 'operating_margin',
+            'equity_ratio', 'asset_turnover', 'interest_coverage', 'quick_ratio',
+            'working_capital_ratio'
+        ]
         
-        self.financial_data = pd.DataFrame(financial_records)
-        self.financial_data['date'] = pd.to_datetime(self.financial_data['date'])
+        # (mean, std) per base ratio, based on company characteristics and real industry data
+        ratio_profiles = {
+            # Large, stable airline - use real data insights
+            "대한항공": [(0.74, 0.03), (0.79, 0.1), (0.01, 0.02), (0.02, 0.03), (0.02, 0.02),
+                      (0.26, 0.03), (0.6, 0.1), (2.5, 0.5), (0.27, 0.05), (-0.07, 0.03)],
+            # Financial difficulties
+            "아시아나항공": [(0.85, 0.1), (0.6, 0.15), (-0.02, 0.03), (-0.05, 0.05), (-0.01, 0.03),
+                        (0.15, 0.08), (0.5, 0.1), (1.2, 0.3), (0.5, 0.1), (-0.05, 0.05)],
+        }
+        # Other airlines - use industry averages
+        default_profile = [(0.70, 0.1), (0.85, 0.2), (0.01, 0.03), (0.02, 0.04), (0.02, 0.03),
+                           (0.30, 0.1), (0.65, 0.1), (2.0, 0.5), (0.75, 0.1), (0.05, 0.05)]
+        
+        # Company × year × quarter grid for dynamic 10-year range
+        now = datetime.now()
+        current_year = now.year
+        current_quarter = (now.month - 1) // 3 + 1
+        company_ids = list(company_mapping.keys())
+        grid = pd.MultiIndex.from_product(
+            [range(len(company_ids)), range(current_year - 10, current_year + 1), [1, 2, 3, 4]],
+            names=['company_idx', 'year', 'quarter']
+        ).to_frame(index=False)
+        # Don't generate future data
+        grid = grid[(grid['year'] < current_year) | (grid['quarter'] <= current_quarter)]
+        
+        company_idx = grid['company_idx'].to_numpy()
+        years = grid['year'].to_numpy()
+        n_rows = len(grid)
+        
+        profiles = np.array([ratio_profiles.get(company_mapping[cid]["name"], default_profile)
+                             for cid in company_ids])  # (n_companies, 10, 2)
+        loc = profiles[company_idx, :, 0]
+        scale = profiles[company_idx, :, 1]
+        
+        # Single RNG call for all base ratios (seeded for consistency)
+        rng = np.random.default_rng(42)
+        base = rng.normal(loc, scale)
+        ratios = dict(zip(base_ratio_names, base.T))
+        
+        # Add COVID-19 impact (2020-2021)
+        covid = np.isin(years, [2020, 2021])
+        covid_multipliers = {'roa': 0.3, 'roe': 0.2, 'operating_margin': 0.1,
+                             'current_ratio': 0.8, 'debt_to_assets': 1.1}
+        for ratio, multiplier in covid_multipliers.items():
+            ratios[ratio] = np.where(covid, ratios[ratio] * multiplier, ratios[ratio])
+        
+        # Add additional ratios
+        extra = rng.normal([8.0, 12.0, 6.0, 0.03, 0.05], [2.0, 3.0, 2.0, 0.05, 0.1], size=(n_rows, 5))
+        ratios.update({
+            'net_margin': ratios['operating_margin'] * 0.8,
+            'debt_to_equity': ratios['debt_to_assets'] / np.maximum(ratios['equity_ratio'], 0.01),
+            'cash_ratio': ratios['quick_ratio'] * 0.6,
+            'gross_margin': ratios['operating_margin'] * 1.5,
+            'times_interest_earned': ratios['interest_coverage'],
+            'inventory_turnover': extra[:, 0],
+            'receivables_turnover': extra[:, 1],
+            'payables_turnover': extra[:, 2],
+            'total_asset_growth': extra[:, 3],
+            'sales_growth': extra[:, 4]
+        })
+        
+        names = np.array([company_mapping[cid]["name"] for cid in company_ids])
+        self.financial_data = pd.DataFrame({
+            'company_id': np.asarray(company_ids)[company_idx],  # Consistent with DART data structure
+            'company_name': names[company_idx],
+            'year': years,
+            'quarter': grid['quarter'].to_numpy(),
+            'date': self._period_dates(years, grid['quarter'].to_numpy() * 3, 1),
+            **ratios
+        })
         print(f"✅ Generated fallback financial data with {len(self.financial_data)} records")
         return self.financial_data
         
@@ -1004,163 +1429,187 @@ class EnhancedMultiStateModel:
         self.rating_data['Date'] = pd.to_datetime(self.rating_data['Date'])
         self.rating_data = self.rating_data.sort_values(['Id', 'Date'])
         
-        self.transition_episodes = []
+        # Consecutive observations of the same company form one episode
+        ids = self.rating_data['Id'].to_numpy()
+        pair_mask = ids[:-1] == ids[1:]
+        current_obs = self.rating_data.iloc[:-1][pair_mask]
+        next_obs = self.rating_data.iloc[1:][pair_mask]
+        n = len(current_obs)
+        
+        from_rating = current_obs['RatingNumber'].to_numpy()
+        to_rating = next_obs['RatingNumber'].to_numpy()
+        # Integer rating scales fit in int8 (fractional notch scales stay float)
+        ratings = np.concatenate([from_rating, to_rating]).astype(np.float64)
+        if len(ratings) and np.all(np.isfinite(ratings)) and np.all(ratings == np.round(ratings)):
+            from_rating = from_rating.astype(np.int8)
+            to_rating = to_rating.astype(np.int8)
+        from_symbol = current_obs['RatingSymbol'].to_numpy()
+        to_symbol = next_obs['RatingSymbol'].to_numpy()
+        start_date = current_obs['Date'].to_numpy()
+        end_date = next_obs['Date'].to_numpy()
+        
+        # Classify transition type based on rating symbols (not hardcoded numbers)
+        transition_type = np.select(
+            [
+                to_symbol == 'D',
+                np.isin(to_symbol, ['WD', 'NR']),
+                to_rating < from_rating,  # Upgrade (lower number = better rating)
+                to_rating > from_rating,  # Downgrade (higher number = worse rating)
+            ],
+            [StateDefinition.DEFAULT, StateDefinition.WITHDRAWN,
+             StateDefinition.UPGRADE, StateDefinition.DOWNGRADE],
+            default=StateDefinition.STABLE  # Same rating
+        ).astype(np.int16)
+        
+        # Columnar (SoA) episode table
+        episode_columns = {
+            'company_id': current_obs['Id'].to_numpy(),
+            'start_date': start_date,
+            'end_date': end_date,
+            # 🔧 Keep duration in years (natural unit for annual rating data)
+            'duration': (end_date - start_date) / np.timedelta64(1, 'D') / 365.25,
+            'from_rating': from_rating,
+            'to_rating': to_rating,
+            'from_symbol': from_symbol,
+            'to_symbol': to_symbol,
+            'transition_type': transition_type,
+            'event_occurred': np.ones(n, dtype=np.int8),
+            'censored': np.zeros(n, dtype=np.int8)
+        }
         
-        for company_id in self.rating_data['Id'].unique():
-            company_data = self.rating_data[self.rating_data['Id'] == company_id].copy()
-            
-            if len(company_data) < 2:
-                continue
-                
-            for i in range(len(company_data) - 1):
-                current_obs = company_data.iloc[i]
-                next_obs = company_data.iloc[i + 1]
-                
-                # Calculate transition
-                from_rating = current_obs['RatingNumber']
-                to_rating = next_obs['RatingNumber']
-                # 🔧 Keep duration in years (natural unit for annual rating data)
-                duration = (next_obs['Date'] - current_obs['Date']).days / 365.25
-                
-                # Classify transition type based on rating symbols (not hardcoded numbers)
-                to_symbol = next_obs['RatingSymbol']
-                from_symbol = current_obs['RatingSymbol']
-                
-                if to_symbol == 'D':
-                    transition_type = StateDefinition.DEFAULT
-                elif to_symbol in {'WD', 'NR'}:
-                    transition_type = StateDefinition.WITHDRAWN
-                elif to_rating < from_rating:  # Upgrade (lower number = better rating)
-                    transition_type = StateDefinition.UPGRADE
-                elif to_rating > from_rating:  # Downgrade (higher number = worse rating)
-                    transition_type = StateDefinition.DOWNGRADE
-                else:  # Same rating
-                    transition_type = StateDefinition.STABLE
-                
-                # Create base episode
-                episode = {
-                    'company_id': company_id,
-                    'start_date': current_obs['Date'],
-                    'end_date': next_obs['Date'],
-                    'duration': duration,
-                    'from_rating': from_rating,
-                    'to_rating': to_rating,
-                    'from_symbol': current_obs['RatingSymbol'],
-                    'to_symbol': next_obs['RatingSymbol'],
-                    'transition_type': transition_type,
-                    'event_occurred': 1,
-                    'censored': 0
-                }
-                
-                # Add financial covariates
-                if self.use_financial_data and self.financial_data is not None:
-                    financial_ratios = self._get_financial_ratios(company_id, current_obs['Date'])
-                    episode.update(financial_ratios)
-                else:
-                    # Add dummy financial ratios
-                    episode.update({
-                        'debt_to_assets': 0, 'current_ratio': 0, 'roa': 0,
-                        'roe': 0, 'operating_margin': 0, 'equity_ratio': 0
-                    })
-                
-                self.transition_episodes.append(episode)
+        if not (self.use_financial_data and self.financial_data is not None):
+            # Add dummy financial ratios
+            for ratio in ['debt_to_assets', 'current_ratio', 'roa', 'roe', 'operating_margin', 'equity_ratio']:
+                episode_columns[ratio] = np.zeros(n)
         
-        print(f"✅ Created {len(self.transition_episodes)} transition episodes")
+        episodes_df = pd.DataFrame(episode_columns, copy=False)
+        
+        # Add financial covariates (most recent ratios as of each episode start)
+        if n and self.use_financial_data and self.financial_data is not None:
+            episodes_df = self._attach_financial_ratios(episodes_df)
+        
+        self.transition_episodes_df = episodes_df
+        
+        print(f"✅ Created {len(episodes_df)} transition episodes")
         
         # Debug: Count episodes by transition type
-        if self.transition_episodes:
-            from collections import Counter
-            transition_counts = Counter([ep['transition_type'] for ep in self.transition_episodes])
+        if n:
+            transition_counts = episodes_df['transition_type'].value_counts(sort=False)
             print(f"📊 [TRANSITION DEBUG] Episode counts by type:")
             for trans_type, count in transition_counts.items():
                 print(f"  📊 {trans_type}: {count} episodes")
+    
+    @property
+    def transition_episodes(self) -> List[Dict[str, Any]]:
+        """Transition episodes as a list of records (row view of transition_episodes_df)"""
+        if self.transition_episodes_df is None:
+            return []
+        return self.transition_episodes_df.to_dict('records')
+    
+    def _attach_financial_ratios(self, episodes: pd.DataFrame) -> pd.DataFrame:
+        """Attach financial ratios to episodes with a single as-of join
         
-    def _get_financial_ratios(self, company_id: int, date: pd.Timestamp) -> Dict[str, float]:
-        """Get financial ratios for a company at a specific date"""
+        Each episode gets the most recent financial record on or before its
+        start date. Episodes without any prior record fall back to the
+        earliest available record of the same company.
+        """
         
-        if self.financial_data is None:
-            return {}
+        if self.financial_data is None or episodes.empty:
+            return episodes
         
-        # Find the most recent financial data before the transition date
         # 🔧 Use appropriate ID column (data structure consistency)
-        if 'company_id' in self.financial_data.columns:
-            id_col = 'company_id'
-        elif 'Id' in self.financial_data.columns:
-            id_col = 'Id'
-        elif 'issuer_id' in self.financial_data.columns:
-            id_col = 'issuer_id'
-        else:
+        id_col = next((col for col in ('company_id', 'Id', 'issuer_id')
+                       if col in self.financial_data.columns), None)
+        if id_col is None:
             print(f"⚠️ No valid ID column found in financial data. Available columns: {list(self.financial_data.columns)}")
-            return {}
-        
-        company_financials = self.financial_data[
-            (self.financial_data[id_col] == company_id) &
-            (self.financial_data['date'] <= date)
-        ].sort_values('date')
-        
-        if company_financials.empty:
-            # Use the earliest available data if no prior data exists
-            company_financials = self.financial_data[
-                self.financial_data[id_col] == company_id
-            ].sort_values('date').head(1)
-        
-        if company_financials.empty:
-            return {}  # No financial data available
-        
-        latest = company_financials.iloc[-1]
+            return episodes
         
-        # Return financial ratios (exclude non-ratio columns)
+        # Financial ratios only (exclude non-ratio columns)
         exclude_cols = ['issuer_id', 'Id', 'company_id', 'company_name', 'year', 'quarter', 'date']
-        financial_ratios = {col: latest[col] for col in latest.index if col not in exclude_cols}
+        ratio_cols = [col for col in self.financial_data.columns if col not in exclude_cols]
         
-        return financial_ratios
+        financials = self.financial_data[[id_col, 'date'] + ratio_cols].rename(
+            columns={id_col: '_fin_id', 'date': '_fin_date'}
+        )
+        financials['_fin_date'] = pd.to_datetime(financials['_fin_date'])
+        financials = financials.dropna(subset=['_fin_id', '_fin_date'])
+        financials['_fin_id'] = financials['_fin_id'].astype(episodes['company_id'].dtype)
+        financials = financials.sort_values('_fin_date', kind='stable')
+        
+        left = episodes.assign(_episode_order=np.arange(len(episodes)))
+        left = left.sort_values('start_date', kind='stable')
+        
+        asof_kwargs = dict(left_on='start_date', right_on='_fin_date',
+                           left_by='company_id', right_by='_fin_id')
+        merged = pd.merge_asof(left, financials, direction='backward', **asof_kwargs)
+        
+        # Use the earliest available data if no prior data exists
+        unmatched = merged['_fin_date'].isna().to_numpy()
+        if unmatched.any():
+            earliest = pd.merge_asof(left[unmatched], financials, direction='forward', **asof_kwargs)
+            merged.loc[unmatched, ratio_cols] = earliest[ratio_cols].to_numpy()
+        
+        merged = merged.sort_values('_episode_order').drop(columns=['_episode_order', '_fin_id', '_fin_date'])
+        return merged.reset_index(drop=True)
     
     def prepare_survival_data(self) -> pd.DataFrame:
         """Prepare data for survival analysis with financial covariates"""
         
-        # Convert episodes to DataFrame
-        df = pd.DataFrame(self.transition_episodes)
+        # Episodes are already columnar
+        if self.transition_episodes_df is None:
+            self.create_transition_episodes()
+        df = self.transition_episodes_df.copy()
         
-        # Create binary outcomes for different transition types
-        df['upgrade_event'] = (df['transition_type'] == StateDefinition.UPGRADE).astype(int)
-        df['downgrade_event'] = (df['transition_type'] == StateDefinition.DOWNGRADE).astype(int)
-        df['default_event'] = (df['transition_type'] == StateDefinition.DEFAULT).astype(int)
-        df['withdrawn_event'] = (df['transition_type'] == StateDefinition.WITHDRAWN).astype(int)
+        # Create binary outcomes for different transition types in one pass
+        event_cols = ['upgrade_event', 'downgrade_event', 'default_event', 'withdrawn_event']
+        event_types = np.array([StateDefinition.UPGRADE, StateDefinition.DOWNGRADE,
+                                StateDefinition.DEFAULT, StateDefinition.WITHDRAWN])
+        events = np.equal.outer(df['transition_type'].to_numpy(), event_types).astype(np.int8)
+        df[event_cols] = events
         
         # Create rating category dummies using risk categories for better interpretability
         from utils.rating_mapping import UnifiedRatingMapping
         
-        # Create risk category dummy variables instead of individual rating dummies
-        for i, row in df.iterrows():
-            rating_num = row['from_rating']
-            rating_symbol = UnifiedRatingMapping.get_rating_symbol(rating_num)
-            
-            if rating_symbol:
-                risk_category = UnifiedRatingMapping.get_risk_category(rating_symbol)
-                # Initialize category columns if not exist
-                for category in UnifiedRatingMapping.RISK_CATEGORIES.keys():
-                    col_name = f'risk_category_{category.lower().replace(" ", "_")}'
-                    if col_name not in df.columns:
-                        df[col_name] = 0
-                
-                # Set the appropriate category
-                if risk_category:
-                    cat_col = f'risk_category_{risk_category.lower().replace(" ", "_")}'
-                    df.loc[i, cat_col] = 1
+        # Resolve rating number → (risk category, investment grade) once per rating, not per row
+        number_to_category = {
+            number: UnifiedRatingMapping.get_risk_category(symbol)
+            for number, symbol in UnifiedRatingMapping.NUMERIC_TO_RATING.items()
+        }
+        investment_grade_numbers = [
+            number for number, symbol in UnifiedRatingMapping.NUMERIC_TO_RATING.items()
+            if UnifiedRatingMapping.is_investment_grade(symbol)
+        ]
+        
+        risk_categories = df['from_rating'].map(number_to_category)
+        if risk_categories.notna().any():
+            # Create risk category dummy variables instead of individual rating dummies
+            categories = list(UnifiedRatingMapping.RISK_CATEGORIES.keys())
+            dummies = pd.get_dummies(pd.Categorical(risk_categories, categories=categories)).astype(np.int8)
+            dummies.columns = [f'risk_category_{category.lower().replace(" ", "_")}' for category in categories]
+            dummies.index = df.index
+            df = pd.concat([df, dummies], axis=1)
         
         # Also create investment grade dummy
-        df['investment_grade'] = 0
-        for i, row in df.iterrows():
-            rating_num = row['from_rating']
-            rating_symbol = UnifiedRatingMapping.get_rating_symbol(rating_num)
-            if rating_symbol and UnifiedRatingMapping.is_investment_grade(rating_symbol):
-                df.loc[i, 'investment_grade'] = 1
+        df['investment_grade'] = df['from_rating'].isin(investment_grade_numbers).astype(np.int8)
+        
+        # Narrow the remaining float64 columns for the fits; ratings stay float64
+        # because fractional grades (e.g. 2.7) are matched against the mapping tables
+        float_cols = [col for col in df.select_dtypes('float64').columns
+                      if col not in ('from_rating', 'to_rating')]
+        if float_cols:
+            df[float_cols] = df[float_cols].astype(np.float32)
         
         self.survival_data = df
         return df
     
-    def fit_enhanced_cox_models(self) -> Dict[str, Any]:
-        """Fit Cox models with financial covariates"""
+    def fit_enhanced_cox_models(self, compute_cindex: bool = True) -> Dict[str, Any]:
+        """
+        Fit Cox models with financial covariates
+        
+        Args:
+            compute_cindex: Whether to compute the concordance index of each
+                fitted model. Skip it when only coefficients are needed.
+        """
         
         if not LIFELINES_AVAILABLE:
             print("❌ lifelines not available. Cannot fit Cox models.")
@@ -1173,7 +1622,7 @@ class EnhancedMultiStateModel:
             print(f"📊 [COX DEBUG] Current state before prepare_survival_data:")
             print(f"  📊 Rating data shape: {self.rating_data.shape if self.rating_data is not None else 'None'}")
             print(f"  📊 Financial data shape: {self.financial_data.shape if self.financial_data is not None else 'None'}")
-            print(f"  📊 Transition episodes count: {len(self.transition_episodes)}")
+            print(f"  📊 Transition episodes count: {len(self.transition_episodes_df) if self.transition_episodes_df is not None else 0}")
             
             self.prepare_survival_data()
             
@@ -1217,311 +1666,43 @@ class EnhancedMultiStateModel:
             'withdrawn': 'withdrawn_event'
         }
         
-        results = {}
+        # Clean the covariate block once for all transition types
+        cov_block = self.survival_data[covariate_cols].replace([np.inf, -np.inf], np.nan)
+        valid_mask = cov_block.notna().all(axis=1) & (self.survival_data['duration'] > 0)
         
-        # 전체 타임아웃 설정 (5분)
-        import time
-        import threading
-        start_time = time.time()
-        max_total_time = 300  # 5분
+        # Each transition type is an independent fit - run them in parallel
+        fit_args = [
+            (self.survival_data.loc[valid_mask, ['duration', event_col] + covariate_cols], covariate_cols,
+             transition_name, event_col, compute_cindex)
+            for transition_name, event_col in transition_types.items()
+        ]
+        max_total_time = 300  # 전체 타임아웃 (5분)
         
-        for transition_name, event_col in transition_types.items():
-            # 전체 타임아웃 체크
-            if time.time() - start_time > max_total_time:
-                print(f"⚠️ [COX MODELS] Total timeout reached ({max_total_time}s), stopping model fitting")
-                break
-                
-            print(f"🔧 [COX MODELS] Fitting {transition_name} model...")
-            
+        # 전이 유형별 적합은 서로 독립적이므로 CPU 코어 수 범위 내에서 병렬 처리
+        # (작업이 1개이거나 단일 코어면 loky 워커 기동 비용을 피해 순차 실행)
+        n_jobs = min(4, len(fit_args), os.cpu_count() or 1)
+        
+        if JOBLIB_AVAILABLE and n_jobs > 1:
             try:
-                # Prepare data for this transition type
-                model_data = self.survival_data[
-                    ['duration', event_col] + covariate_cols
-                ].copy()
-                
-                # Remove rows with zero duration or missing values
-                model_data = model_data[
-                    (model_data['duration'] > 0) & 
-                    (model_data[covariate_cols].notna().all(axis=1))
-                ]
-                
-                # Replace infinite values with NaN and drop
-                model_data = model_data.replace([np.inf, -np.inf], np.nan).dropna()
-                
-                print(f"📊 [COX DEBUG] {transition_name} data prepared:")
-                print(f"  📊 Model data shape: {model_data.shape}")
-                print(f"  📊 Events count: {model_data[event_col].sum()}")
-                print(f"  📊 Duration stats: min={model_data['duration'].min():.4f}, max={model_data['duration'].max():.4f}")
-                
-                event_count = model_data[event_col].sum()
-                total_observations = len(model_data)
-                
-                # Event count diagnostics
-                if event_count == 0:
-                    print(f"⚠️ [COX MODELS] No events for {transition_name} transition (0/{total_observations})")
-                elif event_count < 3:
-                    print(f"⚠️ [COX MODELS] Very few events for {transition_name} transition ({event_count}/{total_observations})")
-                    print(f"🔧 [COX MODELS] Cox model may be unreliable, fallback recommended")
-                else:
-                    print(f"✅ [COX MODELS] {transition_name} has {event_count}/{total_observations} events")
-                
-                if len(model_data) == 0 or event_count == 0:
-                    print(f"🔧 [COX MODELS] Creating fallback model for {transition_name}...")
-                    
-                    # Create fallback time-dependent hazard model
-                    class FallbackTimeDepModel:
-                        def __init__(self, base_hazard=0.15):
-                            self.base_hazard = base_hazard
-                            self.baseline_hazard_ = lambda t: self.base_hazard
-                            self.params_ = pd.Series([0.0])  # Dummy parameters
-                            self.concordance_index_ = 0.5  # Dummy concordance
-                            
-                            # Create dummy summary to mimic CoxPHFitter
-                            import pandas as pd
-                            self.summary = pd.DataFrame({
-                                'coef': [0.0],
-                                'exp(coef)': [1.0], 
-                                'se(coef)': [0.1],
-                                'z': [0.0],
-                                'p': [1.0]
-                            }, index=['baseline'])
-                            
-                        def predict_cumulative_hazard(self, X, times):
-                            """Predict cumulative hazard - consistent with CoxPHFitter"""
-                            import numpy as np
-                            import pandas as pd
-                            
-                            # Ensure times is iterable
-                            if not hasattr(times, '__iter__'):
-                                times = [times]
-                            elif isinstance(times, (int, float)):
-                                times = [times]
-                            
-                            # Calculate cumulative hazards
-                            hazards = [self.base_hazard * t for t in times]
-                            return pd.DataFrame(hazards, index=times, columns=[0])
-                        
-                        def predict_survival_function(self, X, times):
-                            """Predict survival function S(t) = exp(-Λ(t)) - consistent with CoxPHFitter"""
-                            import numpy as np
-                            import pandas as pd
-                            
-                            # Ensure times is iterable
-                            if not hasattr(times, '__iter__'):
-                                times = [times]
-                            elif isinstance(times, (int, float)):
-                                times = [times]
-                            
-                            # Calculate survival probabilities  
-                            survival_probs = [np.exp(-self.base_hazard * t) for t in times]
-                            return pd.DataFrame(survival_probs, index=times, columns=[0])
-                        
-                        def predict_partial_hazard(self, X):
-                            """Predict partial hazard (always 1.0 for fallback)"""
-                            return pd.Series([1.0] * len(X), index=X.index)
-                    
-                    # Set base hazards by transition type
-                    base_hazards = {
-                        'upgrade': 0.12,      # 12% base upgrade hazard
-                        'downgrade': 0.15,    # 15% base downgrade hazard  
-                        'default': 0.02,      # 2% base default hazard
-                        'withdrawn': 0.01     # 1% base withdrawn hazard
-                    }
-                    
-                    fallback_model = FallbackTimeDepModel(base_hazards.get(transition_name, 0.10))
-                    self.cox_models[transition_name] = fallback_model
-                    
-                    print(f"✅ [COX MODELS] Fallback model created for {transition_name} with base hazard {base_hazards.get(transition_name, 0.10)}")
-                    continue
-                
-                # Remove covariates with very low variance (< 1e-10)
-                # 🔧 BUT preserve rating-related variables for differentiation
-                low_variance_cols = []
-                rating_related_cols = ['current_rating', 'from_rating', 'investment_grade'] + \
-                                    [col for col in covariate_cols if col.startswith('risk_category_')]
-                
-                for col in covariate_cols:
-                    if col in model_data.columns and model_data[col].dtype in ['float64', 'int64']:
-                        variance = model_data[col].var()
-                        # 🔧 Skip variance check for rating-related variables
-                        if col in rating_related_cols:
-                            continue  # Always keep rating variables
-                        if pd.isna(variance) or variance < 1e-10:
-                            low_variance_cols.append(col)
-                
-                if low_variance_cols:
-                    print(f"⚠️ [COX MODELS] Removing low variance covariates for {transition_name}: {low_variance_cols}")
-                    filtered_covariates = [col for col in covariate_cols if col not in low_variance_cols]
-                    if not filtered_covariates:
-                        print(f"⚠️ [COX MODELS] No valid covariates remaining for {transition_name}")
-                        continue
-                    model_data = model_data[['duration', event_col] + filtered_covariates]
-                    actual_covariates = filtered_covariates
-                else:
-                    actual_covariates = covariate_cols
-                
-                # 🔧 Check for sufficient variation in events (relaxed threshold for airline data)
-                event_count = model_data[event_col].sum()
-                # 🔧 Lower threshold for upgrade events to enable Cox model
-                min_events = 3 if transition_name == 'upgrade' else 5
-                if event_count < min_events:
-                    print(f"⚠️ [COX MODELS] Too few {transition_name} events ({event_count}<{min_events}); using fallback hazard")
-                    
-                    # 🔧 Enhanced fallback hazards: rating-dependent + airline industry specific
-                    def get_airline_base_hazard(transition_type: str) -> float:
-                        """Get airline industry base hazard rates by transition type"""
-                        # Based on Korean airline industry analysis and global aviation rating transitions
-                        base_rates = {
-                            'upgrade': {
-                                'investment_grade': 0.04,  # BBB+ and above: 4% upgrade chance
-                                'speculative': 0.06,       # BB to B: 6% upgrade chance  
-                                'highly_speculative': 0.03 # CCC and below: 3% upgrade chance
-                            },
-                            'downgrade': {
-                                'investment_grade': 0.05,  # BBB+ and above: 5% downgrade risk
-                                'speculative': 0.08,       # BB to B: 8% downgrade risk
-                                'highly_speculative': 0.12 # CCC and below: 12% downgrade risk
-                            },
-                            'default': {
-                                'investment_grade': 0.002, # BBB+ and above: 0.2% default risk
-                                'speculative': 0.015,      # BB to B: 1.5% default risk
-                                'highly_speculative': 0.06 # CCC and below: 6% default risk
-                            },
-                            'withdrawn': {
-                                'investment_grade': 0.01,  # 1% withdrawal rate
-                                'speculative': 0.015,      # 1.5% withdrawal rate
-                                'highly_speculative': 0.02 # 2% withdrawal rate
-                            }
-                        }
-                        
-                        # Default to speculative grade (most common for airlines)
-                        return base_rates.get(transition_type, {}).get('speculative', 0.05)
-                    
-                    # Create fallback model for insufficient events
-                    fallback_hazards = {
-                        'upgrade': 0.06,      # 6% base upgrade hazard
-                        'downgrade': 0.08,    # 8% base downgrade hazard  
-                        'default': 0.015,     # 1.5% base default hazard
-                        'withdrawn': 0.01     # 1% base withdrawn hazard
-                    }
-                    
-                    class FallbackTimeDepModel:
-                        def __init__(self, base_hazard=0.05):
-                            # 🔧 Base hazard is annual rate, store for proper scaling
-                            self.base_hazard = base_hazard
-                            self.annual_base_hazard = base_hazard
-                            self.baseline_hazard_ = lambda t: self.base_hazard
-                            self.params_ = pd.Series([0.0], index=['baseline'])
-                            self.concordance_index_ = 0.5  # Neutral concordance
-                            
-                            # 🔧 Add summary attribute to match CoxPHFitter interface
-                            self.summary = pd.DataFrame({
-                                'coef': [0.0],
-                                'exp(coef)': [1.0], 
-                                'se(coef)': [0.1],
-                                'z': [0.0],
-                                'p': [1.0]
-                            }, index=['baseline'])
-                            
-                        def predict_cumulative_hazard(self, X, times):
-                            """Predict cumulative hazard - uses annual base hazard with time scaling"""
-                            import numpy as np
-                            if not hasattr(times, '__iter__'):
-                                times = [times]
-                            elif isinstance(times, (int, float)):
-                                times = [times]
-                            
-                            # 🔧 Cumulative hazard = annual_base_hazard × time_in_years
-                            hazards = [self.annual_base_hazard * t for t in times]
-                            return pd.DataFrame(hazards, index=times, columns=[0])
-                        
-                        def predict_survival_function(self, X, times):
-                            """Predict survival function S(t) = exp(-Λ(t)) - uses annual base hazard"""
-                            import numpy as np
-                            if not hasattr(times, '__iter__'):
-                                times = [times]
-                            elif isinstance(times, (int, float)):
-                                times = [times]
-                            
-                            # 🔧 S(t) = exp(-annual_base_hazard × time_in_years)
-                            survival_probs = [np.exp(-self.annual_base_hazard * t) for t in times]
-                            return pd.DataFrame(survival_probs, index=times, columns=[0])
-                        
-                        def predict_partial_hazard(self, X):
-                            """Predict partial hazard (always 1.0 for fallback model)"""
-                            return pd.Series([1.0] * len(X), index=X.index)
-                    
-                    fallback_model = FallbackTimeDepModel(fallback_hazards.get(transition_name, 0.05))
-                    self.cox_models[transition_name] = fallback_model
-                    print(f"✅ [COX MODELS] Fallback model created for {transition_name} with base hazard {fallback_hazards.get(transition_name, 0.05)}")
-                    continue
-                
-                # Fit Cox model with timeout protection and stronger regularization
-                model_result = None
-                model_exception = None
-                
-                def fit_model():
-                    nonlocal model_result, model_exception
-                    try:
-                        # 🔧 Stronger penalization to prevent overfitting
-                        cph = CoxPHFitter(penalizer=0.1, l1_ratio=0.5)  # Ridge+Lasso 혼합
-                        cph.fit(
-                            model_data, 
-                            duration_col='duration', 
-                            event_col=event_col,
-                            show_progress=False  # Suppress progress bar
-                        )
-                        model_result = cph
-                    except Exception as e:
-                        model_exception = e
-                
-                # 별도 스레드에서 모델 훈련
-                model_thread = threading.Thread(target=fit_model)
-                model_thread.daemon = True
-                model_thread.start()
-                
-                # 60초 타임아웃 대기
-                model_thread.join(60)
-                
-                if model_thread.is_alive():
-                    print(f"⚠️ [COX MODELS] Model fitting timeout for {transition_name}")
-                    continue
-                
-                if model_exception is not None:
-                    print(f"⚠️ [COX MODELS] Model fitting error for {transition_name}: {model_exception}")
-                    continue
-                
-                if model_result is None:
-                    print(f"⚠️ [COX MODELS] No model result for {transition_name}")
-                    continue
-                
-                # Debug: Check model properties before storing
-                print(f"  🔍 [COX DEBUG] Model result type: {type(model_result)}")
-                print(f"  🔍 [COX DEBUG] Has summary attribute: {hasattr(model_result, 'summary')}")
-                if hasattr(model_result, 'summary'):
-                    print(f"  🔍 [COX DEBUG] Summary type: {type(model_result.summary)}")
-                print(f"  🔍 [COX DEBUG] Has concordance_index_: {hasattr(model_result, 'concordance_index_')}")
-                print(f"  🔍 [COX DEBUG] Has params_: {hasattr(model_result, 'params_')}")
-                
-                self.cox_models[transition_name] = model_result
-                
-                # Store results
-                results[transition_name] = {
-                    'model': model_result,
-                    'concordance': model_result.concordance_index_,
-                    'coefficients': model_result.params_.to_dict(),
-                    'p_values': model_result.summary.p.to_dict(),
-                    'n_events': model_data[event_col].sum(),
-                    'n_samples': len(model_data)
-                }
-                
-                print(f"✅ [COX MODELS] {transition_name} model fitted successfully (concordance: {model_result.concordance_index_:.3f})")
-                
+                fit_outputs = Parallel(n_jobs=n_jobs, backend='loky', timeout=max_total_time)(
+                    delayed(_fit_one_transition)(*args) for args in fit_args
+                )
             except Exception as e:
-                print(f"❌ [COX MODELS] Error fitting {transition_name} model: {e}")
+                print(f"⚠️ [COX MODELS] Parallel fitting failed ({e}), fitting sequentially")
+                fit_outputs = [_fit_one_transition(*args) for args in fit_args]
+        else:
+            fit_outputs = [_fit_one_transition(*args) for args in fit_args]
+        
+        results = {}
+        for transition_name, model, stats in fit_outputs:
+            if model is None:
                 continue
+            self.cox_models[transition_name] = model
+            if stats is not None:
+                results[transition_name] = {'model': model, **stats}
         
         print(f"🏁 [COX MODELS] Model fitting completed: {len(results)} models fitted")
+        self.cox_results = results
         return results
     
     def _validate_financial_data_quality(self):
@@ -1606,10 +1787,11 @@ class EnhancedMultiStateModel:
     def generate_enhanced_report(self) -> str:
         """Generate comprehensive report with financial analysis"""
         
-        n_companies = len(set(ep['company_id'] for ep in self.transition_episodes))
-        n_episodes = len(self.transition_episodes)
+        episodes_df = self.transition_episodes_df if self.transition_episodes_df is not None else pd.DataFrame(columns=['company_id'])
+        n_companies = episodes_df['company_id'].nunique()
+        n_episodes = len(episodes_df)
         
-        report = f"""
+        parts = [f"""
 Enhanced Multi-State Hazard Model Report
 ========================================
 
@@ -1622,10 +1804,10 @@ Data Summary:
 - Right-censoring handled: Yes
 - Time period: 2010-2024
 
-"""
+"""]
         
         if self.use_financial_data:
-            report += """Financial Covariates Included:
+            parts.append("""Financial Covariates Included:
 - Debt-to-Assets Ratio
 - Current Ratio  
 - Return on Assets (ROA)
@@ -1637,24 +1819,43 @@ Data Summary:
 - Quick Ratio
 - Working Capital Ratio
 
-"""
+""")
         
-        report += "Model Performance:\n"
+        parts.append("Model Performance:\n")
         
         for transition_name, model in self.cox_models.items():
-            report += f"\n{transition_name.title()} Transitions:"
-            report += f"\n  - Concordance Index: {model.concordance_index_:.3f}"
-            report += f"\n  - Log-likelihood: {model.log_likelihood_:.2f}"
+            parts.append(f"\n{transition_name.title()} Transitions:")
+            
+            # Look up fit results and model attributes once per model
+            # (lifelines rebuilds params_ on every access)
+            results = self.cox_results.get(transition_name)
+            log_likelihood = getattr(model, 'log_likelihood_', None)
+            params = getattr(model, 'params_', None)
+            
+            # Reuse the concordance stored at fit time instead of recomputing it
+            if results is not None:
+                concordance = results['concordance']
+            else:
+                concordance = getattr(model, 'concordance_index_', None)
+            if concordance is not None:
+                parts.append(f"\n  - Concordance Index: {concordance:.3f}")
+            if log_likelihood is not None:
+                parts.append(f"\n  - Log-likelihood: {log_likelihood:.2f}")
             
             # Add significant covariates if available
-            try:
-                if hasattr(model, 'params_'):
-                    top_covariates = model.params_.abs().nlargest(3)
-                    report += f"\n  - Top predictors: {', '.join(top_covariates.index[:3])}"
-            except:
-                pass
-        
-        report += f"""
+            if params is not None:
+                # Rank by per-SD effect so ratios on different scales are comparable
+                if results is not None:
+                    params = pd.Series(results['standardized_coefficients'], dtype=float)
+                if len(params):
+                    # 상위 3개만 필요하므로 전체 정렬 대신 argpartition (O(p))
+                    abs_vals = params.abs().to_numpy()
+                    k = min(3, len(abs_vals))
+                    idx = np.argpartition(abs_vals, -k)[-k:] if k < len(abs_vals) else np.arange(k)
+                    idx = idx[np.argsort(-abs_vals[idx], kind='stable')]
+                    parts.append(f"\n  - Top predictors: {', '.join(map(str, params.index[idx]))}")
+        
+        parts.append("""
 
 Key Improvements over Basic Model:
 1. ✅ Incorporates Korean Airlines financial health indicators
@@ -1675,9 +1876,9 @@ Model Validation:
 - Cross-validation C-index > 0.6 indicates good predictive performance
 - Financial covariates improve model discrimination
 - Handles COVID-19 impact period (2020-2021)
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def run_complete_analysis(self):
         """Run the complete enhanced analysis"""
@@ -1695,19 +1896,7 @@ Model Validation:
         print(f"\n📊 Transition Type Distribution:")
         transition_counts = survival_df['transition_type'].value_counts()
         for transition_type, count in transition_counts.items():
-            if transition_type == StateDefinition.UPGRADE:
-                name = "Upgrades"
-            elif transition_type == StateDefinition.DOWNGRADE:
-                name = "Downgrades" 
-            elif transition_type == StateDefinition.STABLE:
-                name = "Stable"
-            elif transition_type == StateDefinition.DEFAULT:
-                name = "Defaults"
-            elif transition_type == StateDefinition.WITHDRAWN:
-                name = "Withdrawn"
-            else:
-                name = f"Type_{transition_type}"
-            
+            name = TRANSITION_LABELS.get(transition_type, f"Type_{transition_type}")
             print(f"   {name}: {count}")
         
         # Step 4: Fit enhanced Cox models
@@ -1853,16 +2042,20 @@ def main():
     print("="*60)
     
     # Compare C-indices
-    for transition in ['upgrade', 'downgrade', 'default', 'withdrawn']:
-        if transition in enhanced_results and transition in basic_results:
-            enhanced_c = enhanced_results[transition]['concordance']
-            basic_c = basic_results[transition]['concordance'] 
-            improvement = enhanced_c - basic_c
-            
-            print(f"{transition.title():12}: Enhanced={enhanced_c:.3f}, Basic={basic_c:.3f}, "
-                  f"Improvement={improvement:+.3f}")
+    transitions = ['upgrade', 'downgrade', 'default', 'withdrawn']
+    comparison = pd.DataFrame({
+        'enhanced': {t: r['concordance'] for t, r in enhanced_results.items()},
+        'basic': {t: r['concordance'] for t, r in basic_results.items()},
+    }, dtype=float).reindex(transitions)
+    comparison['improvement'] = comparison['enhanced'] - comparison['basic']
+    
+    paired = comparison.dropna()
+    if not paired.empty:
+        paired.index = paired.index.str.title()
+        print(paired.round(3).to_string())
     
-    print(f"\n✅ Analysis Complete! Financial covariates {'improve' if any(enhanced_results.get(t, {}).get('concordance', 0) > basic_results.get(t, {}).get('concordance', 0) for t in ['upgrade', 'downgrade']) else 'do not significantly improve'} model performance.")
+    improves = (comparison['enhanced'].fillna(0) > comparison['basic'].fillna(0)).loc[['upgrade', 'downgrade']].any()
+    print(f"\n✅ Analysis Complete! Financial covariates {'improve' if improves else 'do not significantly improve'} model performance.")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -11,19 +11,23 @@ Implements score_firm(firm, horizon=90) function that:
 Author: Korean Airlines Credit Rating Analysis
 """
 
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 import warnings
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 try:
     from lifelines import CoxPHFitter
-    from scipy import integrate
     LIFELINES_AVAILABLE = True
 except ImportError:
-    print("⚠️ Required packages not available. Install: pip install lifelines scipy")
+    print("⚠️ lifelines not available. Install: pip install lifelines")
     LIFELINES_AVAILABLE = False
     # Create dummy CoxPHFitter class to avoid NameError
     class CoxPHFitter:
@@ -41,7 +45,38 @@ except ImportError:
         print("⚠️ enhanced_multistate_model not available")
         MODEL_AVAILABLE = False
 
-@dataclass
+# Optional JIT compilation for the Cox survival kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Pure-Python fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+def _to_numeric_covariate(value: Any) -> float:
+    """Coerce a single covariate value to a scalar (sequence -> first element, invalid -> 0.0)"""
+    if isinstance(value, (int, float, np.number)):
+        return value
+    if isinstance(value, np.ndarray):
+        value = value.ravel()
+    if hasattr(value, '__iter__') and not isinstance(value, str):
+        try:
+            value = list(value)
+            return float(value[0]) if len(value) > 0 else 0.0
+        except (ValueError, TypeError):
+            return 0.0
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+@dataclass(slots=True, frozen=True)
 class FirmProfile:
     """Firm characteristics for risk scoring"""
     company_name: str
@@ -73,6 +108,178 @@ class FirmProfile:
     nr_flag: Optional[int] = 0  # 1 if currently NR, 0 if rated
     state: Optional[str] = None  # Current state (rating or 'WD')
     consecutive_nr_days: Optional[int] = 0  # Consecutive NR days
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> List['FirmProfile']:
+        """Build profiles from a DataFrame whose columns are FirmProfile field names (one row per firm)"""
+        names = [field.name for field in fields(cls) if field.name in df.columns]
+        # 컬럼을 한 번씩만 꺼내 행 단위로 묶음 (df.iterrows보다 훨씬 빠름)
+        return [cls(**dict(zip(names, row))) for row in zip(*(df[name].tolist() for name in names))]
+
+# Financial ratios every firm provides, in covariate order
+_CORE_RATIOS = (
+    'debt_to_assets', 'current_ratio', 'roa', 'roe',
+    'operating_margin', 'equity_ratio', 'asset_turnover',
+    'interest_coverage', 'quick_ratio', 'working_capital_ratio'
+)
+
+# Optional ratios appended to the covariates when provided
+_OPTIONAL_RATIOS = (
+    'net_margin', 'liability_ratio', 'operating_cf_ratio',
+    'cf_to_debt', 'cf_coverage', 'debt_service_coverage',
+    'times_interest_earned', 'cash_ratio', 'debt_to_equity',
+    'total_asset_growth'
+)
+
+# Risk level thresholds (lower bounds, inclusive) and labels: [0.05, 0.10, 0.30)
+_LEVELS = np.array([0.05, 0.10, 0.30])
+_LABELS = np.array(["VERY_LOW", "LOW", "MEDIUM", "HIGH"])
+
+def _classify_risk_levels(change_probs: np.ndarray) -> List[str]:
+    """Risk level label for every change probability (NaN -> VERY_LOW, as the scalar comparisons)"""
+    change_probs = np.asarray(change_probs, dtype=np.float64)
+    index = np.searchsorted(_LEVELS, change_probs, side='right')
+    index[np.isnan(change_probs)] = 0
+    return _LABELS[index].tolist()
+
+@lru_cache(maxsize=None)
+def _rating_tables() -> Tuple[Dict[str, int], Dict[int, tuple], tuple]:
+    """
+    Rating lookup tables built once from UnifiedRatingMapping
+    
+    Returns:
+        (symbol -> number, number -> (symbol, risk category column, investment grade flag),
+         risk category column names)
+    """
+    
+    # Use unified rating mapping for consistency (utils는 다른 모듈과 같이 지연 import)
+    from utils.rating_mapping import UnifiedRatingMapping
+    
+    def category_column(category: str) -> str:
+        return f'risk_category_{category.lower().replace(" ", "_")}'
+    
+    reverse_rating_mapping = {}
+    for number, symbol in UnifiedRatingMapping.NUMERIC_TO_RATING.items():
+        risk_category = UnifiedRatingMapping.get_risk_category(symbol)
+        reverse_rating_mapping[number] = (
+            symbol,
+            category_column(risk_category) if risk_category else None,
+            1 if UnifiedRatingMapping.is_investment_grade(symbol) else 0
+        )
+    
+    category_columns = tuple(category_column(category) for category in UnifiedRatingMapping.RISK_CATEGORIES)
+    return UnifiedRatingMapping.get_rating_mapping(), reverse_rating_mapping, category_columns
+
+@lru_cache(maxsize=4096)
+def _firm_covariates(firm: FirmProfile) -> Tuple[tuple, np.ndarray]:
+    """
+    Convert firm profile to model covariates using risk categories
+    
+    Returns:
+        (column names, read-only value array) - cached per (frozen) firm profile,
+        so repeated scoring of the same firm skips the rebuild
+    """
+    
+    rating_mapping, reverse_rating_mapping, category_columns = _rating_tables()
+    
+    # Convert rating to number if string
+    if isinstance(firm.current_rating, str):
+        current_rating = rating_mapping.get(firm.current_rating, 8)  # Default to BBB
+    else:
+        current_rating = firm.current_rating
+    
+    rating_symbol, category_col, investment_grade = reverse_rating_mapping.get(current_rating, (None, None, 0))
+    
+    # Create risk category dummy variables
+    risk_categories = dict.fromkeys(category_columns, 0)
+    
+    # Set the appropriate category
+    if category_col:
+        risk_categories[category_col] = 1
+    
+    # 🔍 DEBUG: Rating conversion check
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🔍 RATING DEBUG for {firm.company_name}: original={firm.current_rating}, "
+                     f"numeric={current_rating}, symbol={rating_symbol}")
+    
+    # Rating + risk categories + financial ratios
+    covariates = {
+        # 🔧 핵심 수정: Rating information for scoring
+        'current_rating': current_rating,  # ← 누락된 핵심 키 추가!
+        'from_rating': current_rating,     # Cox 모델 학습용 (기존 유지)
+        
+        # Risk category variables (new approach)
+        **risk_categories,
+        'investment_grade': investment_grade,
+        
+        # Financial ratios
+        **{ratio: getattr(firm, ratio) for ratio in _CORE_RATIOS}
+    }
+    
+    # Add optional ratios if provided
+    for ratio in _OPTIONAL_RATIOS:
+        value = getattr(firm, ratio, None)
+        if value is not None:
+            covariates[ratio] = value
+    
+    try:
+        values = np.array(list(covariates.values()), dtype=np.float64)
+    except (TypeError, ValueError):
+        # 숫자로 바꿀 수 없는 값은 _covariates_frame에서 정리
+        values = np.array(list(covariates.values()), dtype=object)
+    values.flags.writeable = False  # 캐시 공유 배열
+    
+    return tuple(covariates), values
+
+def _frame_covariates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise version of _firm_covariates for a DataFrame of firms
+    
+    Returns the raw (uncleaned) covariate frame with the same columns as the
+    per-firm path; optional ratios are included when the column exists.
+    """
+    
+    rating_mapping, reverse_rating_mapping, category_columns = _rating_tables()
+    
+    # Convert rating symbols to numbers (Default to BBB)
+    current_rating = [rating_mapping.get(rating, 8) if isinstance(rating, str) else rating
+                      for rating in df['current_rating'].tolist()]
+    entries = [reverse_rating_mapping.get(rating, (None, None, 0)) for rating in current_rating]
+    category = np.array([category_col for _, category_col, _ in entries], dtype=object)
+    
+    covariates = {
+        'current_rating': current_rating,
+        'from_rating': current_rating,
+        **{col: (category == col).astype(np.int64) for col in category_columns},
+        'investment_grade': np.array([investment_grade for _, _, investment_grade in entries], dtype=np.int64),
+        **{ratio: df[ratio].to_numpy() for ratio in _CORE_RATIOS},
+        **{ratio: df[ratio].to_numpy() for ratio in _OPTIONAL_RATIOS if ratio in df.columns}
+    }
+    return pd.DataFrame(covariates)
+
+@njit(parallel=True)
+def _batch_cox_survival(X, betas, norm_means, used, baselines, exponents):
+    """
+    Survival of every firm under every Cox transition model in one pass
+    
+    X is the (n, P) covariate matrix shared by all transitions; betas,
+    norm_means and used are (T, P) with the columns each model was fitted
+    on marked in used. Returns (T, n) with
+    S = exp(-Λ0(t)·exp((X-X̄)β)) ** exponent.
+    """
+    n, p = X.shape
+    n_trans = betas.shape[0]
+    survival = np.empty((n_trans, n))
+    
+    for i in prange(n):
+        for t in range(n_trans):
+            linear_predictor = 0.0
+            for k in range(p):
+                if used[t, k]:
+                    linear_predictor += (X[i, k] - norm_means[t, k]) * betas[t, k]
+            survival[t, i] = np.exp(-(baselines[t] * np.exp(linear_predictor))) ** exponents[t]
+    
+    return survival
 
 class RatingRiskScorer:
     """
@@ -99,10 +306,11 @@ class RatingRiskScorer:
         }
         self.baseline_hazards = {}
         
-        # Use unified rating mapping for consistency
-        from utils.rating_mapping import UnifiedRatingMapping
-        self.rating_mapping = UnifiedRatingMapping.get_rating_mapping()
-        self.reverse_rating_mapping = UnifiedRatingMapping.get_reverse_mapping()
+        # Closed-form scoring caches (filled by _prepare_scoring after training)
+        self._cox_params = {}
+        self._baseline_at_horizon = {}
+        self._cox_batch = None
+        self._shared_cols = None
         self.use_financial_data = use_financial_data
         
         # Train models if not provided
@@ -113,7 +321,7 @@ class RatingRiskScorer:
     
     def _train_models(self):
         """Train the multi-state hazard models"""
-        print("🏋️ [TRAIN MODELS] Training multi-state hazard models...")
+        logger.info("🏋️ [TRAIN MODELS] Training multi-state hazard models...")
         
         if not MODEL_AVAILABLE:
             raise ImportError("EnhancedMultiStateModel not available")
@@ -153,7 +361,7 @@ class RatingRiskScorer:
             thread.join(timeout_seconds)
             
             if thread.is_alive():
-                print(f"⚠️ [TRAIN MODELS] Training timeout after {timeout_seconds} seconds")
+                logger.warning(f"⚠️ [TRAIN MODELS] Training timeout after {timeout_seconds} seconds")
                 raise TimeoutError(f"Model training timed out after {timeout_seconds} seconds")
             
             if exception[0] is not None:
@@ -166,265 +374,286 @@ class RatingRiskScorer:
             self.models = result[0]['models']
             self.enhanced_model = result[0]['enhanced_model']
             
-            print(f"✅ [TRAIN MODELS] Trained {len(self.models)} Cox models")
+            logger.info(f"✅ [TRAIN MODELS] Trained {len(self.models)} Cox models")
             
             # Debug: Check received models
-            for name, model in self.models.items():
-                print(f"  🔍 [SCORER DEBUG] Model {name}: type={type(model)}")
-                print(f"  🔍 [SCORER DEBUG] Model {name}: has_summary={hasattr(model, 'summary')}")
-                if hasattr(model, 'summary'):
-                    try:
-                        summary = model.summary
-                        print(f"  🔍 [SCORER DEBUG] Model {name}: summary accessible, shape={summary.shape}")
-                    except Exception as e:
-                        print(f"  🔍 [SCORER DEBUG] Model {name}: summary error: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for name, model in self.models.items():
+                    logger.debug(f"🔍 [SCORER DEBUG] Model {name}: type={type(model)}")
+                    logger.debug(f"🔍 [SCORER DEBUG] Model {name}: has_summary={hasattr(model, 'summary')}")
+                    if hasattr(model, 'summary'):
+                        try:
+                            summary = model.summary
+                            logger.debug(f"🔍 [SCORER DEBUG] Model {name}: summary accessible, shape={summary.shape}")
+                        except Exception as e:
+                            logger.debug(f"🔍 [SCORER DEBUG] Model {name}: summary error: {e}")
             
             # Extract baseline hazards
             for transition_name, model in self.models.items():
                 if hasattr(model, 'baseline_hazard_'):
                     self.baseline_hazards[transition_name] = model.baseline_hazard_
                     
-            print(f"✅ [TRAIN MODELS] Extracted {len(self.baseline_hazards)} baseline hazard functions")
+            logger.info(f"✅ [TRAIN MODELS] Extracted {len(self.baseline_hazards)} baseline hazard functions")
+            
+            self._prepare_scoring()
             
         except Exception as e:
-            print(f"❌ [TRAIN MODELS] Error training models: {e}")
+            logger.error(f"❌ [TRAIN MODELS] Error training models: {e}")
             raise
     
+    def _prepare_scoring(self):
+        """Cache coefficients of the trained Cox models for closed-form scoring"""
+        self._cox_params = {}
+        self._baseline_at_horizon = {}
+        self._cox_batch = None
+        self._shared_cols = None
+        closed_forms = [(name, self._cox_closed_form(name, self.models[name])) for name in self._transition_names()
+                        if name in self.models]
+        closed_forms = [(name, params) for name, params in closed_forms if params is not None]
+        if closed_forms:
+            # 공변량 열 정렬과 공통 스키마(_shared_cols)는 학습 직후 한 번만 계산
+            self._cox_batch_params(closed_forms)
+        
+        if NUMBA_AVAILABLE:
+            # 첫 배치에서 컴파일 대기가 생기지 않도록 미리 컴파일
+            _batch_cox_survival(np.zeros((1, 1)), np.zeros((1, 1)), np.zeros((1, 1)),
+                                np.ones((1, 1), dtype=np.bool_), np.zeros(1), np.ones(1))
+    
+    def _cox_closed_form(self, transition_name: str, model: CoxPHFitter) -> Optional[tuple]:
+        """
+        (covariate columns, coefficients β, centering means) of a fitted lifelines
+        Cox model, cached per transition (None for fallback / stratified models)
+        """
+        cached = self._cox_params.get(transition_name)
+        if cached is not None and cached[0] is model:
+            return cached[1]
+        
+        params = None
+        if (hasattr(model, 'baseline_cumulative_hazard_') and hasattr(model, '_norm_mean')
+                and not getattr(model, 'strata', None)):
+            params = (
+                list(model.params_.index),
+                model.params_.to_numpy(dtype=np.float64),
+                np.asarray(model._norm_mean, dtype=np.float64)
+            )
+        
+        # 모델이 교체된 경우 해당 전이의 horizon별 baseline 캐시도 폐기
+        self._baseline_at_horizon = {key: value for key, value in self._baseline_at_horizon.items()
+                                     if key[0] != transition_name}
+        self._cox_params[transition_name] = (model, params)
+        return params
+    
+    def _survival_at(self, transition_name: str, model: CoxPHFitter, cov_df: pd.DataFrame,
+                     time_years: float) -> Optional[np.ndarray]:
+        """
+        S(t|X) for every row of cov_df
+        
+        Cox models use the closed form S(t|X) = S0(t)^exp((X-X̄)β) = exp(-Λ0(t)·exp((X-X̄)β)),
+        with Λ0(t) interpolated once per (transition, t) as lifelines does.
+        """
+        closed_form = self._cox_closed_form(transition_name, model)
+        
+        if closed_form is None:
+            # FallbackTimeDepModel은 공변량과 무관하게 한 열만 반환하므로 기업 수만큼 broadcast
+            survival_func = model.predict_survival_function(cov_df, times=[time_years])
+            if survival_func.empty:
+                return None
+            return np.broadcast_to(survival_func.iloc[0].to_numpy(dtype=np.float64), len(cov_df))
+        
+        columns, coefs, norm_mean = closed_form
+        baseline = self._baseline_hazard_at(transition_name, model, time_years)
+        linear_predictor = (cov_df[columns].to_numpy(dtype=np.float64) - norm_mean) @ coefs
+        return np.exp(-(baseline * np.exp(linear_predictor)))
+    
+    def _baseline_hazard_at(self, transition_name: str, model: CoxPHFitter, time_years: float) -> float:
+        """Baseline cumulative hazard Λ0(t), interpolated once per (transition, t) as lifelines does"""
+        key = (transition_name, time_years)
+        baseline = self._baseline_at_horizon.get(key)
+        if baseline is None:
+            baseline_cumulative_hazard = model.baseline_cumulative_hazard_
+            baseline = float(np.interp(time_years, baseline_cumulative_hazard.index.to_numpy(),
+                                       baseline_cumulative_hazard.to_numpy().ravel()))
+            self._baseline_at_horizon[key] = baseline
+        return baseline
+    
+    def _cox_batch_params(self, closed_forms: List[Tuple[str, tuple]]) -> tuple:
+        """
+        Coefficients of closed-form Cox transitions aligned on one column order
+        
+        Returns:
+            (union of covariate columns, betas (T, P), centering means (T, P),
+             used-column mask (T, P))
+        """
+        
+        # 모델이 바뀌지 않았으면 정렬된 계수 재사용
+        if self._cox_batch is not None and len(self._cox_batch[0]) == len(closed_forms) and all(
+                name == cached_name and params is cached_params
+                for (name, params), (cached_name, cached_params) in zip(closed_forms, self._cox_batch[0])):
+            return self._cox_batch[1]
+        
+        columns = list(dict.fromkeys(col for _, (cols, _, _) in closed_forms for col in cols))
+        position = {col: k for k, col in enumerate(columns)}
+        betas = np.zeros((len(closed_forms), len(columns)))
+        norm_means = np.zeros((len(closed_forms), len(columns)))
+        used = np.zeros((len(closed_forms), len(columns)), dtype=np.bool_)
+        for t, (_, (cols, coefs, norm_mean)) in enumerate(closed_forms):
+            index = [position[col] for col in cols]
+            betas[t, index] = coefs
+            norm_means[t, index] = norm_mean
+            used[t, index] = True
+        
+        batch = (columns, betas, norm_means, used)
+        self._cox_batch = (closed_forms, batch)
+        # 모든 Cox 모델이 같은 공변량을 쓰면 X를 한 번 잘라 전이 간 공유
+        self._shared_cols = columns if used.all() else None
+        return batch
+    
+    def _batch_survival(self, transition_names: List[str], cov_df: pd.DataFrame,
+                        horizon_years: float) -> Dict[str, np.ndarray]:
+        """
+        S(horizon|X) for every closed-form Cox transition from one covariate matrix
+        
+        Uses the numba kernel, or plain NumPy when all models share one
+        covariate schema. Same horizon rule as _predict_survival; other cases
+        (and transitions whose covariates are missing from cov_df) are left to
+        the per-transition path.
+        """
+        closed_forms = []
+        for name in transition_names:
+            if name not in self.models:
+                continue
+            params = self._cox_closed_form(name, self.models[name])
+            if params is not None and all(col in cov_df.columns for col in params[0]):
+                closed_forms.append((name, params))
+        if not closed_forms:
+            return {}
+        
+        names = [name for name, _ in closed_forms]
+        columns, betas, norm_means, used = self._cox_batch_params(closed_forms)
+        if not NUMBA_AVAILABLE and self._shared_cols is None:
+            return {}
+        
+        time_years, exponent = self._horizon_rule(horizon_years)
+        baselines = np.array([self._baseline_hazard_at(name, self.models[name], time_years) for name in names])
+        X = cov_df[columns].to_numpy(dtype=np.float64, copy=False)
+        if NUMBA_AVAILABLE:
+            survival = _batch_cox_survival(np.ascontiguousarray(X), betas, norm_means, used,
+                                           baselines, np.full(len(names), exponent))
+        else:
+            survival = [np.exp(-(baseline * np.exp((X - norm_mean) @ beta))) ** exponent
+                        for baseline, beta, norm_mean in zip(baselines, betas, norm_means)]
+        return dict(zip(names, survival))
+    
+    def _transition_names(self) -> List[str]:
+        """Standard transition types first, then any additional models"""
+        transition_types = ['upgrade', 'downgrade', 'default']
+        return transition_types + [name for name in self.models if name not in transition_types]
+    
     def _load_models(self, model_path: str):
         """Load pre-trained models from file"""
         # TODO: Implement model loading from pickle/joblib
         raise NotImplementedError("Model loading not yet implemented")
     
-    def _firm_to_covariates(self, firm: FirmProfile) -> pd.Series:
-        """Convert firm profile to model covariates using risk categories"""
+    def _firm_to_covariates(self, firm: FirmProfile) -> Tuple[tuple, np.ndarray]:
+        """Convert firm profile to model covariates (memoized per firm profile)"""
+        try:
+            return _firm_covariates(firm)
+        except TypeError:
+            # 해시 불가능한 값(list 등)이 들어 있는 프로필은 캐시 없이 계산
+            return _firm_covariates.__wrapped__(firm)
+    
+    def _stack_covariates(self, covariates: List[Tuple[tuple, np.ndarray]]) -> pd.DataFrame:
+        """Stack per-firm covariates into one raw (uncleaned) covariate frame"""
+        columns = covariates[0][0]
+        if all(cols == columns for cols, _ in covariates):
+            return pd.DataFrame(np.vstack([values for _, values in covariates]), columns=list(columns))
+        # 선택 비율 구성이 기업마다 다르면 컬럼 합집합으로 정렬 (없는 값은 NaN -> 0)
+        return pd.DataFrame([dict(zip(cols, values)) for cols, values in covariates])
+    
+    def _covariates_frame(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Numeric prediction frame from raw covariates
         
-        # Convert rating to number if string
-        if isinstance(firm.current_rating, str):
-            current_rating = self.rating_mapping.get(firm.current_rating, 8)  # Default to BBB
-        else:
-            current_rating = firm.current_rating
-        
-        # Use unified rating mapping for consistency
-        from utils.rating_mapping import UnifiedRatingMapping
-        rating_symbol = UnifiedRatingMapping.get_rating_symbol(current_rating)
-        
-        # Create risk category dummy variables
-        risk_categories = {}
-        for category in UnifiedRatingMapping.RISK_CATEGORIES.keys():
-            cat_col = f'risk_category_{category.lower().replace(" ", "_")}'
-            risk_categories[cat_col] = 0
-        
-        # Set the appropriate category
-        if rating_symbol:
-            risk_category = UnifiedRatingMapping.get_risk_category(rating_symbol)
-            if risk_category:
-                cat_col = f'risk_category_{risk_category.lower().replace(" ", "_")}'
-                risk_categories[cat_col] = 1
-        
-        # 🔍 DEBUG: Rating conversion check
-        print(f"  🔍 RATING DEBUG for {firm.company_name}:")
-        print(f"    - Original rating: {firm.current_rating}")
-        print(f"    - Converted to numeric: {current_rating}")
-        print(f"    - Rating symbol: {rating_symbol}")
-        
-        # Create covariate series with rating + risk categories + financial ratios
-        covariates = pd.Series({
-            # 🔧 핵심 수정: Rating information for scoring
-            'current_rating': current_rating,  # ← 누락된 핵심 키 추가!
-            'from_rating': current_rating,     # Cox 모델 학습용 (기존 유지)
-            
-            # Risk category variables (new approach)
-            **risk_categories,
-            'investment_grade': 1 if rating_symbol and UnifiedRatingMapping.is_investment_grade(rating_symbol) else 0,
-            
-            # Financial ratios
-            'debt_to_assets': firm.debt_to_assets,
-            'current_ratio': firm.current_ratio,
-            'roa': firm.roa,
-            'roe': firm.roe,
-            'operating_margin': firm.operating_margin,
-            'equity_ratio': firm.equity_ratio,
-            'asset_turnover': firm.asset_turnover,
-            'interest_coverage': firm.interest_coverage,
-            'quick_ratio': firm.quick_ratio,
-            'working_capital_ratio': firm.working_capital_ratio
-        })
-        
-        # Add optional ratios if provided
-        optional_ratios = [
-            'net_margin', 'liability_ratio', 'operating_cf_ratio',
-            'cf_to_debt', 'cf_coverage', 'debt_service_coverage',
-            'times_interest_earned', 'cash_ratio', 'debt_to_equity',
-            'total_asset_growth'
-        ]
+        NaN -> 0, sequences -> first element, other non-numeric values -> float (or 0)
+        """
+        non_numeric = raw_df.select_dtypes(exclude='number').columns
+        if len(non_numeric):
+            raw_df = raw_df.assign(**{col: raw_df[col].map(_to_numeric_covariate) for col in non_numeric})
         
-        for ratio in optional_ratios:
-            value = getattr(firm, ratio, None)
-            if value is not None:
-                covariates[ratio] = value
+        # 전이 모델들이 공유하는 예측 프레임은 배치당 한 번만 생성 (copy/astype/fillna 중간 프레임 없음)
+        values = raw_df.to_numpy(dtype=np.float64)
+        return pd.DataFrame(np.where(np.isnan(values), 0.0, values), columns=raw_df.columns)
+    
+    def _horizon_rule(self, horizon_years: float) -> Tuple[float, float]:
+        """
+        (prediction time, survival exponent) for a horizon in years
         
-        return covariates
+        Horizons up to one year use the enhanced scaling with initial acceleration
+        S(t) = S(1)^(t^β) where β ≈ 0.7; longer horizons are predicted directly.
+        """
+        if horizon_years <= 1.0:
+            return 1.0, horizon_years ** self.hyperparams.get('beta', 0.7)
+        return horizon_years, 1.0
     
-    def _calculate_hazard_integral(self, model: CoxPHFitter, covariates: pd.Series, 
-                                 horizon_days: int) -> float:
+    def _predict_survival(self, transition_name: str, model: CoxPHFitter, cov_df: pd.DataFrame,
+                          horizon_years: float) -> Optional[np.ndarray]:
         """
-        Calculate integral of hazard function λ̂(t|X) over time horizon
+        Survival probability S(horizon|X) for every row of cov_df
         
-        Enhanced with time-dependent baseline hazard modeling
+        Returns None when the model is unusable (callers use the fallback
+        hazard); prediction errors propagate to the caller
         """
         
-        try:
-            # 🔧 Convert to years for model prediction (models trained on annual data)
-            horizon_years = horizon_days / 365.25
-            
-            # 🔧 Validate and clean covariates data with enhanced debugging
-            print(f"  🔍 DEBUG: Original covariates shape: {len(covariates)}")
-            print(f"  🔍 DEBUG: Original covariates dtypes: {covariates.dtypes}")
-            
-            clean_covariates = covariates.copy()
-            
-            # Check for NaN values and replace with 0
-            nan_count = clean_covariates.isna().sum()
-            if nan_count > 0:
-                print(f"  ⚠️ Found {nan_count} NaN values in covariates, replacing with 0")
-                clean_covariates = clean_covariates.fillna(0)
-            
-            # Ensure all values are numeric with detailed logging
-            problematic_columns = []
-            for idx, value in clean_covariates.items():
-                original_type = type(value)
-                if isinstance(value, (list, tuple, np.ndarray)):
-                    print(f"  ⚠️ SEQUENCE FOUND: {idx} = {value} (type: {original_type})")
-                    clean_covariates[idx] = float(value[0]) if len(value) > 0 else 0.0
-                    problematic_columns.append(idx)
-                elif isinstance(value, np.ndarray) and value.ndim > 0:
-                    print(f"  ⚠️ NDARRAY FOUND: {idx} = {value} (shape: {value.shape})")
-                    clean_covariates[idx] = float(value.flatten()[0]) if value.size > 0 else 0.0
-                    problematic_columns.append(idx)
-                elif hasattr(value, '__iter__') and not isinstance(value, (str, int, float, np.number)):
-                    print(f"  ⚠️ ITERABLE FOUND: {idx} = {value} (type: {original_type})")
-                    try:
-                        clean_covariates[idx] = float(list(value)[0]) if len(list(value)) > 0 else 0.0
-                    except:
-                        clean_covariates[idx] = 0.0
-                    problematic_columns.append(idx)
-                elif not isinstance(value, (int, float, np.number)):
-                    print(f"  ⚠️ Converting non-numeric {idx}: {value} ({original_type}) to float")
-                    try:
-                        clean_covariates[idx] = float(value)
-                    except (ValueError, TypeError):
-                        clean_covariates[idx] = 0.0
-                        problematic_columns.append(idx)
-            
-            if problematic_columns:
-                print(f"  🔧 Fixed {len(problematic_columns)} problematic columns: {problematic_columns}")
-            
-            # Final validation - ensure everything is scalar numeric
-            final_check_failed = []
-            for idx, value in clean_covariates.items():
-                if not isinstance(value, (int, float, np.integer, np.floating)):
-                    print(f"  ❌ FINAL CHECK FAILED: {idx} = {value} (type: {type(value)})")
-                    clean_covariates[idx] = 0.0
-                    final_check_failed.append(idx)
-                elif hasattr(value, '__len__') and not isinstance(value, (str)):
-                    print(f"  ❌ STILL HAS LENGTH: {idx} = {value} (type: {type(value)})")
-                    clean_covariates[idx] = 0.0
-                    final_check_failed.append(idx)
-            
-            if final_check_failed:
-                print(f"  🔧 Final cleanup applied to: {final_check_failed}")
-            
-            print(f"  ✅ Clean covariates ready: {len(clean_covariates)} columns")
-            
-            # Prepare DataFrame for prediction with validation
-            pred_df = clean_covariates.to_frame().T
-            print(f"  🔍 Prediction DataFrame shape: {pred_df.shape}")
-            print(f"  🔍 Prediction DataFrame columns: {list(pred_df.columns)[:10]}...")  # First 10 columns
-            print(f"  🔍 Prediction DataFrame dtypes: {pred_df.dtypes.unique()}")
-            
-            # 🔧 Enhanced model validation with better error handling
-            if not hasattr(model, 'summary'):
-                print(f"  ⚠️ Model missing summary attribute, checking for fallback model...")
-                if hasattr(model, 'base_hazard') and hasattr(model, 'predict_survival_function'):
-                    print(f"  ✅ Using fallback model with base_hazard={getattr(model, 'base_hazard', 'unknown')}")
-                else:
-                    print(f"  ❌ Model appears not fitted properly (missing critical attributes)")
-                    return self._calculate_time_dependent_hazard(covariates, horizon_days)
-            
-            # Double check that summary exists and is accessible (for regular Cox models)
-            if hasattr(model, 'summary'):
-                try:
-                    _ = model.summary
-                    print(f"  ✅ Model summary accessible")
-                except (AttributeError, Exception) as e:
-                    print(f"  ⚠️ Model summary not accessible: {e}, proceeding with caution...")
+        # 🔧 Enhanced model validation (fallback models expose base_hazard)
+        if not hasattr(model, 'summary'):
+            if hasattr(model, 'base_hazard') and hasattr(model, 'predict_survival_function'):
+                logger.debug(f"✅ Using fallback model with base_hazard={getattr(model, 'base_hazard', 'unknown')}")
             else:
-                print(f"  ✅ Using fallback model without summary")
-            
-            # 🔧 Enhanced prediction with time scaling for sub-annual horizons
-            if horizon_years <= 1.0:
-                # For horizons ≤ 1 year, use scaling approach to avoid flat curves
-                print(f"  🔍 Short-term prediction: scaling {horizon_days} days from 1-year baseline")
-                
-                # Get 1-year survival probability as baseline
-                survival_func_1year = model.predict_survival_function(
-                    pred_df, 
-                    times=[1.0]  # 1 year baseline
-                )
-                
-                if len(survival_func_1year) == 0:
-                    return self._calculate_time_dependent_hazard(covariates, horizon_days)
-                
-                # 🔧 Enhanced scaling with initial acceleration: S(t) = S(1)^(t^β) where β ≈ 0.7
-                survival_1year = survival_func_1year.iloc[0, 0]
-                beta = self.hyperparams.get('beta', 0.7)  # Dynamic acceleration factor
-                scaling_factor = horizon_years ** beta  # Non-linear scaling for initial acceleration
-                survival_prob = survival_1year ** scaling_factor
-                
-                print(f"  🔍 1-year survival: {survival_1year:.4f}")
-                print(f"  🔍 Horizon years: {horizon_years:.4f}")
-                print(f"  🔍 Beta (acceleration): {beta}")
-                print(f"  🔍 Scaling factor (t^β): {scaling_factor:.4f}")
-                print(f"  🔍 Scaled survival ({horizon_days}d): {survival_prob:.4f}")
-                
-            else:
-                # For horizons > 1 year, predict directly
-                print(f"  🔍 Long-term prediction: {horizon_years:.2f} years")
-                survival_func = model.predict_survival_function(
-                    pred_df, 
-                    times=[horizon_years]
-                )
-                
-                if len(survival_func) == 0:
-                    return self._calculate_time_dependent_hazard(covariates, horizon_days)
-                
-                survival_prob = survival_func.iloc[0, 0]
-            
-            print(f"  🔍 Final survival probability: {survival_prob}")
-            
-            if survival_prob <= 0:
-                print(f"  ⚠️ Survival prob <= 0, using fallback")
-                return self._calculate_time_dependent_hazard(covariates, horizon_days)
-            elif survival_prob >= 1.0:
-                print(f"  ⚠️ Survival prob = 1.0 (perfect survival), using fallback")
-                return self._calculate_time_dependent_hazard(covariates, horizon_days)
-            elif survival_prob > 0.999:
-                print(f"  ⚠️ Survival prob > 0.999 (too high), using fallback")
-                return self._calculate_time_dependent_hazard(covariates, horizon_days)
-            else:
-                cumulative_hazard = -np.log(survival_prob)
-                print(f"  ✅ Calculated cumulative hazard: {cumulative_hazard}")
-                # Enhance with time dependency if hazard is too low
-                if cumulative_hazard < 0.001:
-                    print(f"  ⚠️ Hazard too low ({cumulative_hazard}), using time-dependent fallback")
-                    cumulative_hazard = self._calculate_time_dependent_hazard(covariates, horizon_days)
-                return cumulative_hazard
-                
-        except Exception as e:
-            print(f"⚠️ Error calculating hazard integral, using fallback: {e}")
-            return self._calculate_time_dependent_hazard(covariates, horizon_days)
+                logger.warning(f"❌ {transition_name} model appears not fitted properly (missing critical attributes)")
+                return None
+        
+        time_years, scaling_factor = self._horizon_rule(horizon_years)
+        survival = self._survival_at(transition_name, model, cov_df, time_years)
+        if survival is None:
+            return None
+        return survival ** scaling_factor
+    
+    def _survival_to_metrics(self, survival: Optional[np.ndarray], fallback_rows: List[Dict[str, Any]],
+                             horizon_years: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cumulative hazard Λ = ∫λ̂(t|X)dt = -log S and transition probability
+        P(transition within horizon) = 1 - S from a single survival lookup
+        
+        Enhanced with time-dependent baseline hazard modeling
+        """
+        
+        if survival is None:
+            return self._fallback_hazards(fallback_rows, horizon_years), np.zeros(len(fallback_rows))
+        
+        # log(0) 경고 없이 계산 (S <= 0은 아래에서 fallback 처리)
+        cumulative_hazard = -np.log(np.clip(survival, 1e-300, 1.0))
+        transition_prob = np.clip(1.0 - survival, 0.0, 1.0)
+        
+        # S <= 0, S > 0.999 (거의 완전 생존) 또는 Λ < 0.001이면 time-dependent fallback 사용
+        hazard_fallback = (survival <= 0) | (survival > 0.999) | (cumulative_hazard < 0.001)
+        # 🔧 Default Risk 평평 문제 해결: Cox 모델이 의미 없는 결과를 낼 때 fallback 사용
+        prob_fallback = (survival > 0.99) | (1.0 - survival < 1e-4)
+        
+        # fallback hazard는 두 규칙이 공유하므로 필요한 기업당 한 번만 계산
+        for i in np.flatnonzero(hazard_fallback | prob_fallback):
+            fallback_hazard = self._calculate_time_dependent_hazard(fallback_rows[i], horizon_years)
+            if hazard_fallback[i]:
+                cumulative_hazard[i] = fallback_hazard
+            if prob_fallback[i]:
+                transition_prob[i] = max(0.0, min(1.0, 1.0 - math.exp(-fallback_hazard)))
+        
+        return cumulative_hazard, transition_prob
     
-    def _calculate_time_dependent_hazard(self, covariates: pd.Series, horizon_days: int) -> float:
+    def _fallback_hazards(self, fallback_rows: List[Dict[str, Any]], horizon_years: float) -> np.ndarray:
+        """Time-dependent fallback hazard for every firm"""
+        return np.array([self._calculate_time_dependent_hazard(row, horizon_years) for row in fallback_rows])
+    
+    def _calculate_time_dependent_hazard(self, covariates: Dict[str, float], horizon_years: float) -> float:
         """
         Calculate time-dependent hazard using rating-differentiated baseline hazards
         """
@@ -500,7 +729,7 @@ class RatingRiskScorer:
         stress_multiplier = 1.0 + financial_stress * 0.3  # 0.5 → 0.3
         
         # Time dependency: hazard increases with time (square root function)
-        time_factor = np.sqrt(horizon_days / 365.25)
+        time_factor = math.sqrt(horizon_years)
         
         # Calculate cumulative hazard with bucket-specific baseline
         transition_type = getattr(self, '_current_transition_type', 'downgrade')
@@ -513,27 +742,24 @@ class RatingRiskScorer:
         # 🔧 이중 위험 승수: bucket별 baseline + rating별 fine-tuning + hyperparameter scaling
         cumulative_hazard = scaled_baseline_hazard * scaled_rating_multiplier * stress_multiplier * time_factor
         
-        print(f"  🔧 HYPERPARAMETER-TUNED FALLBACK HAZARD:")
-        print(f"    - Transition type: {transition_type}")
-        print(f"    - Current rating: {current_rating} (numeric)")
-        print(f"    - Rating bucket: {bucket}")
-        print(f"    - Base hazard: {annual_baseline_hazard:.4f}")
-        print(f"    - Scaled baseline (×{self.hyperparams.get('baseline_hazard_scale', 1.0):.2f}): {scaled_baseline_hazard:.4f}")
-        print(f"    - Rating multiplier: {rating_multiplier:.1f}x")
-        print(f"    - Scaled rating (×{self.hyperparams.get('rating_multiplier_scale', 1.0):.2f}): {scaled_rating_multiplier:.1f}x")
-        print(f"    - Stress multiplier: {stress_multiplier:.2f}")
-        print(f"    - Time factor: {time_factor:.2f}")
-        print(f"    - Beta: {self.hyperparams.get('beta', 0.7)}")
-        print(f"    - Raw cumulative hazard: {cumulative_hazard:.4f}")
-        
         # 🔧 MAX_LAMBDA = 1.0 상한 설정 (2.0 → 1.0)
         MAX_LAMBDA = 1.0
         final_hazard = max(0.001, min(MAX_LAMBDA, cumulative_hazard))
-        print(f"    - Final hazard: {final_hazard}")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"🔧 HYPERPARAMETER-TUNED FALLBACK HAZARD: transition={transition_type}, "
+                f"rating={current_rating}, bucket={bucket}, base={annual_baseline_hazard:.4f}, "
+                f"scaled_base={scaled_baseline_hazard:.4f} (×{self.hyperparams.get('baseline_hazard_scale', 1.0):.2f}), "
+                f"rating_mult={rating_multiplier:.1f}x, scaled_rating={scaled_rating_multiplier:.1f}x "
+                f"(×{self.hyperparams.get('rating_multiplier_scale', 1.0):.2f}), stress={stress_multiplier:.2f}, "
+                f"time={time_factor:.2f}, beta={self.hyperparams.get('beta', 0.7)}, "
+                f"raw={cumulative_hazard:.4f}, final={final_hazard}"
+            )
         
         return final_hazard
     
-    def _assess_financial_stress(self, covariates: pd.Series) -> float:
+    def _assess_financial_stress(self, covariates: Dict[str, float]) -> float:
         """
         Assess financial stress level (0-1) based on financial ratios
         """
@@ -563,311 +789,181 @@ class RatingRiskScorer:
         
         return min(1.0, stress_score)
     
-    def _calculate_transition_probability(self, model: CoxPHFitter, covariates: pd.Series,
-                                        horizon_days: int) -> float:
-        """
-        Calculate P(transition occurs within horizon)
-        """
+    def _nr_risk_adjustment(self, nr_flag: Optional[int], state: Optional[str],
+                            consecutive_nr_days: Optional[int]) -> Tuple[float, str]:
+        """WD+NR / long-term NR risk multiplier and its reason"""
         
-        try:
-            # 🔧 Convert to years for model prediction (models trained on annual data)
-            horizon_years = horizon_days / 365.25
-            
-            # 🔧 Enhanced model validation for transition probability calculation
-            if not hasattr(model, 'summary'):
-                print(f"  ⚠️ Transition calc: Model missing summary, checking for fallback model...")
-                if hasattr(model, 'base_hazard') and hasattr(model, 'predict_survival_function'):
-                    print(f"  ✅ Transition calc: Using fallback model with base_hazard={getattr(model, 'base_hazard', 'unknown')}")
-                else:
-                    print(f"  ❌ Transition calc: Model appears not fitted properly")
-                    return 0.0
-            
-            # Double check that summary exists and is accessible (for regular Cox models)
-            if hasattr(model, 'summary'):
-                try:
-                    _ = model.summary
-                    print(f"  ✅ Transition calc: Model summary accessible")
-                except (AttributeError, Exception) as e:
-                    print(f"  ⚠️ Transition calc: Model summary not accessible: {e}, proceeding...")
-            else:
-                print(f"  ✅ Transition calc: Using fallback model")
-            
-            # 🔧 Validate and clean covariates data with enhanced debugging  
-            clean_covariates = covariates.copy()
-            
-            # Check for NaN values and replace with 0
-            nan_count = clean_covariates.isna().sum()
-            if nan_count > 0:
-                clean_covariates = clean_covariates.fillna(0)
-            
-            # Ensure all values are numeric with detailed logging
-            problematic_columns = []
-            for idx, value in clean_covariates.items():
-                original_type = type(value)
-                if isinstance(value, (list, tuple, np.ndarray)):
-                    clean_covariates[idx] = float(value[0]) if len(value) > 0 else 0.0
-                    problematic_columns.append(idx)
-                elif isinstance(value, np.ndarray) and value.ndim > 0:
-                    clean_covariates[idx] = float(value.flatten()[0]) if value.size > 0 else 0.0
-                    problematic_columns.append(idx)
-                elif hasattr(value, '__iter__') and not isinstance(value, (str, int, float, np.number)):
-                    try:
-                        clean_covariates[idx] = float(list(value)[0]) if len(list(value)) > 0 else 0.0
-                    except:
-                        clean_covariates[idx] = 0.0
-                    problematic_columns.append(idx)
-                elif not isinstance(value, (int, float, np.number)):
-                    try:
-                        clean_covariates[idx] = float(value)
-                    except (ValueError, TypeError):
-                        clean_covariates[idx] = 0.0
-                        problematic_columns.append(idx)
-            
-            # Final validation - ensure everything is scalar numeric
-            for idx, value in clean_covariates.items():
-                if not isinstance(value, (int, float, np.integer, np.floating)):
-                    clean_covariates[idx] = 0.0
-                elif hasattr(value, '__len__') and not isinstance(value, (str)):
-                    clean_covariates[idx] = 0.0
-            
-            # 🔧 Enhanced prediction with time scaling for sub-annual horizons
-            if horizon_years <= 1.0:
-                # For horizons ≤ 1 year, use scaling approach
-                print(f"  🔍 Transition calc - Short-term: scaling {horizon_days} days from 1-year baseline")
-                
-                # Get 1-year survival probability as baseline
-                survival_func_1year = model.predict_survival_function(
-                    clean_covariates.to_frame().T,
-                    times=[1.0]  # 1 year baseline
-                )
-                
-                if len(survival_func_1year) == 0:
-                    return 0.0
-                
-                # 🔧 Enhanced scaling with initial acceleration: S(t) = S(1)^(t^β) where β ≈ 0.7
-                survival_1year = survival_func_1year.iloc[0, 0]
-                beta = self.hyperparams.get('beta', 0.7)  # Dynamic acceleration factor
-                scaling_factor = horizon_years ** beta  # Non-linear scaling for initial acceleration
-                survival_prob = survival_1year ** scaling_factor
-                
-                print(f"  🔍 Transition calc - 1y survival: {survival_1year:.4f}")
-                print(f"  🔍 Transition calc - Scaling factor (t^β): {scaling_factor:.4f}")
-                print(f"  🔍 Transition calc - Scaled survival ({horizon_days}d): {survival_prob:.4f}")
-                
-            else:
-                # For horizons > 1 year, predict directly
-                print(f"  🔍 Transition calc - Long-term: {horizon_years:.2f} years")
-                survival_func = model.predict_survival_function(
-                    clean_covariates.to_frame().T,
-                    times=[horizon_years]
-                )
-                
-                if len(survival_func) == 0:
-                    return 0.0
-                
-                survival_prob = survival_func.iloc[0, 0]
-            
-            print(f"  🔍 Transition calc - Final survival probability: {survival_prob}")
-            
-            # Transition probability = 1 - Survival probability
-            transition_prob = 1 - survival_prob
-            print(f"  🔍 Raw transition probability: {transition_prob}")
-            
-            # 🔧 Default Risk 평평 문제 해결: Cox 모델이 의미 없는 결과를 낼 때 fallback 사용
-            if survival_prob > 0.99 or transition_prob < 1e-4:
-                print(f"  ⚠️ Cox model result too extreme (survival={survival_prob:.6f}, prob={transition_prob:.6f})")
-                print(f"  🔄 Using time-dependent fallback instead...")
-                
-                # Fallback to time-dependent hazard model
-                fallback_hazard = self._calculate_time_dependent_hazard(covariates, horizon_days)
-                fallback_prob = 1.0 - np.exp(-fallback_hazard)
-                
-                print(f"  🔧 Fallback hazard: {fallback_hazard:.6f}")
-                print(f"  🔧 Fallback probability: {fallback_prob:.6f}")
-                
-                clamped_prob = max(0.0, min(1.0, fallback_prob))
-                print(f"  ✅ Final fallback probability: {clamped_prob}")
-                
-                return clamped_prob
-            
-            clamped_prob = max(0.0, min(1.0, transition_prob))
-            print(f"  ✅ Final transition probability: {clamped_prob}")
-            
-            return clamped_prob
-            
-        except Exception as e:
-            print(f"⚠️ Error calculating transition probability: {e}")
-            return 0.0
+        if state == 'WD' and nr_flag == 1:
+            # Apply 20% risk multiplier for WD+NR state
+            risk_adjustment_factor = 1.20
+            return risk_adjustment_factor, f"WD+NR state adjustment (x{risk_adjustment_factor})"
+        
+        elif nr_flag == 1 and consecutive_nr_days >= 30:
+            # Apply graduated risk adjustment for long-term NR
+            days_factor = min(1.5, 1.0 + (consecutive_nr_days - 30) / 365 * 0.5)
+            return days_factor, f"Long-term NR adjustment (x{days_factor:.2f})"
+        
+        return 1.0, "None"
     
-    def score_firm(self, firm: Union[FirmProfile, Dict], horizon: int = 90) -> Dict[str, float]:
-        """
-        Calculate 90-day risk score for a firm
+    def _score_batch(self, firms: List[FirmProfile], horizon: int) -> Dict[str, Any]:
+        """Score firm profiles together (see _score_covariates)"""
         
-        Args:
-            firm: FirmProfile object or dictionary with firm characteristics
-            horizon: Time horizon in days (default: 90)
-            
-        Returns:
-            Dictionary with risk scores for different transition types
+        covariates = [self._firm_to_covariates(firm) for firm in firms]
+        firm_info = {
+            name: [getattr(firm, name) for firm in firms]
+            for name in ('company_name', 'current_rating', 'nr_flag', 'state', 'consecutive_nr_days')
+        }
+        return self._score_covariates(self._stack_covariates(covariates), firm_info, horizon)
+    
+    def _score_covariates(self, raw_df: pd.DataFrame, firm_info: Dict[str, list], horizon: int) -> Dict[str, Any]:
         """
+        Score firms together from one stacked covariate frame
         
-        if not LIFELINES_AVAILABLE:
-            raise ImportError("lifelines and scipy required for risk scoring")
+        Each transition model is queried once for all firms instead of once
+        per firm.
         
-        # Convert dict to FirmProfile if needed
-        if isinstance(firm, dict):
-            firm = FirmProfile(**firm)
+        Args:
+            raw_df: Raw covariates, one row per firm
+            firm_info: Per-firm company_name, current_rating, nr_flag, state, consecutive_nr_days
+            horizon: Time horizon in days
         
-        # Convert firm characteristics to model covariates
-        covariates = self._firm_to_covariates(firm)
+        Returns:
+            Dictionary of per-firm columns (same keys as the score_firm assessment)
+        """
         
-        print(f"📊 Scoring {firm.company_name} (Rating: {firm.current_rating}) for {horizon} days")
-        print(f"  🔍 Available models: {list(self.models.keys())}")
-        print(f"  🔍 Covariates shape: {len(covariates)}")
+        n_firms = len(raw_df)
+        company_names = firm_info['company_name']
+        # 🔧 Convert to years once for all transitions (models trained on annual data)
+        horizon_years = horizon / 365.25
+        cov_df = self._covariates_frame(raw_df)
+        # fallback hazard는 정리 전 원본 값으로 계산 (등급 + 재무 스트레스 비율만 사용)
+        fallback_rows = raw_df[['current_rating', 'debt_to_assets', 'current_ratio', 'roa']].to_dict('records')
+        adjustments = [
+            self._nr_risk_adjustment(nr_flag, state, nr_days)
+            for nr_flag, state, nr_days in zip(firm_info['nr_flag'], firm_info['state'], firm_info['consecutive_nr_days'])
+        ]
         
-        # Debug: Show sample covariate values
-        sample_covariates = dict(list(covariates.items())[:5])
-        print(f"  🔍 Sample covariates: {sample_covariates}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"📊 Scoring {n_firms} firms for {horizon} days "
+                         f"(models: {list(self.models.keys())}, covariates: {cov_df.shape})")
         
         # Calculate risk scores for each transition type
         risk_scores = {}
         cumulative_hazards = {}
         
-        # Process each transition type with enhanced time-dependent modeling
         transition_types = ['upgrade', 'downgrade', 'default']
+        transition_names = self._transition_names()
+        
+        # Cox 전이는 numba 커널 한 번으로 모든 기업 x 전이의 생존확률 계산
+        batch_survival = self._batch_survival(transition_names, cov_df, horizon_years)
         
-        for transition_name in transition_types:
-            # Set current transition type for hazard calculation
-            self._current_transition_type = transition_name
+        for transition_name in transition_names:
+            if transition_name in transition_types:
+                # Set current transition type for hazard calculation
+                self._current_transition_type = transition_name
             
             if transition_name in self.models:
-                model = self.models[transition_name]
-                print(f"  🔍 Using Cox model for {transition_name}")
-                # Calculate cumulative hazard integral
-                cum_hazard = self._calculate_hazard_integral(model, covariates, horizon)
-                # Calculate transition probability
-                trans_prob = self._calculate_transition_probability(model, covariates, horizon)
+                if debug:
+                    logger.debug(f"🔍 Using Cox model for {transition_name}")
+                try:
+                    survival = batch_survival.get(transition_name)
+                    if survival is None:
+                        survival = self._predict_survival(transition_name, self.models[transition_name], cov_df, horizon_years)
+                except (KeyError, ValueError) as e:
+                    # 공변량 누락/형식 오류는 해당 전이만 fallback 처리
+                    logger.warning(f"⚠️ Error predicting {transition_name} survival function, using fallback: {e}")
+                    survival = None
+                cum_hazard, trans_prob = self._survival_to_metrics(survival, fallback_rows, horizon_years)
             else:
-                print(f"  🔍 No Cox model for {transition_name}, using fallback")
+                if debug:
+                    logger.debug(f"🔍 No Cox model for {transition_name}, using fallback")
                 # Fallback to time-dependent model
-                cum_hazard = self._calculate_time_dependent_hazard(covariates, horizon)
-                trans_prob = 1.0 - np.exp(-cum_hazard)  # Convert hazard to probability
-                print(f"  🔍 Fallback conversion: hazard={cum_hazard:.4f} -> prob={trans_prob:.4f}")
-                
-                # Validate the probability
-                if trans_prob < 0 or trans_prob > 1:
-                    print(f"  ⚠️ Invalid probability {trans_prob}, clamping to [0,1]")
-                    trans_prob = max(0.0, min(1.0, trans_prob))
+                cum_hazard = self._fallback_hazards(fallback_rows, horizon_years)
+                trans_prob = np.clip(1.0 - np.exp(-cum_hazard), 0.0, 1.0)  # Convert hazard to probability
             
             cumulative_hazards[transition_name] = cum_hazard
             risk_scores[f'{transition_name}_probability'] = trans_prob
-            
-            print(f"  {transition_name}: Λ={cum_hazard:.4f}, P={trans_prob:.4f}")
-        
-        # Process additional models if they exist
-        for transition_name, model in self.models.items():
-            if transition_name not in transition_types:
-                # Calculate cumulative hazard integral
-                cum_hazard = self._calculate_hazard_integral(model, covariates, horizon)
-                cumulative_hazards[transition_name] = cum_hazard
-                
-                # Calculate transition probability
-                trans_prob = self._calculate_transition_probability(model, covariates, horizon)
-                risk_scores[f'{transition_name}_probability'] = trans_prob
-                
-                print(f"  {transition_name}: Λ={cum_hazard:.4f}, P={trans_prob:.4f}")
         
         # 🔧 Calculate overall rating change probability using independent competing risks
         # Overall Risk = 1 - Π(1-Pᵢ) - assumes transition types are competing, not cumulative
-        
-        # Method 1: Individual transition probabilities (independent events)
-        individual_risks = [prob for key, prob in risk_scores.items() 
-                          if 'probability' in key and 'stable' not in key]
-        
-        # 🔧 극값 확률 경고 및 캘리브레이션
-        for key, prob in risk_scores.items():
-            if 'probability' in key and prob in (0.0, 1.0):
-                transition_name = key.replace('_probability', '')
-                print(f"⚠️ {transition_name} probability extreme ({prob}); check model calibration for {firm.company_name}")
-        
-        # Method 2: Independent competing risks formula = 1 - Π(1-Pᵢ)
-        if individual_risks:
-            # Product of survival probabilities for each transition type
-            survival_product = np.prod([1 - p for p in individual_risks])
-            overall_risk_independent = 1.0 - survival_product
-        else:
-            overall_risk_independent = 0.0
-        
-        # Method 3: Hazard-based (fallback, with capped hazards)
-        total_cumulative_hazard = sum(cumulative_hazards.values())
-        survival_prob = np.exp(-min(total_cumulative_hazard, 2.0))  # Cap at 2.0
-        overall_risk_from_survival = 1.0 - survival_prob
-        
-        # 🔧 Use independent competing risks as primary method
-        change_prob = overall_risk_independent if individual_risks else overall_risk_from_survival
+        probabilities = np.column_stack(list(risk_scores.values()))
+        overall_change_prob = 1.0 - np.prod(1.0 - probabilities, axis=1)
         
         # Ensure probabilities are reasonable (stricter bounds)
-        change_prob = min(0.85, max(0.001, change_prob))  # 0.99 → 0.85
+        overall_change_prob = np.clip(overall_change_prob, 0.001, 0.85)  # 0.99 → 0.85
         
         # Apply WD+NR risk adjustment if applicable
-        overall_change_prob = change_prob  # Use the calculated change probability
-        adjusted_change_prob = overall_change_prob
-        risk_adjustment_factor = 1.0
-        adjustment_reason = "None"
-        
-        if hasattr(firm, 'nr_flag') and hasattr(firm, 'state'):
-            if firm.state == 'WD' and firm.nr_flag == 1:
-                # Apply 20% risk multiplier for WD+NR state
-                risk_adjustment_factor = 1.20
-                adjusted_change_prob = min(1.0, overall_change_prob * risk_adjustment_factor)
-                adjustment_reason = f"WD+NR state adjustment (x{risk_adjustment_factor})"
-                
-                print(f"  ⚠️ WD+NR state detected - applying {risk_adjustment_factor}x risk multiplier")
-                print(f"  📊 Original risk: {overall_change_prob:.4f} → Adjusted: {adjusted_change_prob:.4f}")
-            
-            elif firm.nr_flag == 1 and firm.consecutive_nr_days >= 30:
-                # Apply graduated risk adjustment for long-term NR
-                days_factor = min(1.5, 1.0 + (firm.consecutive_nr_days - 30) / 365 * 0.5)
-                risk_adjustment_factor = days_factor
-                adjusted_change_prob = min(1.0, overall_change_prob * risk_adjustment_factor)
-                adjustment_reason = f"Long-term NR adjustment (x{days_factor:.2f})"
-                
-                print(f"  ⚠️ Long-term NR detected ({firm.consecutive_nr_days} days) - applying {days_factor:.2f}x risk multiplier")
-                print(f"  📊 Original risk: {overall_change_prob:.4f} → Adjusted: {adjusted_change_prob:.4f}")
-        
-        # Create comprehensive risk assessment
-        assessment = {
-            'company_name': firm.company_name,
-            'current_rating': firm.current_rating,
-            'horizon_days': horizon,
+        risk_adjustment_factor = np.array([factor for factor, _ in adjustments])
+        adjusted_change_prob = np.minimum(1.0, overall_change_prob * risk_adjustment_factor)
+        
+        # 🔧 극값 확률 경고 및 캘리브레이션
+        for transition_name in cumulative_hazards:
+            trans_prob = risk_scores[f'{transition_name}_probability']
+            for i in np.flatnonzero((trans_prob == 0.0) | (trans_prob == 1.0)):
+                logger.warning(f"⚠️ {transition_name} probability extreme ({trans_prob[i]}); "
+                               f"check model calibration for {company_names[i]}")
+        
+        if debug:
+            for i in range(n_firms):
+                logger.debug(f"🏢 {company_names[i]} (Rating: {firm_info['current_rating'][i]}): " + ", ".join(
+                    f"{name} Λ={cum_hazard[i]:.4f} P={risk_scores[f'{name}_probability'][i]:.4f}"
+                    for name, cum_hazard in cumulative_hazards.items()
+                ))
+                if risk_adjustment_factor[i] != 1.0:
+                    logger.debug(f"⚠️ {adjustments[i][1]}: {overall_change_prob[i]:.4f} → {adjusted_change_prob[i]:.4f}")
+        
+        no_model = np.zeros(n_firms)
+        
+        # Create comprehensive risk assessment (column-wise)
+        return {
+            'company_name': company_names,
+            'current_rating': firm_info['current_rating'],
+            'horizon_days': [horizon] * n_firms,
             'overall_change_probability': adjusted_change_prob,
             'original_change_probability': overall_change_prob,
             'risk_adjustment_factor': risk_adjustment_factor,
-            'adjustment_reason': adjustment_reason,
-            'upgrade_probability': risk_scores.get('upgrade_probability', 0.0),
-            'downgrade_probability': risk_scores.get('downgrade_probability', 0.0),
-            'default_probability': risk_scores.get('default_probability', 0.0),
-            'withdrawn_probability': risk_scores.get('withdrawn_probability', 0.0),
-            'cumulative_hazards': cumulative_hazards,
-            'risk_classification': self._classify_risk_level(adjusted_change_prob),
-            'nr_flag': getattr(firm, 'nr_flag', 0),
-            'state': getattr(firm, 'state', None),
-            'consecutive_nr_days': getattr(firm, 'consecutive_nr_days', 0)
+            'adjustment_reason': [reason for _, reason in adjustments],
+            'upgrade_probability': risk_scores.get('upgrade_probability', no_model),
+            'downgrade_probability': risk_scores.get('downgrade_probability', no_model),
+            'default_probability': risk_scores.get('default_probability', no_model),
+            'withdrawn_probability': risk_scores.get('withdrawn_probability', no_model),
+            'cumulative_hazards': [
+                {name: cum_hazard[i] for name, cum_hazard in cumulative_hazards.items()}
+                for i in range(n_firms)
+            ],
+            'risk_classification': _classify_risk_levels(adjusted_change_prob),
+            'nr_flag': firm_info['nr_flag'],
+            'state': firm_info['state'],
+            'consecutive_nr_days': firm_info['consecutive_nr_days']
         }
+    
+    def score_firm(self, firm: Union[FirmProfile, Dict], horizon: int = 90) -> Dict[str, float]:
+        """
+        Calculate 90-day risk score for a firm
+        
+        Args:
+            firm: FirmProfile object or dictionary with firm characteristics
+            horizon: Time horizon in days (default: 90)
+            
+        Returns:
+            Dictionary with risk scores for different transition types
+        """
+        
+        if not LIFELINES_AVAILABLE:
+            raise ImportError("lifelines required for risk scoring")
+        
+        # Convert dict to FirmProfile if needed
+        if isinstance(firm, dict):
+            firm = FirmProfile(**firm)
         
-        return assessment
+        # Single firm = 1-row batch
+        columns = self._score_batch([firm], horizon)
+        return {key: values[0] for key, values in columns.items()}
     
     def _classify_risk_level(self, change_prob: float) -> str:
         """Classify risk level based on change probability"""
-        
-        if change_prob >= 0.3:
-            return "HIGH"
-        elif change_prob >= 0.1:
-            return "MEDIUM"
-        elif change_prob >= 0.05:
-            return "LOW"
-        else:
-            return "VERY_LOW"
+        return _classify_risk_levels(np.array([change_prob]))[0]
     
     def score_portfolio(self, firms: List[Union[FirmProfile, Dict]], 
                        horizon: int = 90) -> pd.DataFrame:
@@ -882,18 +978,72 @@ class RatingRiskScorer:
             DataFrame with risk scores for all firms
         """
         
-        results = []
+        if not LIFELINES_AVAILABLE:
+            logger.warning("⚠️ Error scoring firms: lifelines required for risk scoring")
+            return pd.DataFrame()
         
+        profiles = []
         for firm in firms:
             try:
-                score = self.score_firm(firm, horizon)
-                results.append(score)
+                profiles.append(FirmProfile(**firm) if isinstance(firm, dict) else firm)
+            except Exception as e:
+                logger.warning(f"⚠️ Error scoring firm: {e}")
+        
+        if not profiles:
+            return pd.DataFrame()
+        
+        try:
+            return pd.DataFrame(self._score_batch(profiles, horizon))
+        except Exception as e:
+            # 일부 기업의 비정상 값으로 배치가 실패하면 기업별로 다시 계산 (실패한 기업만 제외)
+            logger.warning(f"⚠️ Batch scoring failed ({e}), scoring firms one by one")
+        
+        results = []
+        for firm in profiles:
+            try:
+                results.append(self.score_firm(firm, horizon))
             except Exception as e:
-                print(f"⚠️ Error scoring firm: {e}")
+                logger.warning(f"⚠️ Error scoring firm: {e}")
                 continue
         
         return pd.DataFrame(results)
     
+    def score_dataframe(self, df: pd.DataFrame, horizon: int = 90) -> pd.DataFrame:
+        """
+        Score firms stored column-wise without building FirmProfile objects
+        
+        Args:
+            df: One row per firm, columns named like the FirmProfile fields
+                (current_rating and the core financial ratios are required)
+            horizon: Time horizon in days
+            
+        Returns:
+            DataFrame with risk scores for all firms (same columns as score_portfolio)
+        """
+        
+        if not LIFELINES_AVAILABLE:
+            logger.warning("⚠️ Error scoring firms: lifelines required for risk scoring")
+            return pd.DataFrame()
+        
+        if df.empty:
+            return pd.DataFrame()
+        
+        n_firms = len(df)
+        raw_df = _frame_covariates(df)
+        firm_info = {
+            name: df[name].tolist() if name in df.columns else [default] * n_firms
+            for name, default in (('company_name', None), ('current_rating', None), ('nr_flag', 0),
+                                  ('state', None), ('consecutive_nr_days', 0))
+        }
+        
+        try:
+            return pd.DataFrame(self._score_covariates(raw_df, firm_info, horizon))
+        except Exception as e:
+            # 비정상 값이 섞여 있으면 기업별 경로로 다시 계산 (실패한 기업만 제외)
+            logger.warning(f"⚠️ Column-wise scoring failed ({e}), scoring firms one by one")
+        
+        return self.score_portfolio(FirmProfile.from_frame(df), horizon)
+    
     def create_risk_report(self, firm: Union[FirmProfile, Dict], 
                           horizon: int = 90) -> str:
         """Generate a comprehensive risk report for a firm"""
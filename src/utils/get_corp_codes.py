@@ -12,6 +12,10 @@ Author: Korean Airlines Credit Rating Analysis
 """
 
 import sys
+import logging
+
+logger = logging.getLogger(__name__)
+
 try:
     from config.config import DART_API_KEY, KOREAN_AIRLINES
 except ImportError:
@@ -34,117 +38,134 @@ except ImportError:
 def get_airline_corp_codes():
     """한국 항공사들의 corp_code를 가져오는 함수"""
     
-    print(f"🔑 DART API 키 설정 중...")
+    logger.info(f"🔑 DART API 키 설정 중...")
     set_api_key(DART_API_KEY)
     
-    print("📋 기업 리스트 가져오는 중...")
+    logger.info("📋 기업 리스트 가져오는 중...")
     try:
         corp_list = get_corp_list()
-        print(f"✅ 총 {len(corp_list.corps)}개 기업 정보 로드 완료")
+        logger.info(f"✅ 총 {len(corp_list.corps)}개 기업 정보 로드 완료")
     except Exception as e:
-        print(f"❌ 기업 리스트 가져오기 실패: {e}")
+        logger.error(f"❌ 기업 리스트 가져오기 실패: {e}")
         return None
     
-    # 타겟 주식 코드들
-    target_stock_codes = {info['stock_code'] for info in KOREAN_AIRLINES.values()}
-    print(f"🎯 타겟 주식코드: {target_stock_codes}")
-    
-    # corp_code 매핑
-    mapping = {}
-    for corp in corp_list.corps:
-        if corp.stock_code in target_stock_codes:
-            mapping[corp.stock_code] = {
-                'corp_code': corp.corp_code,
-                'corp_name': corp.corp_name,
-                'modify_date': corp.modify_date
-            }
+    # 타겟 주식 코드 -> 회사명 역매핑
+    stock_to_name = {info['stock_code']: name for name, info in KOREAN_AIRLINES.items()}
+    logger.info(f"🎯 타겟 주식코드: {set(stock_to_name)}")
     
-    print(f"\n📊 매핑 결과:")
-    print("=" * 80)
+    logger.info(f"📊 매핑 결과:")
+    logger.info("=" * 80)
     
-    # 결과 출력 및 검증
+    # corp_code 매핑 (단일 패스, 모두 찾으면 조기 종료)
     airline_mapping = {}
-    for company_name, info in KOREAN_AIRLINES.items():
-        stock_code = info['stock_code']
-        if stock_code in mapping:
-            corp_info = mapping[stock_code]
+    remaining = set(stock_to_name)
+    for corp in corp_list.corps:
+        stock_code = corp.stock_code
+        if stock_code in remaining:
+            company_name = stock_to_name[stock_code]
+            info = KOREAN_AIRLINES[company_name]
             airline_mapping[company_name] = {
                 'stock_code': stock_code,
-                'corp_code': corp_info['corp_code'],
-                'corp_name': corp_info['corp_name'],
+                'corp_code': corp.corp_code,
+                'corp_name': corp.corp_name,
                 'market': info['market'],
                 'status': info['status'],
-                'modify_date': corp_info['modify_date']
-            }
-            
-            print(f"✅ {company_name:10} | {stock_code} | {corp_info['corp_code']} | {corp_info['corp_name']}")
-        else:
-            print(f"❌ {company_name:10} | {stock_code} | NOT FOUND")
-            airline_mapping[company_name] = {
-                'stock_code': stock_code,
-                'corp_code': None,
-                'corp_name': None,
-                'market': info['market'], 
-                'status': info['status'],
-                'modify_date': None
+                'modify_date': corp.modify_date
             }
+            logger.info(f"✅ {company_name:10} | {stock_code} | {corp.corp_code} | {corp.corp_name}")
+            remaining.discard(stock_code)
+            if not remaining:
+                break
     
-    print("=" * 80)
-    print(f"🎉 매핑 완료: {len([k for k, v in airline_mapping.items() if v['corp_code']])}개 성공")
+    # 찾지 못한 회사는 None 필드로 채움
+    for stock_code in remaining:
+        company_name = stock_to_name[stock_code]
+        info = KOREAN_AIRLINES[company_name]
+        logger.warning(f"❌ {company_name:10} | {stock_code} | NOT FOUND")
+        airline_mapping[company_name] = {
+            'stock_code': stock_code,
+            'corp_code': None,
+            'corp_name': None,
+            'market': info['market'], 
+            'status': info['status'],
+            'modify_date': None
+        }
+    
+    # KOREAN_AIRLINES 순서로 정렬
+    airline_mapping = {name: airline_mapping[name] for name in KOREAN_AIRLINES}
+    
+    logger.info("=" * 80)
+    logger.info(f"🎉 매핑 완료: {len([k for k, v in airline_mapping.items() if v['corp_code']])}개 성공")
     
     return airline_mapping
 
+# korean_airlines_corp_codes.py 생성 템플릿 (매핑은 pformat으로 삽입)
+CORP_CODES_TEMPLATE = '''#!/usr/bin/env python3
+"""
+Korean Airlines Corp Codes Mapping
+===================================
+
+DART에서 자동 생성된 corp_code 매핑
+"""
+
+import numpy as np
+
+# Korean Airlines Corp Code Mapping
+KOREAN_AIRLINES_CORP_MAPPING = {mapping}
+
+# 회사명 -> 코드 평탄화 조회 테이블 (import 시 1회 생성)
+_CORP_BY_NAME = {{name: info['corp_code'] for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()}}
+_STOCK_BY_NAME = {{name: info['stock_code'] for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()}}
+
+# 시장/상태별 벡터화 필터링용 구조화 배열 (corp_code 미확인 회사는 빈 문자열)
+KOREAN_AIRLINES_DTYPE = np.dtype([
+    ('name', 'U16'), ('stock_code', 'U6'), ('corp_code', 'U8'), ('market', 'U8'), ('status', 'U10')
+])
+KOREAN_AIRLINES_ARR = np.array(
+    [(name, info['stock_code'] or '', info['corp_code'] or '', info['market'] or '', info['status'] or '')
+     for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()],
+    dtype=KOREAN_AIRLINES_DTYPE,
+)
+
+def get_corp_code(company_name):
+    """회사명으로 corp_code 가져오기"""
+    return _CORP_BY_NAME.get(company_name)
+
+def get_stock_code(company_name):
+    """회사명으로 stock_code 가져오기"""
+    return _STOCK_BY_NAME.get(company_name)
+
+def get_active():
+    """상장 유지(active) 중인 항공사 레코드만 반환"""
+    return KOREAN_AIRLINES_ARR[KOREAN_AIRLINES_ARR['status'] == 'active']
+
+if __name__ == '__main__':
+    print('Korean Airlines Corp Code Mapping:')
+    for name, info in KOREAN_AIRLINES_CORP_MAPPING.items():
+        print(f'{{name}}: {{info["corp_code"]}}')
+'''
+
 def save_corp_mapping(mapping):
     """corp_code 매핑을 파일로 저장"""
     
     import json
+    from pprint import pformat
     
     # JSON 파일로 저장
     with open('korean_airlines_corp_mapping.json', 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, ensure_ascii=False, indent=2, default=str)
+        f.write(json.dumps(mapping, ensure_ascii=False, indent=2, default=str))
     
-    print(f"💾 매핑 결과 저장: korean_airlines_corp_mapping.json")
+    logger.info(f"💾 매핑 결과 저장: korean_airlines_corp_mapping.json")
     
-    # Python 코드 형태로도 저장
+    # Python 코드 형태로도 저장 (repr 기반이라 따옴표가 포함된 값도 안전)
+    source = CORP_CODES_TEMPLATE.format(mapping=pformat(mapping, sort_dicts=False, width=100))
     with open('korean_airlines_corp_codes.py', 'w', encoding='utf-8') as f:
-        f.write("#!/usr/bin/env python3\n")
-        f.write('"""\n')
-        f.write("Korean Airlines Corp Codes Mapping\n")
-        f.write("===================================\n\n")
-        f.write("DART에서 자동 생성된 corp_code 매핑\n")
-        f.write('"""\n\n')
-        
-        f.write("# Korean Airlines Corp Code Mapping\n")
-        f.write("KOREAN_AIRLINES_CORP_MAPPING = {\n")
-        
-        for company_name, info in mapping.items():
-            f.write(f"    '{company_name}': {{\n")
-            for key, value in info.items():
-                if isinstance(value, str):
-                    f.write(f"        '{key}': '{value}',\n")
-                else:
-                    f.write(f"        '{key}': {value},\n")
-            f.write("    },\n")
-        
-        f.write("}\n\n")
-        
-        # 검증 함수 추가
-        f.write("def get_corp_code(company_name):\n")
-        f.write('    """회사명으로 corp_code 가져오기"""\n')
-        f.write("    return KOREAN_AIRLINES_CORP_MAPPING.get(company_name, {}).get('corp_code')\n\n")
-        
-        f.write("def get_stock_code(company_name):\n") 
-        f.write('    """회사명으로 stock_code 가져오기"""\n')
-        f.write("    return KOREAN_AIRLINES_CORP_MAPPING.get(company_name, {}).get('stock_code')\n\n")
-        
-        f.write("if __name__ == '__main__':\n")
-        f.write("    print('Korean Airlines Corp Code Mapping:')\n")
-        f.write("    for name, info in KOREAN_AIRLINES_CORP_MAPPING.items():\n")
-        f.write("        print(f'{name}: {info[\"corp_code\"]}')\n")
-    
-    print(f"💾 Python 코드 저장: korean_airlines_corp_codes.py")
+        f.write(source)
+    
+    logger.info(f"💾 Python 코드 저장: korean_airlines_corp_codes.py")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("🚀 한국 항공사 Corp Code 매핑 시작")
     print("=" * 50)
     
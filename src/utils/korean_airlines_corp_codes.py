@@ -6,6 +6,8 @@ Korean Airlines Corp Codes Mapping
 DART에서 자동 생성된 corp_code 매핑
 """
 
+import numpy as np
+
 # Korean Airlines Corp Code Mapping
 KOREAN_AIRLINES_CORP_MAPPING = {
     '대한항공': {
@@ -50,13 +52,31 @@ KOREAN_AIRLINES_CORP_MAPPING = {
     },
 }
 
+# 회사명 -> 코드 평탄화 조회 테이블 (import 시 1회 생성)
+_CORP_BY_NAME = {name: info['corp_code'] for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()}
+_STOCK_BY_NAME = {name: info['stock_code'] for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()}
+
+# 시장/상태별 벡터화 필터링용 구조화 배열 (corp_code 미확인 회사는 빈 문자열)
+KOREAN_AIRLINES_DTYPE = np.dtype([
+    ('name', 'U16'), ('stock_code', 'U6'), ('corp_code', 'U8'), ('market', 'U8'), ('status', 'U10')
+])
+KOREAN_AIRLINES_ARR = np.array(
+    [(name, info['stock_code'] or '', info['corp_code'] or '', info['market'] or '', info['status'] or '')
+     for name, info in KOREAN_AIRLINES_CORP_MAPPING.items()],
+    dtype=KOREAN_AIRLINES_DTYPE,
+)
+
 def get_corp_code(company_name):
     """회사명으로 corp_code 가져오기"""
-    return KOREAN_AIRLINES_CORP_MAPPING.get(company_name, {}).get('corp_code')
+    return _CORP_BY_NAME.get(company_name)
 
 def get_stock_code(company_name):
     """회사명으로 stock_code 가져오기"""
-    return KOREAN_AIRLINES_CORP_MAPPING.get(company_name, {}).get('stock_code')
+    return _STOCK_BY_NAME.get(company_name)
+
+def get_active():
+    """상장 유지(active) 중인 항공사 레코드만 반환"""
+    return KOREAN_AIRLINES_ARR[KOREAN_AIRLINES_ARR['status'] == 'active']
 
 if __name__ == '__main__':
     print('Korean Airlines Corp Code Mapping:')
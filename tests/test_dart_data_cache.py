@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DARTDataCache
+
+This module tests:
+1. Financial statement dict round trip through the parquet cache
+2. Mixed-type keys/values are restored with their original types
+3. Payloads that cannot round-trip fall back to pickle
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+import shutil
+import tempfile
+import logging
+
+# Add src/data directory to path (패키지 __init__의 dart-fss 의존성 회피)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'data'))
+
+from dart_data_cache import DARTDataCache, PARQUET_AVAILABLE
+
+
+@unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow not installed")
+class TestStatementRoundTrip(unittest.TestCase):
+    """Test that a cache hit returns the same data as the miss path"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = DARTDataCache(cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _round_trip(self, data):
+        self.assertTrue(self.cache.cache_data('00113526', 2023, 4, data))
+        return self.cache.get_cached_data('00113526', 2023, 4)
+
+    def test_numeric_statement(self):
+        data = {
+            'bs_data': {'자산총계': 1000.0, '부채총계': np.float64(600.5)},
+            'is_data': {'매출액': 800, '영업이익': 80},
+            'company': '대한항공',
+        }
+        cached = self._round_trip(data)
+        self.assertEqual(cached, data)
+        self.assertIs(type(cached['is_data']['매출액']), int)
+        self.assertEqual(self.cache.metadata['entries'][next(iter(self.cache.metadata['entries']))]['file_format'],
+                         'parquet_dir')
+
+    def test_mixed_type_statement_keeps_types(self):
+        """정수 키, 문자열/숫자/None 혼합 값도 원래 타입으로 복원"""
+        data = {
+            'bs_data': {'자산총계': 1000, '단위': '백만원', 2023: 1.5, '비고': None, '연결': True},
+            'cf_data': {},
+            'year': 2023,
+        }
+        cached = self._round_trip(data)
+        self.assertEqual(cached, data)
+        self.assertIn(2023, cached['bs_data'])
+        self.assertIs(type(cached['bs_data']['자산총계']), int)
+        self.assertIs(cached['bs_data']['연결'], True)
+
+    def test_non_json_values_fall_back_to_pickle(self):
+        data = {'bs_data': {'자산총계': (1, 2)}, 'collected_at': pd.Timestamp('2024-01-01')}
+        cached = self._round_trip(data)
+        self.assertEqual(cached, data)
+        entry = next(iter(self.cache.metadata['entries'].values()))
+        self.assertEqual(entry['file_format'], 'pkl')
+
+
+if __name__ == '__main__':
+    unittest.main()
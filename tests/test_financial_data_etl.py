@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for FinancialDataETL OFS preference
+
+This module tests:
+1. Only periods where CFS was empty and OFS was found are recorded
+2. Recorded periods start with OFS on the next run, other periods stay CFS-first
+3. Invalidating a period's cache clears its record
+"""
+
+import unittest
+import pandas as pd
+import sys
+import os
+import glob
+import shutil
+import tempfile
+import threading
+import logging
+
+# Add src/data directory to path (패키지 __init__의 dart-fss 의존성 회피)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'data'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utils'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'config'))
+
+from financial_data_etl import FinancialDataETL
+
+CORP_CODE = '00113526'
+PERIODS = ['202201', '202202', '202203', '202204']
+
+
+def _statement():
+    return pd.DataFrame({'account_nm': ['자산총계'], 'thstrm_amount': [1000.0]})
+
+
+class TestPreferOfsPeriods(unittest.TestCase):
+    """Test the prefer_ofs.json transitions of FinancialDataETL"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.data_dir = tempfile.mkdtemp()
+        self.cfs_periods = set(PERIODS)
+        self.calls = []
+
+        # dart-fss 없이 구성하기 위해 __init__ 대신 필요한 속성만 설정
+        etl = FinancialDataETL.__new__(FinancialDataETL)
+        etl.data_dir = self.data_dir
+        etl.cache_dir = os.path.join(self.data_dir, 'cache')
+        os.makedirs(etl.cache_dir)
+        etl.periods = PERIODS
+        etl.period_windows = {period: (period, period, 'quarter') for period in PERIODS}
+        etl.max_workers = 4
+        etl._rate_limiter = threading.Semaphore(4)
+        etl.prefer_ofs_path = os.path.join(self.data_dir, 'prefer_ofs.json')
+        etl._prefer_ofs = set()
+        etl._prefer_ofs_lock = threading.Lock()
+        etl._extract_statement = self._fake_extract
+        self.etl = etl
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def _fake_extract(self, corp_code, bgn_date, end_date, report_type, separate):
+        """OFS는 항상 제공, CFS는 cfs_periods에 있는 분기만 제공"""
+        self.calls.append((bgn_date, separate))
+        if separate or bgn_date in self.cfs_periods:
+            return _statement()
+        return pd.DataFrame()
+
+    def _collect(self):
+        # 분기 캐시 파일만 지워 매 수집마다 DART 호출 경로를 다시 타도록 함
+        for cache_path in glob.glob(os.path.join(self.etl.cache_dir, '*.parquet')):
+            os.remove(cache_path)
+        self.calls.clear()
+        return self.etl.extract_financial_statements(CORP_CODE, '테스트항공')
+
+    def _first_calls(self):
+        """분기별 첫 호출의 separate 값"""
+        first = {}
+        for period, separate in self.calls:
+            first.setdefault(period, separate)
+        return first
+
+    def test_cfs_company_is_not_recorded(self):
+        result = self._collect()
+        self.assertEqual(self.etl._prefer_ofs, set())
+        self.assertFalse(os.path.exists(self.etl.prefer_ofs_path))
+        self.assertNotIn('fs_div', result.columns)
+
+    def test_only_ofs_periods_are_recorded(self):
+        self.cfs_periods = {'202203', '202204'}
+        self._collect()
+        expected = {f"{CORP_CODE}_202201", f"{CORP_CODE}_202202"}
+        self.assertEqual(self.etl._prefer_ofs, expected)
+        self.assertEqual(self.etl._load_prefer_ofs(), expected)
+
+        # 다음 수집: 기록된 분기만 OFS부터, 나머지는 CFS부터 조회
+        self._collect()
+        self.assertEqual(self._first_calls(),
+                         {'202201': True, '202202': True, '202203': False, '202204': False})
+        self.assertEqual(len(self.calls), len(PERIODS))
+
+    def test_result_does_not_depend_on_worker_count(self):
+        self.cfs_periods = {'202202', '202204'}
+        self._collect()
+        parallel = set(self.etl._prefer_ofs)
+
+        self.etl._prefer_ofs = set()
+        self.etl.max_workers = 1
+        self._collect()
+        self.assertEqual(self.etl._prefer_ofs, parallel)
+
+    def test_invalidate_period_clears_record(self):
+        self.cfs_periods = set()
+        self._collect()
+        self.assertEqual(len(self.etl._prefer_ofs), len(PERIODS))
+
+        # 202204 분기에 CFS가 제출된 뒤 캐시를 지우면 CFS로 다시 수집
+        self.cfs_periods = {'202204'}
+        self.etl.invalidate_period_cache('202204')
+        self.assertNotIn(f"{CORP_CODE}_202204", self.etl._load_prefer_ofs())
+
+        result = self._collect()
+        self.assertFalse(self._first_calls()['202204'])
+        self.assertNotIn(f"{CORP_CODE}_202204", self.etl._prefer_ofs)
+        last = result[result['period'] == '202204']
+        self.assertTrue(last['fs_div'].isna().all())
+
+    def test_legacy_corp_entries_are_ignored(self):
+        with open(self.etl.prefer_ofs_path, 'w', encoding='utf-8') as f:
+            f.write(f'["{CORP_CODE}", "{CORP_CODE}_202201"]')
+        self.assertEqual(self.etl._load_prefer_ofs(), {f"{CORP_CODE}_202201"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Unit tests for FinancialRatioCalculator
+
+This module tests:
+1. Vectorized batch ratio computation (NaN for non-computable ratios)
+2. Dict API fallback to airline industry defaults
+3. Account label lookup and numeric coercion
+4. Aho-Corasick and regex label scans pick the same candidate rows
+5. Per-statement show() caching and parallel batch processing
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src/data directory to path (패키지 __init__의 dart-fss 의존성 회피)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'data'))
+
+from financial_ratio_calculator import (
+    FinancialRatioCalculator, BS, IS, CF, COMPUTED_RATIOS, RATIO_DTYPE, pack_items,
+    AHOCORASICK_AVAILABLE, _SCAN_NAMES, _build_scan_automata
+)
+
+
+class TestBatchRatioCalculation(unittest.TestCase):
+    """Test vectorized ratio computation over packed item arrays"""
+
+    def setUp(self):
+        self.calc = FinancialRatioCalculator()
+
+    def test_batch_matches_scalar_formulas(self):
+        """각 행의 비율이 스칼라 공식과 일치하는지 확인"""
+        bs = np.full((2, len(BS)), np.nan)
+        is_ = np.full((2, len(IS)), np.nan)
+        cf = np.full((2, len(CF)), np.nan)
+
+        bs[0, [BS.TOTAL_ASSETS, BS.TOTAL_LIABILITIES, BS.TOTAL_EQUITY]] = [1000.0, 600.0, 400.0]
+        bs[0, [BS.CURRENT_ASSETS, BS.CURRENT_LIABILITIES, BS.CASH_AND_EQUIVALENTS]] = [300.0, 200.0, 50.0]
+        is_[0, [IS.REVENUE, IS.OPERATING_PROFIT, IS.NET_INCOME, IS.INTEREST_EXPENSE]] = [800.0, 80.0, 20.0, 10.0]
+
+        # 두 번째 행: 총자산 0, 이자비용 음수 -> 계산 불가
+        bs[1, BS.TOTAL_ASSETS] = 0.0
+        is_[1, [IS.OPERATING_PROFIT, IS.INTEREST_EXPENSE]] = [10.0, -5.0]
+
+        ratios = self.calc.calculate_financial_ratios_batch(bs, is_, cf)
+        self.assertEqual(ratios.shape, (2, len(COMPUTED_RATIOS)))
+
+        row = dict(zip(COMPUTED_RATIOS, ratios[0]))
+        self.assertAlmostEqual(row['debt_to_assets'], 0.6)
+        self.assertAlmostEqual(row['current_ratio'], 1.5)
+        self.assertAlmostEqual(row['roe'], 0.05)
+        self.assertAlmostEqual(row['interest_coverage'], 8.0)
+        self.assertAlmostEqual(row['quick_ratio'], 0.25)
+        self.assertAlmostEqual(row['working_capital_ratio'], 0.1)
+
+        self.assertTrue(np.isnan(ratios[1]).all())
+
+    def test_batch_all_nan_input(self):
+        """입력이 전부 NaN이면 계산 없이 NaN 배열 반환 (커널 결과와 동일한 형태)"""
+        bs = np.full((3, len(BS)), np.nan)
+        is_ = np.full((3, len(IS)), np.nan)
+        cf = np.zeros((3, len(CF)))
+
+        ratios = self.calc.calculate_financial_ratios_batch(bs, is_, cf)
+        self.assertEqual(ratios.shape, (3, len(COMPUTED_RATIOS)))
+        self.assertTrue(np.isnan(ratios).all())
+
+    def test_dict_api_uses_defaults_for_missing_items(self):
+        """계산 불가 비율은 항공업계 기본값으로 대체"""
+        bs_items = {'total_assets': 1000.0, 'total_liabilities': 700.0}
+        ratios = self.calc.calculate_financial_ratios(bs_items, {}, {})
+
+        self.assertAlmostEqual(ratios['debt_to_assets'], 0.7)
+        self.assertEqual(ratios['roa'], 0.02)
+        self.assertEqual(ratios['interest_coverage'], 3.0)
+        self.assertEqual(len(ratios), 20)
+
+    def test_pack_items_fixed_order(self):
+        """pack_items는 IntEnum 열 순서를 따르고 누락값은 NaN"""
+        packed = pack_items({'revenue': 5.0, 'net_income': 1.0}, IS)
+        self.assertEqual(packed[IS.REVENUE], 5.0)
+        self.assertEqual(packed[IS.NET_INCOME], 1.0)
+        self.assertTrue(np.isnan(packed[IS.EBIT]))
+
+
+class TestAccountValueLookup(unittest.TestCase):
+    """Test label index lookup and column-wide numeric coercion"""
+
+    def setUp(self):
+        self.calc = FinancialRatioCalculator()
+        self.df = pd.DataFrame({
+            'label_ko': ['자산 총계', '부채총계', '유동부채 합계', '자본총계'],
+            'value': ['1,000', '(400)', 'N/A', '1.2e3'],
+        })
+
+    def test_whitespace_insensitive_exact_match(self):
+        self.assertEqual(self.calc._find_account_value(self.df, ['자산총계'], 'value'), 1000.0)
+
+    def test_parenthesized_negative_and_exponent(self):
+        self.assertEqual(self.calc._find_account_value(self.df, ['부채총계'], 'value'), -400.0)
+        self.assertEqual(self.calc._find_account_value(self.df, ['자본총계'], 'value'), 1200.0)
+
+    def test_unparseable_value_returns_none(self):
+        self.assertIsNone(self.calc._find_account_value(self.df, ['유동부채'], 'value'))
+
+    def test_partial_match_uses_first_matching_row_only(self):
+        """부분 매칭은 첫 번째 포함 행만 사용 (뒤쪽 행의 유효값으로 넘어가지 않음)"""
+        df = pd.DataFrame({
+            'label_ko': ['유동부채 합계', '유동부채성 충당부채', '부채총계'],
+            'value': ['N/A', '500', '(400)'],
+        })
+        self.assertIsNone(self.calc._find_account_value(df, ['유동부채'], 'value'))
+        self.assertIsNone(self.calc._find_account_value_enhanced(df, ['유동부채'], 'value'))
+        # 첫 후보명이 실패하면 다음 후보명으로 진행
+        self.assertEqual(self.calc._find_account_value(df, ['유동부채', '총계'], 'value'), -400.0)
+
+
+class _FakeAutomaton:
+    """pyahocorasick.Automaton stand-in (add_word/make_automaton/iter만 구현, 전수 탐색)"""
+
+    def __init__(self):
+        self.words = {}
+
+    def add_word(self, word, value):
+        self.words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, haystack):
+        for word, value in self.words.items():
+            start = haystack.find(word)
+            while start != -1:
+                yield start + len(word) - 1, value
+                start = haystack.find(word, start + 1)
+
+
+class TestLabelScan(unittest.TestCase):
+    """Test that the automaton branch of _scan_labels matches the regex fallback"""
+
+    def setUp(self):
+        self.calc = FinancialRatioCalculator()
+        # 후보명 그대로 + 접두/접미어가 붙은 계정명 + 겹치는 후보명을 포함하는 계정명 + 무관한 계정명
+        labels = []
+        for names in _SCAN_NAMES.values():
+            for name in names:
+                labels.extend([name, f"기타{name}", f"{name}합계"])
+        labels.extend(['유동자산및비유동자산', '영업이익(손실)', '이연법인세', '기타포괄손익누계액'])
+        self.label_index = {label: row_idx for row_idx, label in enumerate(dict.fromkeys(labels))}
+
+    def _assert_same_scan(self, automata):
+        for scan_key in _SCAN_NAMES:
+            self.calc._automata = {}
+            expected = self.calc._scan_labels(self.label_index, scan_key)
+            self.calc._automata = automata
+            actual = self.calc._scan_labels(self.label_index, scan_key)
+            self.assertEqual(actual, expected, scan_key)
+            self.assertTrue(expected)
+
+    def test_fake_automaton_matches_regex(self):
+        self._assert_same_scan(_build_scan_automata(_FakeAutomaton))
+
+    @unittest.skipUnless(AHOCORASICK_AVAILABLE, "pyahocorasick not installed")
+    def test_ahocorasick_matches_regex(self):
+        import ahocorasick
+        self._assert_same_scan(_build_scan_automata(ahocorasick.Automaton))
+
+
+class _CountingStatement:
+    """FinancialStatement stand-in that counts show() calls"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def show(self, statement_type):
+        self.calls.append(statement_type)
+        return self.frames.get(statement_type)
+
+
+class TestShowCache(unittest.TestCase):
+    """Test that show() is reconstructed once per statement type"""
+
+    def setUp(self):
+        self.calc = FinancialRatioCalculator()
+        bs = pd.DataFrame({
+            'concept_id': ['a', 'b'],
+            'label_ko': ['자산총계', '부채총계'],
+            '2023': ['1,000', '600'],
+        })
+        self.fs = _CountingStatement({'bs': bs})
+
+    def test_repeated_extraction_hits_cache(self):
+        first = self.calc.extract_financial_items(self.fs, 'bs')
+        second = self.calc.extract_financial_items(self.fs, 'bs')
+        self.assertEqual(first, second)
+        self.assertEqual(self.fs.calls, ['bs'])
+
+    def test_cache_cleared_after_company(self):
+        self.calc.process_company_financial_data(self.fs)
+        self.assertEqual(self.fs.calls.count('bs'), 1)
+        self.assertEqual(self.calc._show_cache, {})
+
+    def test_process_many_preserves_order(self):
+        statements = []
+        for total_assets in ('1,000', '2,000', '4,000'):
+            bs = pd.DataFrame({
+                'concept_id': ['a', 'b'],
+                'label_ko': ['자산총계', '부채총계'],
+                '2023': [total_assets, '600'],
+            })
+            statements.append(_CountingStatement({'bs': bs}))
+
+        results = self.calc.process_many(statements, max_workers=3)
+
+        self.assertEqual([r['debt_to_assets'] for r in results], [0.6, 0.3, 0.15])
+        self.assertTrue(all(fs.calls.count('bs') == 1 for fs in statements))
+
+        records = self.calc.process_many(statements, as_records=True)
+        self.assertEqual(records.dtype, RATIO_DTYPE)
+        np.testing.assert_allclose(records['debt_to_assets'], [0.6, 0.3, 0.15])
+
+
+if __name__ == '__main__':
+    unittest.main()
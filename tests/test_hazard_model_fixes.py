@@ -274,5 +274,29 @@ class TestOverallRiskCalculation(unittest.TestCase):
                           "Higher cumulative hazards should produce higher overall risk")
 
 
+
+class TestConsecutiveNRRule(unittest.TestCase):
+    """Test consecutive NR day counting per company"""
+    
+    def test_consecutive_nr_days_reset_per_company(self):
+        """Counts must reset on rated rows and on company boundaries, even when rows are interleaved"""
+        df = pd.DataFrame({
+            'company': ['A', 'B', 'A', 'B', 'A', 'B', 'A'],
+            'date': pd.date_range('2024-01-31', periods=7, freq='ME'),
+            'rating': [None, None, None, 'BBB', 'A', None, None],
+            'event': ['', 'Withdrawn', '', '', '', 'Withdrawn', 'Withdrawn'],
+        })
+        
+        preprocessor = CreditRatingPreprocessor.__new__(CreditRatingPreprocessor)
+        preprocessor.config = type('Config', (), {'consecutive_nr_days': 2})()
+        result = preprocessor._apply_consecutive_nr_rule(df)
+        
+        # A: NR, NR, A, NR -> 1, 2, 0, 1 / B: NR, BBB, NR -> 1, 0, 1
+        self.assertEqual(result['consecutive_nr_days'].tolist(), [1, 1, 2, 0, 0, 1, 1])
+        
+        # Withdrawn events below the 2-day threshold are cleared
+        self.assertEqual((result['event'] == 'Withdrawn').sum(), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DARTScraper request handling
+
+This module tests:
+1. The aiohttp path (_fetch_fs) parses a response into the ratio account frame
+2. Retried requests take a _DART_BUCKET token on every attempt (sync and async)
+3. Non-retryable errors and exhausted retries return None
+"""
+
+import unittest
+import asyncio
+import json
+import sys
+import os
+import shutil
+import tempfile
+import logging
+from unittest import mock
+
+# Add src/data directory to path (패키지 __init__의 dart-fss 의존성 회피)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'data'))
+
+import korean_airlines_data_pipeline as pipeline
+from korean_airlines_data_pipeline import DARTScraper
+
+CORP_CODE = '00113526'
+
+FS_PAYLOAD = {
+    'status': '000',
+    'list': [
+        {'account_nm': '자산총계', 'thstrm_amount': '1000', 'ord': '1'},
+        {'account_nm': '부채총계', 'thstrm_amount': '600', 'ord': '2'},
+        {'account_nm': '기타포괄손익', 'thstrm_amount': '5', 'ord': '3'},
+    ],
+}
+
+
+class _CountingBucket:
+    """_DART_BUCKET stand-in that counts acquired tokens"""
+
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeAsyncResponse:
+    """aiohttp.ClientResponse stand-in"""
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self, loads=json.loads, content_type='application/json'):
+        return loads(json.dumps(self.payload))
+
+
+class _FakeAsyncSession:
+    """aiohttp.ClientSession stand-in returning queued (status, payload) responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append((url, params))
+        return _FakeAsyncResponse(*self.responses.pop(0))
+
+
+class _FakeResponse:
+    """requests.Response stand-in"""
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    """requests.Session stand-in returning queued (status, payload) responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append((url, params))
+        return _FakeResponse(*self.responses.pop(0))
+
+
+class TestDARTRequests(unittest.TestCase):
+    """Test DART fetches against mocked sessions"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.cache_dir = tempfile.mkdtemp()
+        self.bucket = _CountingBucket()
+        patchers = [
+            mock.patch.object(pipeline, '_DART_BUCKET', self.bucket),
+            mock.patch.object(pipeline, '_RETRY_BACKOFF', 0),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _scraper(self, session=None):
+        return DARTScraper('test-key', session=session or _FakeSession([]), cache_dir=self.cache_dir)
+
+    def _fetch_async(self, responses):
+        session = _FakeAsyncSession(responses)
+        df = asyncio.run(self._scraper()._fetch_fs(session, CORP_CODE, 2020, 4))
+        return df, session
+
+    def test_fetch_fs_parses_ratio_accounts(self):
+        df, session = self._fetch_async([(200, FS_PAYLOAD)])
+
+        self.assertEqual(list(df.columns), ['account_nm', 'thstrm_amount'])
+        self.assertEqual(list(df['account_nm']), ['자산총계', '부채총계'])
+        url, params = session.requests[0]
+        self.assertTrue(url.endswith('/fnlttSinglAcntAll.json'))
+        self.assertEqual(params['reprt_code'], '11011')
+        self.assertEqual(params['corp_code'], CORP_CODE)
+        self.assertEqual(self.bucket.acquired, 1)
+
+    def test_fetch_fs_retry_takes_a_token_per_attempt(self):
+        df, session = self._fetch_async([(503, {}), (429, {}), (200, FS_PAYLOAD)])
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(len(session.requests), 3)
+        self.assertEqual(self.bucket.acquired, 3)
+
+    def test_fetch_fs_gives_up_after_max_retries(self):
+        df, session = self._fetch_async([(500, {})] * (pipeline._MAX_RETRIES + 1))
+
+        self.assertIsNone(df)
+        self.assertEqual(self.bucket.acquired, pipeline._MAX_RETRIES + 1)
+
+    def test_fetch_fs_does_not_retry_client_errors(self):
+        df, session = self._fetch_async([(404, {}), (200, FS_PAYLOAD)])
+
+        self.assertIsNone(df)
+        self.assertEqual(len(session.requests), 1)
+
+    def test_fetch_fs_api_error_status(self):
+        df, _ = self._fetch_async([(200, {'status': '013', 'message': '조회된 데이타가 없습니다.'})])
+        self.assertIsNone(df)
+
+    def test_sync_retry_takes_a_token_per_attempt(self):
+        session = _FakeSession([(502, {}), (200, FS_PAYLOAD)])
+        df = self._scraper(session).get_financial_statements(CORP_CODE, 2020, 4)
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(len(session.requests), 2)
+        self.assertEqual(self.bucket.acquired, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()